@@ -179,6 +179,21 @@ db_restart() {
     db_start
 }
 
+db_migrate() {
+    log "Applying database migrations..."
+    cd "$SCRIPT_DIR" && run_in_env alembic upgrade "${1:-head}"
+    success "Database migrations applied"
+}
+
+db_revision() {
+    if [ -z "$1" ]; then
+        error "A revision message is required"
+        exit 1
+    fi
+    log "Generating database migration: $1"
+    cd "$SCRIPT_DIR" && run_in_env alembic revision --autogenerate -m "$1"
+}
+
 db_shell() {
     log "Connecting to PostgreSQL shell..."
     run_in_env python -c "
@@ -220,6 +235,8 @@ usage() {
     echo "  db-stop           Stop PostgreSQL container"
     echo "  db-restart        Restart PostgreSQL container"
     echo "  db-shell          Connect to PostgreSQL shell"
+    echo "  db-migrate [rev]  Apply Alembic migrations (default: head)"
+    echo "  db-revision <msg> Autogenerate a new Alembic migration"
     echo ""
     echo "API Commands:"
     echo "  api-test [args]    Run API tests (with optional pytest args)"
@@ -271,6 +288,14 @@ case "${1:-}" in
     db-shell)
         db_shell
         ;;
+    db-migrate)
+        shift
+        db_migrate "$@"
+        ;;
+    db-revision)
+        shift
+        db_revision "$@"
+        ;;
     api-test)
         shift
         api_test "$@"
@@ -7,15 +7,13 @@ import os
 # Add parent directories to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
-from src.database.connection import init_database
-from .routes import instructors, courses, locations, ratings, sessions, assignments, auth
+from .routes import instructors, courses, locations, ratings, sessions, assignments, auth, search, reports, exports, imports, calendar
 from .middleware.error_handler import add_error_handlers
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup - only init database if not in test mode
-    if not os.getenv("TESTING"):
-        init_database()
+    # Startup - the schema is managed by Alembic (./manage.sh db-migrate), so
+    # workers neither create nor reflect tables when they boot
     yield
     # Shutdown
     pass
@@ -47,6 +45,11 @@ app.include_router(locations.router, prefix="/api/v1/locations", tags=["location
 app.include_router(ratings.router, prefix="/api/v1/ratings", tags=["ratings"])
 app.include_router(sessions.router, prefix="/api/v1/sessions", tags=["sessions"])
 app.include_router(assignments.router, prefix="/api/v1/assignments", tags=["assignments"])
+app.include_router(search.router, prefix="/api/v1/search", tags=["search"])
+app.include_router(reports.router, prefix="/api/v1/reports", tags=["reports"])
+app.include_router(exports.router, prefix="/api/v1/exports", tags=["exports"])
+app.include_router(imports.router, prefix="/api/v1/imports", tags=["imports"])
+app.include_router(calendar.router, prefix="/api/v1/calendar", tags=["calendar"])
 
 @app.get("/")
 async def root():
@@ -1,79 +1,71 @@
-from typing import List
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import date
 import sys
 import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
 
-from src.database.connection import get_db_session
-from src.database.repository import AssignmentRepository, InstructorRepository
-from src.database.models import AssignmentStatus, CourseSessionDay, SessionType
-from src.database.utils import (
-    check_instructor_availability,
-    get_instructor_conflicts
+from src.database.connection import get_async_db_session
+from src.database.async_repository import (
+    AsyncAssignmentRepository, AsyncInstructorRepository, AsyncCourseSessionDayRepository
 )
+from src.database.models import AssignmentStatus, SessionType
+from src.database.conflicts import (
+    InstructorConflictError, find_instructor_conflicts, find_instructor_conflicts_batch
+)
+from src.database.solver import ProposedAssignment, PlanConflictError, propose_schedule, commit_plan
 from ..schemas.assignment import (
     InstructorAssignmentCreate, InstructorAssignmentUpdate, 
-    InstructorAssignmentResponse, BulkAssignmentCreate,
-    AssignmentConflictCheck, AssignmentStatus as APIAssignmentStatus
+    InstructorAssignmentResponse, InstructorAssignmentPage, BulkAssignmentCreate,
+    AssignmentConflictCheck, BulkAssignmentConflictCheck,
+    SchedulePlanRequest, SchedulePlanResponse, SchedulePlanCommit,
+    AssignmentStatus as APIAssignmentStatus
 )
 
 router = APIRouter()
 
-def get_assignment_repo(db: Session = Depends(get_db_session)) -> AssignmentRepository:
-    return AssignmentRepository(db)
+def get_assignment_repo(db: AsyncSession = Depends(get_async_db_session)) -> AsyncAssignmentRepository:
+    return AsyncAssignmentRepository(db)
 
 @router.post("/", response_model=InstructorAssignmentResponse, status_code=201)
 async def create_assignment(
     assignment: InstructorAssignmentCreate,
-    repo: AssignmentRepository = Depends(get_assignment_repo),
-    db: Session = Depends(get_db_session)
+    repo: AsyncAssignmentRepository = Depends(get_assignment_repo),
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """Create a new instructor assignment."""
     
     # Verify instructor exists
-    instructor_repo = InstructorRepository(db)
-    instructor = instructor_repo.get_by_id(assignment.instructor_id)
+    instructor_repo = AsyncInstructorRepository(db)
+    instructor = await instructor_repo.get_by_id(assignment.instructor_id)
     if not instructor:
         raise HTTPException(status_code=404, detail="Instructor not found")
     
     # Verify session day exists
-    session_day = db.query(CourseSessionDay).filter(
-        CourseSessionDay.id == assignment.session_day_id
-    ).first()
+    session_day = await AsyncCourseSessionDayRepository(db).get_by_id(assignment.session_day_id)
     if not session_day:
         raise HTTPException(status_code=404, detail="Session day not found")
     
-    # Check for conflicts
-    is_available = check_instructor_availability(
-        db, assignment.instructor_id, session_day.date,
-        session_day.start_time, session_day.end_time
-    )
-    
-    if not is_available:
-        conflicts = get_instructor_conflicts(
-            db, assignment.instructor_id, session_day.date,
-            session_day.start_time, session_day.end_time
-        )
-        raise HTTPException(
-            status_code=409, 
-            detail=f"Instructor has {len(conflicts)} conflicting assignments on this date"
-        )
-    
-    
+    # Double bookings are rejected by the database when the row is inserted
     try:
         # Convert API enum to database enum
         assignment_type = SessionType(assignment.assignment_type.value)
         
-        db_assignment = repo.create_assignment(
+        db_assignment = await repo.create_assignment(
             session_day_id=assignment.session_day_id,
             instructor_id=assignment.instructor_id,
             assignment_type=assignment_type,
             notes=assignment.notes
         )
         return db_assignment
+    except InstructorConflictError as e:
+        conflicts = e.conflicts.get(session_day.id, [])
+        raise HTTPException(
+            status_code=409, 
+            detail=f"Instructor has {len(conflicts)} conflicting assignments on this date"
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -85,32 +77,42 @@ async def list_assignments(
     date_to: date = Query(None, description="Filter assignments to this date"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
-    repo: AssignmentRepository = Depends(get_assignment_repo)
+    repo: AsyncAssignmentRepository = Depends(get_assignment_repo)
 ):
     """List all assignments with optional filtering."""
-    if instructor_id:
-        assignments = repo.get_instructor_assignments(instructor_id)
-    elif date_from and date_to:
-        assignments = repo.get_assignments_by_date_range(date_from, date_to)
-    else:
-        # Get all assignments - you'd need to implement this method
-        assignments = []  # Placeholder
-    
-    # Filter by status if provided
-    if status:
-        db_status = AssignmentStatus(status.value)
-        assignments = [a for a in assignments if a.assignment_status == db_status]
-    
-    # Apply pagination
-    return assignments[skip:skip + limit]
+    # Convert API enum to database enum
+    db_status = AssignmentStatus(status.value) if status else None
+    page = await repo.get_page(
+        offset=skip, limit=limit, instructor_id=instructor_id,
+        status=db_status, date_from=date_from, date_to=date_to
+    )
+    return page.items
+
+@router.get("/scroll", response_model=InstructorAssignmentPage)
+async def scroll_assignments(
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+    instructor_id: int = Query(None, description="Filter by instructor ID"),
+    status: APIAssignmentStatus = Query(None, description="Filter by assignment status"),
+    date_from: date = Query(None, description="Filter assignments from this date"),
+    date_to: date = Query(None, description="Filter assignments to this date"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    repo: AsyncAssignmentRepository = Depends(get_assignment_repo)
+):
+    """Page through assignments in creation order using an opaque cursor."""
+    db_status = AssignmentStatus(status.value) if status else None
+    page = await repo.get_page_after(
+        cursor=cursor, limit=limit, instructor_id=instructor_id,
+        status=db_status, date_from=date_from, date_to=date_to
+    )
+    return {"items": page.items, "next_cursor": page.next_cursor}
 
 @router.get("/{assignment_id}", response_model=InstructorAssignmentResponse)
 async def get_assignment(
     assignment_id: int,
-    repo: AssignmentRepository = Depends(get_assignment_repo)
+    repo: AsyncAssignmentRepository = Depends(get_assignment_repo)
 ):
     """Get a specific assignment by ID."""
-    assignment = repo.get_by_id(assignment_id)
+    assignment = await repo.get_by_id(assignment_id)
     if not assignment:
         raise HTTPException(status_code=404, detail="Assignment not found")
     return assignment
@@ -119,12 +121,11 @@ async def get_assignment(
 async def update_assignment(
     assignment_id: int,
     assignment_update: InstructorAssignmentUpdate,
-    repo: AssignmentRepository = Depends(get_assignment_repo),
-    db: Session = Depends(get_db_session)
+    repo: AsyncAssignmentRepository = Depends(get_assignment_repo)
 ):
     """Update an assignment."""
     
-    db_assignment = repo.get_by_id(assignment_id)
+    db_assignment = await repo.get_by_id(assignment_id)
     if not db_assignment:
         raise HTTPException(status_code=404, detail="Assignment not found")
     
@@ -141,12 +142,9 @@ async def update_assignment(
             setattr(db_assignment, field, value)
     
     try:
-        # Note: You'd need to implement an update method in AssignmentRepository
-        # For now, we'll use the session directly
-        db.merge(db_assignment)
-        db.commit()
-        db.refresh(db_assignment)
-        return db_assignment
+        return await repo.update(db_assignment)
+    except InstructorConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -154,12 +152,15 @@ async def update_assignment(
 async def update_assignment_status(
     assignment_id: int,
     status: APIAssignmentStatus,
-    repo: AssignmentRepository = Depends(get_assignment_repo)
+    repo: AsyncAssignmentRepository = Depends(get_assignment_repo)
 ):
     """Update assignment status."""
     # Convert API enum to database enum
     db_status = AssignmentStatus(status.value)
-    assignment = repo.update_status(assignment_id, db_status)
+    try:
+        assignment = await repo.update_status(assignment_id, db_status)
+    except InstructorConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     if not assignment:
         raise HTTPException(status_code=404, detail="Assignment not found")
     
@@ -168,86 +169,132 @@ async def update_assignment_status(
 @router.post("/bulk", response_model=List[InstructorAssignmentResponse])
 async def create_bulk_assignments(
     bulk_assignment: BulkAssignmentCreate,
-    repo: AssignmentRepository = Depends(get_assignment_repo),
-    db: Session = Depends(get_db_session)
+    repo: AsyncAssignmentRepository = Depends(get_assignment_repo),
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """Create multiple assignments for an instructor across multiple session days."""
     
     # Verify instructor exists
-    instructor_repo = InstructorRepository(db)
-    instructor = instructor_repo.get_by_id(bulk_assignment.instructor_id)
+    instructor_repo = AsyncInstructorRepository(db)
+    instructor = await instructor_repo.get_by_id(bulk_assignment.instructor_id)
     if not instructor:
         raise HTTPException(status_code=404, detail="Instructor not found")
     
     # Verify all session days exist
-    session_days = db.query(CourseSessionDay).filter(
-        CourseSessionDay.id.in_(bulk_assignment.session_day_ids)
-    ).all()
+    session_days = await AsyncCourseSessionDayRepository(db).get_by_ids(bulk_assignment.session_day_ids)
     
     if len(session_days) != len(bulk_assignment.session_day_ids):
         raise HTTPException(status_code=404, detail="One or more session days not found")
     
-    # Check for conflicts on each day
-    conflicts = []
-    for session_day in session_days:
-        if not check_instructor_availability(
-            db, bulk_assignment.instructor_id, session_day.date,
-            session_day.start_time, session_day.end_time
-        ):
-            conflicts.append(session_day.id)
-    
-    if conflicts:
-        raise HTTPException(
-            status_code=409,
-            detail=f"Instructor has conflicts on session days: {conflicts}"
-        )
-    
+    # Double bookings are rejected by the database, in the same statement as the insert
     try:
         # Convert API enum to database enum
         assignment_type = SessionType(bulk_assignment.assignment_type.value)
         
-        created_assignments = []
-        for session_day in session_days:
-            
-            assignment = repo.create_assignment(
-                session_day_id=session_day.id,
-                instructor_id=bulk_assignment.instructor_id,
-                assignment_type=assignment_type,
-                notes=bulk_assignment.notes
-            )
-            created_assignments.append(assignment)
-        
-        return created_assignments
+        return await repo.create_assignments_bulk([
+            {
+                "session_day_id": session_day.id,
+                "instructor_id": bulk_assignment.instructor_id,
+                "assignment_type": assignment_type,
+                "notes": bulk_assignment.notes
+            }
+            for session_day in session_days
+        ])
+    except InstructorConflictError as e:
+        conflicts = [session_day.id for session_day in session_days if e.conflicts.get(session_day.id)]
+        raise HTTPException(
+            status_code=409,
+            detail=f"Instructor has conflicts on session days: {conflicts}" if conflicts else str(e)
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/check-conflicts", response_model=dict)
 async def check_assignment_conflicts(
     conflict_check: AssignmentConflictCheck,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """Check if an instructor has conflicts for a specific session day."""
     
     # Verify instructor exists
-    instructor_repo = InstructorRepository(db)
-    if not instructor_repo.get_by_id(conflict_check.instructor_id):
+    instructor_repo = AsyncInstructorRepository(db)
+    if not await instructor_repo.get_by_id(conflict_check.instructor_id):
         raise HTTPException(status_code=404, detail="Instructor not found")
     
     # Verify session day exists
-    session_day = db.query(CourseSessionDay).filter(
-        CourseSessionDay.id == conflict_check.session_day_id
-    ).first()
+    session_day = await AsyncCourseSessionDayRepository(db).get_by_id(conflict_check.session_day_id)
     if not session_day:
         raise HTTPException(status_code=404, detail="Session day not found")
     
     # Check for conflicts
-    conflicts = get_instructor_conflicts(
-        db, conflict_check.instructor_id, session_day.date,
+    availability = await db.run_sync(
+        find_instructor_conflicts, conflict_check.instructor_id, session_day.date,
         session_day.start_time, session_day.end_time
     )
     
     return {
-        "has_conflicts": len(conflicts) > 0,
-        "conflict_count": len(conflicts),
-        "conflicting_assignment_ids": [c.id for c in conflicts]
-    }
\ No newline at end of file
+        "has_conflicts": not availability.available,
+        "conflict_count": len(availability.conflicts),
+        "conflicting_assignment_ids": [c.id for c in availability.conflicts]
+    }
+
+@router.post("/check-conflicts/bulk", response_model=dict)
+async def check_bulk_assignment_conflicts(
+    conflict_check: BulkAssignmentConflictCheck,
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """Check an instructor against many session days, reporting conflicts per day."""
+    
+    # Verify instructor exists
+    instructor_repo = AsyncInstructorRepository(db)
+    if not await instructor_repo.get_by_id(conflict_check.instructor_id):
+        raise HTTPException(status_code=404, detail="Instructor not found")
+    
+    # Verify all session days exist
+    session_days = await AsyncCourseSessionDayRepository(db).get_by_ids(conflict_check.session_day_ids)
+    if len(session_days) != len(set(conflict_check.session_day_ids)):
+        raise HTTPException(status_code=404, detail="One or more session days not found")
+    
+    day_conflicts = await db.run_sync(find_instructor_conflicts_batch, conflict_check.instructor_id, session_days)
+    
+    return {
+        "has_conflicts": any(day_conflicts.values()),
+        "session_days": {
+            session_day_id: [c.id for c in conflicts]
+            for session_day_id, conflicts in day_conflicts.items()
+        }
+    }
+
+@router.post("/plan", response_model=SchedulePlanResponse)
+async def propose_assignment_plan(
+    plan_request: SchedulePlanRequest,
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """Propose instructors for every unstaffed session day in a date range, without saving."""
+    if plan_request.date_to < plan_request.date_from:
+        raise HTTPException(status_code=400, detail="Invalid date range")
+    
+    plan = await db.run_sync(
+        propose_schedule, plan_request.date_from, plan_request.date_to, plan_request.max_load
+    )
+    
+    return {
+        "assignments": [a._asdict() for a in plan.assignments],
+        "unfilled_session_day_ids": plan.unfilled
+    }
+
+@router.post("/plan/commit", response_model=List[InstructorAssignmentResponse], status_code=201)
+async def commit_assignment_plan(
+    plan: SchedulePlanCommit,
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """Create every assignment in a proposed plan atomically."""
+    try:
+        return await db.run_sync(commit_plan, [
+            ProposedAssignment(a.session_day_id, a.instructor_id) for a in plan.assignments
+        ])
+    except PlanConflictError as e:
+        raise HTTPException(status_code=409, detail=e.problems)
+    except InstructorConflictError as e:
+        # Another request staffed one of the instructors after the plan was checked
+        raise HTTPException(status_code=409, detail=[str(e)])
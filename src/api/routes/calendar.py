@@ -0,0 +1,31 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from src.database.connection import get_async_db_session
+from src.database.async_repository import AsyncCalendarRepository
+from ..schemas.calendar import CalendarDayResponse
+
+router = APIRouter()
+
+def get_calendar_repo(db: AsyncSession = Depends(get_async_db_session)) -> AsyncCalendarRepository:
+    return AsyncCalendarRepository(db)
+
+@router.get("/", response_model=List[CalendarDayResponse])
+async def get_calendar(
+    start_date: date = Query(..., description="First date to show"),
+    end_date: date = Query(..., description="Last date to show"),
+    location_id: Optional[int] = Query(None, description="Filter by location ID"),
+    course_id: Optional[int] = Query(None, description="Filter by course ID"),
+    repo: AsyncCalendarRepository = Depends(get_calendar_repo)
+):
+    """Every session day in a date range with its session, course, location and assignment count."""
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="Invalid date range")
+    
+    return await repo.get_range(start_date, end_date, location_id=location_id, course_id=course_id)
@@ -0,0 +1,43 @@
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from src.database.connection import get_async_db_session
+from src.database.exports import assignment_export, session_day_export
+from ..streaming import export_response
+from ..validation import check_date_range
+
+router = APIRouter()
+
+ExportFormat = Literal["csv", "ndjson"]
+
+@router.get("/session-days")
+async def export_session_days(
+    format: ExportFormat = Query("csv", description="csv or ndjson"),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """Stream every session day, optionally within a date range."""
+    check_date_range(date_from, date_to)
+    
+    result = await db.stream(session_day_export(date_from, date_to))
+    return export_response(result, format, "session-days")
+
+@router.get("/assignments")
+async def export_assignments(
+    format: ExportFormat = Query("csv", description="csv or ndjson"),
+    date_from: Optional[date] = Query(None),
+    date_to: Optional[date] = Query(None),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """Stream every instructor assignment, optionally within a date range."""
+    check_date_range(date_from, date_to)
+    
+    result = await db.stream(assignment_export(date_from, date_to))
+    return export_response(result, format, "assignments")
@@ -0,0 +1,122 @@
+import csv
+import io
+import json
+from typing import Iterator, List, Literal, Tuple
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from src.database.connection import get_async_db_session
+from src.database.imports import IMPORT_TARGETS, ImportTarget, RowError, import_batch
+from src.database.utils import validate_session_dates
+from ..schemas.imports import ImportReport
+from ..schemas.instructor import InstructorCreate
+from ..schemas.course import CourseCreate
+from ..schemas.location import LocationCreate
+from ..schemas.session import CourseSessionCreate
+
+router = APIRouter()
+
+ImportKind = Literal["instructors", "courses", "locations", "sessions"]
+
+IMPORT_SCHEMAS = {
+    "instructors": InstructorCreate,
+    "courses": CourseCreate,
+    "locations": LocationCreate,
+    "sessions": CourseSessionCreate,
+}
+
+# Rows validated and inserted together
+IMPORT_BATCH_SIZE = 5000
+
+def _read_records(text: io.TextIOBase, format: str) -> Iterator[Tuple[int, object]]:
+    """Yield (row number, record) for each row of a CSV or NDJSON upload.
+
+    Empty CSV cells become None. An NDJSON line that is not valid JSON yields the exception.
+    """
+    if format == "csv":
+        reader = csv.DictReader(text)
+        for row, record in enumerate(reader, start=1):
+            yield row, {key: value or None for key, value in record.items() if key is not None}
+    else:
+        row = 0
+        for line in text:
+            if not line.strip():
+                continue
+            row += 1
+            try:
+                yield row, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield row, e
+
+def _validate(schema: type, kind: str, row: int, record: object) -> Tuple[dict, List[RowError]]:
+    if isinstance(record, Exception):
+        return None, [RowError(row, None, f"Invalid JSON: {record}")]
+    try:
+        values = schema.model_validate(record).model_dump()
+    except ValidationError as e:
+        return None, [
+            RowError(row, ".".join(str(part) for part in error["loc"]) or None, error["msg"])
+            for error in e.errors()
+        ]
+    if kind == "sessions" and not validate_session_dates(values["start_date"], values["end_date"]):
+        return None, [RowError(row, "end_date", "Invalid session dates")]
+    return values, []
+
+def _run_import(db: Session, kind: str, text: io.TextIOBase, format: str) -> ImportReport:
+    """Validate and insert every row in batches within one transaction."""
+    target: ImportTarget = IMPORT_TARGETS[kind]
+    schema: type = IMPORT_SCHEMAS[kind]
+    rows = created = 0
+    errors: List[RowError] = []
+    batch = []
+
+    def flush():
+        nonlocal created
+        inserted, batch_errors = import_batch(db, target, batch)
+        created += inserted
+        errors.extend(batch_errors)
+        batch.clear()
+
+    try:
+        for rows, record in _read_records(text, format):
+            values, row_errors = _validate(schema, kind, rows, record)
+            errors.extend(row_errors)
+            if values is not None:
+                batch.append((rows, values))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                flush()
+        flush()
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    errors.sort(key=lambda error: error.row)
+    return ImportReport(rows=rows, created=created, errors=[error._asdict() for error in errors])
+
+@router.post("/{kind}", response_model=ImportReport)
+async def import_rows(
+    kind: ImportKind,
+    file: UploadFile = File(..., description="CSV with a header row, or NDJSON with one object per line"),
+    format: Literal["csv", "ndjson"] = Query("csv", description="csv or ndjson"),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """Create instructors, courses, locations or sessions in bulk from an uploaded file.
+    
+    Each row is validated like the matching create endpoint. Valid rows are
+    inserted in one transaction; the report lists every row that was skipped and why.
+    """
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        return await db.run_sync(_run_import, kind, text, format)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="File must be UTF-8 encoded")
+    except csv.Error as e:
+        raise HTTPException(status_code=400, detail=f"Invalid CSV: {e}")
+    finally:
+        text.detach()
@@ -1,13 +1,14 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import sys
 import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
 
-from src.database.connection import get_db_session
-from src.database.repository import InstructorRepository
+from src.database.connection import get_async_db_session
+from src.database.async_repository import AsyncInstructorRepository
+from src.database.models import RatingType
 from src.database.utils import get_instructor_stats
 from ..schemas.instructor import (
     InstructorCreate, InstructorUpdate, InstructorResponse, 
@@ -16,17 +17,17 @@ from ..schemas.instructor import (
 
 router = APIRouter()
 
-def get_instructor_repo(db: Session = Depends(get_db_session)) -> InstructorRepository:
-    return InstructorRepository(db)
+def get_instructor_repo(db: AsyncSession = Depends(get_async_db_session)) -> AsyncInstructorRepository:
+    return AsyncInstructorRepository(db)
 
 @router.post("/", response_model=InstructorResponse, status_code=201)
 async def create_instructor(
     instructor: InstructorCreate,
-    repo: InstructorRepository = Depends(get_instructor_repo)
+    repo: AsyncInstructorRepository = Depends(get_instructor_repo)
 ):
     """Create a new instructor."""
     try:
-        db_instructor = repo.create(
+        db_instructor = await repo.create(
             first_name=instructor.first_name,
             last_name=instructor.last_name,
             email=instructor.email,
@@ -45,24 +46,19 @@ async def list_instructors(
     name: Optional[str] = Query(None, description="Search by name"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
-    repo: InstructorRepository = Depends(get_instructor_repo)
+    repo: AsyncInstructorRepository = Depends(get_instructor_repo)
 ):
     """List all instructors with optional filtering."""
-    if name:
-        instructors = repo.search_by_name(name, active_only)
-    else:
-        instructors = repo.get_all(active_only)
-    
-    # Apply pagination
-    return instructors[skip:skip + limit]
+    page = await repo.get_page(offset=skip, limit=limit, active_only=active_only, name=name)
+    return page.items
 
 @router.get("/{instructor_id}", response_model=InstructorDetailResponse)
 async def get_instructor(
     instructor_id: int,
-    repo: InstructorRepository = Depends(get_instructor_repo)
+    repo: AsyncInstructorRepository = Depends(get_instructor_repo)
 ):
     """Get a specific instructor by ID."""
-    instructor = repo.get_by_id(instructor_id)
+    instructor = await repo.get_with_details(instructor_id)
     if not instructor:
         raise HTTPException(status_code=404, detail="Instructor not found")
     return instructor
@@ -71,10 +67,10 @@ async def get_instructor(
 async def update_instructor(
     instructor_id: int,
     instructor_update: InstructorUpdate,
-    repo: InstructorRepository = Depends(get_instructor_repo)
+    repo: AsyncInstructorRepository = Depends(get_instructor_repo)
 ):
     """Update an instructor."""
-    db_instructor = repo.get_by_id(instructor_id)
+    db_instructor = await repo.get_by_id(instructor_id)
     if not db_instructor:
         raise HTTPException(status_code=404, detail="Instructor not found")
     
@@ -84,7 +80,7 @@ async def update_instructor(
         setattr(db_instructor, field, value)
     
     try:
-        return repo.update(db_instructor)
+        return await repo.update(db_instructor)
     except Exception as e:
         if "unique constraint" in str(e).lower():
             raise HTTPException(status_code=400, detail="Email already exists")
@@ -94,10 +90,10 @@ async def update_instructor(
 async def update_instructor_status(
     instructor_id: int,
     active: bool,
-    repo: InstructorRepository = Depends(get_instructor_repo)
+    repo: AsyncInstructorRepository = Depends(get_instructor_repo)
 ):
     """Update instructor active status."""
-    instructor = repo.set_active_status(instructor_id, active)
+    instructor = await repo.set_active_status(instructor_id, active)
     if not instructor:
         raise HTTPException(status_code=404, detail="Instructor not found")
     
@@ -106,28 +102,30 @@ async def update_instructor_status(
 @router.get("/{instructor_id}/stats")
 async def get_instructor_statistics(
     instructor_id: int,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """Get instructor statistics."""
     # Check if instructor exists
-    repo = InstructorRepository(db)
-    instructor = repo.get_by_id(instructor_id)
+    repo = AsyncInstructorRepository(db)
+    instructor = await repo.get_by_id(instructor_id)
     if not instructor:
         raise HTTPException(status_code=404, detail="Instructor not found")
     
-    stats = get_instructor_stats(db, instructor_id)
+    stats = await db.run_sync(get_instructor_stats, instructor_id)
     return stats
 
 @router.post("/search", response_model=List[InstructorResponse])
 async def search_instructors(
     search_request: InstructorSearchRequest,
-    repo: InstructorRepository = Depends(get_instructor_repo)
+    repo: AsyncInstructorRepository = Depends(get_instructor_repo)
 ):
     """Advanced search for instructors."""
-    if search_request.name:
-        return repo.search_by_name(search_request.name, search_request.active_only)
-    elif search_request.email:
-        instructor = repo.get_by_email(search_request.email)
-        return [instructor] if instructor else []
-    else:
-        return repo.get_all(search_request.active_only)
\ No newline at end of file
+    # Convert API enum to database enum
+    rating = RatingType(search_request.rating_level.value) if search_request.rating_level else None
+    page = await repo.search(
+        name=search_request.name, email=search_request.email,
+        active_only=search_request.active_only,
+        course_id=search_request.course_id, rating=rating,
+        offset=search_request.skip, limit=search_request.limit
+    )
+    return page.items
\ No newline at end of file
@@ -1,30 +1,30 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import sys
 import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
 
-from src.database.connection import get_db_session
-from src.database.repository import LocationRepository
+from src.database.connection import get_async_db_session
+from src.database.async_repository import AsyncLocationRepository
 from ..schemas.location import (
     LocationCreate, LocationUpdate, LocationResponse, LocationSearchRequest
 )
 
 router = APIRouter()
 
-def get_location_repo(db: Session = Depends(get_db_session)) -> LocationRepository:
-    return LocationRepository(db)
+def get_location_repo(db: AsyncSession = Depends(get_async_db_session)) -> AsyncLocationRepository:
+    return AsyncLocationRepository(db)
 
 @router.post("/", response_model=LocationResponse, status_code=201)
 async def create_location(
     location: LocationCreate,
-    repo: LocationRepository = Depends(get_location_repo)
+    repo: AsyncLocationRepository = Depends(get_location_repo)
 ):
     """Create a new location."""
     try:
-        db_location = repo.create(
+        db_location = await repo.create(
             location_name=location.location_name,
             address=location.address,
             city=location.city,
@@ -41,22 +41,19 @@ async def list_locations(
     active_only: bool = Query(True, description="Filter active locations only"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
-    repo: LocationRepository = Depends(get_location_repo)
+    repo: AsyncLocationRepository = Depends(get_location_repo)
 ):
     """List all locations with optional filtering."""
-    locations = repo.get_all(active_only)
-    
-    
-    # Apply pagination
-    return locations[skip:skip + limit]
+    page = await repo.get_page(offset=skip, limit=limit, active_only=active_only)
+    return page.items
 
 @router.get("/{location_id}", response_model=LocationResponse)
 async def get_location(
     location_id: int,
-    repo: LocationRepository = Depends(get_location_repo)
+    repo: AsyncLocationRepository = Depends(get_location_repo)
 ):
     """Get a specific location by ID."""
-    location = repo.get_by_id(location_id)
+    location = await repo.get_by_id(location_id)
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
     return location
@@ -65,10 +62,10 @@ async def get_location(
 async def update_location(
     location_id: int,
     location_update: LocationUpdate,
-    repo: LocationRepository = Depends(get_location_repo)
+    repo: AsyncLocationRepository = Depends(get_location_repo)
 ):
     """Update a location."""
-    db_location = repo.get_by_id(location_id)
+    db_location = await repo.get_by_id(location_id)
     if not db_location:
         raise HTTPException(status_code=404, detail="Location not found")
     
@@ -78,7 +75,7 @@ async def update_location(
         setattr(db_location, field, value)
     
     try:
-        return repo.update(db_location)
+        return await repo.update(db_location)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -86,10 +83,10 @@ async def update_location(
 async def update_location_status(
     location_id: int,
     active: bool,
-    repo: LocationRepository = Depends(get_location_repo)
+    repo: AsyncLocationRepository = Depends(get_location_repo)
 ):
     """Update location active status."""
-    location = repo.set_active_status(location_id, active)
+    location = await repo.set_active_status(location_id, active)
     if not location:
         raise HTTPException(status_code=404, detail="Location not found")
     
@@ -98,21 +95,12 @@ async def update_location_status(
 @router.post("/search", response_model=List[LocationResponse])
 async def search_locations(
     search_request: LocationSearchRequest,
-    repo: LocationRepository = Depends(get_location_repo)
+    repo: AsyncLocationRepository = Depends(get_location_repo)
 ):
     """Advanced search for locations."""
-    locations = repo.get_all(search_request.active_only)
-    
-    # Filter by name if provided
-    if search_request.name:
-        name_lower = search_request.name.lower()
-        locations = [loc for loc in locations if name_lower in loc.location_name.lower()]
-    
-    # Filter by city if provided
-    if search_request.city:
-        city_lower = search_request.city.lower()
-        locations = [loc for loc in locations 
-                    if loc.city and city_lower in loc.city.lower()]
-    
-    
-    return locations
\ No newline at end of file
+    page = await repo.search(
+        name=search_request.name, city=search_request.city,
+        active_only=search_request.active_only,
+        offset=search_request.skip, limit=search_request.limit
+    )
+    return page.items
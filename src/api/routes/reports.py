@@ -0,0 +1,39 @@
+from typing import List
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from src.database.connection import get_async_db_session
+from src.database.reports import get_pay_eligibility_report, pay_eligibility_report
+from ..schemas.report import PayEligibilityRow
+from ..streaming import export_response
+from ..validation import check_date_range
+
+router = APIRouter()
+
+@router.get("/pay-eligibility", response_model=List[PayEligibilityRow])
+async def get_pay_eligibility(
+    date_from: date = Query(..., description="First session day date to include"),
+    date_to: date = Query(..., description="Last session day date to include"),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """Assignments and pay eligible hours per instructor for session days in a date range."""
+    check_date_range(date_from, date_to)
+    
+    return [row._asdict() for row in await db.run_sync(get_pay_eligibility_report, date_from, date_to)]
+
+@router.get("/pay-eligibility.csv")
+async def export_pay_eligibility(
+    date_from: date = Query(..., description="First session day date to include"),
+    date_to: date = Query(..., description="Last session day date to include"),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """The pay eligibility report as CSV for payroll, streamed as rows are read from the database."""
+    check_date_range(date_from, date_to)
+    
+    rows = await db.stream(pay_eligibility_report(date_from, date_to))
+    return export_response(rows, "csv", f"pay-eligibility-{date_from}-{date_to}")
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from src.database.connection import get_async_db_session
+from src.database.async_repository import (
+    AsyncInstructorRepository, AsyncCourseRepository, AsyncLocationRepository
+)
+from ..schemas.search import SearchResults
+
+router = APIRouter()
+
+@router.get("/", response_model=SearchResults)
+async def search(
+    q: str = Query(..., min_length=1, description="Search text; each word matches as a prefix"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum results per category"),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """Typeahead search across active instructors, courses and locations, best matches first."""
+    return {
+        "instructors": await AsyncInstructorRepository(db).search_by_name(q, limit=limit),
+        "courses": await AsyncCourseRepository(db).search_text(q, limit=limit),
+        "locations": await AsyncLocationRepository(db).search_text(q, limit=limit)
+    }
@@ -1,29 +1,55 @@
-from typing import List
-from datetime import date
+import math
+from typing import List, Optional
+from datetime import date, timedelta
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import sys
 import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
 
-from src.database.connection import get_db_session
-from src.database.repository import SessionRepository, CourseRepository, LocationRepository, CourseSessionDayRepository
+from src.database.connection import get_async_db_session
+from src.database.async_repository import (
+    AsyncSessionRepository, AsyncCourseRepository, AsyncLocationRepository,
+    AsyncCourseSessionDayRepository
+)
 from src.database.models import SessionStatus, CourseSessionDay
-from src.database.utils import validate_session_dates, validate_session_times
+from src.database.utils import recurring_dates, validate_session_dates, validate_session_times
+from src.database.conflicts import InstructorConflictError, LocationConflictError, find_staffing_candidates
+from src.database.rescheduling import RescheduleConflictError, clone_session, reschedule_session
 from ..schemas.session import (
     CourseSessionCreate, CourseSessionUpdate, CourseSessionResponse,
     CourseSessionDayCreate, CourseSessionDayUpdate, CourseSessionDayResponse,
-    SessionSearchRequest, SessionStatus as APISessionStatus
+    CourseSessionDayPage, SessionClone, SessionDayGenerate, SessionReschedule, SessionSearchRequest,
+    SessionStatus as APISessionStatus
 )
+from ..schemas.instructor import StaffingCandidateResponse
 
 router = APIRouter()
 
-def get_session_repo(db: Session = Depends(get_db_session)) -> SessionRepository:
-    return SessionRepository(db)
+def get_session_repo(db: AsyncSession = Depends(get_async_db_session)) -> AsyncSessionRepository:
+    return AsyncSessionRepository(db)
+
+def get_session_day_repo(db: AsyncSession = Depends(get_async_db_session)) -> AsyncCourseSessionDayRepository:
+    return AsyncCourseSessionDayRepository(db)
 
-def get_session_day_repo(db: Session = Depends(get_db_session)) -> CourseSessionDayRepository:
-    return CourseSessionDayRepository(db)
+def location_conflict(error: LocationConflictError) -> HTTPException:
+    """409 response listing the session days already booked in the location."""
+    return HTTPException(status_code=409, detail={
+        "message": str(error),
+        "session_days": [
+            CourseSessionDayResponse.model_validate(day).model_dump(mode="json") for day in error.clashes
+        ]
+    })
+
+async def check_shifted_dates(repo: AsyncSessionRepository, session_id: int, offset_days: int):
+    """Reject a move or copy whose dates would be invalid for a new session."""
+    session = await repo.get_by_id(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    offset = timedelta(days=offset_days)
+    if not validate_session_dates(session.start_date + offset, session.end_date + offset):
+        raise HTTPException(status_code=400, detail="Invalid session dates")
 
 # Session day routes (put before parameterized routes to avoid conflicts)
 @router.get("/session-days", response_model=List[CourseSessionDayResponse])
@@ -33,50 +59,73 @@ async def list_all_session_days(
     location_id: int = Query(None, description="Filter by location ID"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
-    session_day_repo: CourseSessionDayRepository = Depends(get_session_day_repo)
+    session_day_repo: AsyncCourseSessionDayRepository = Depends(get_session_day_repo)
 ):
     """List all session days with optional filtering."""
-    if start_date and end_date:
-        session_days = session_day_repo.get_by_date_range(start_date, end_date)
-    elif location_id and start_date:
-        session_days = session_day_repo.get_by_location_and_date(location_id, start_date)
-    else:
-        session_days = session_day_repo.get_all()
-    
-    # Apply additional filters
-    if location_id and not start_date:
-        session_days = [sd for sd in session_days if sd.location_id == location_id]
-    
-    # Apply pagination
-    return session_days[skip:skip + limit]
+    page = await session_day_repo.get_page(
+        offset=skip, limit=limit,
+        start_date=start_date, end_date=end_date, location_id=location_id
+    )
+    return page.items
+
+@router.get("/session-days/scroll", response_model=CourseSessionDayPage)
+async def scroll_session_days(
+    cursor: Optional[str] = Query(None, description="Cursor returned by the previous page"),
+    start_date: date = Query(None, description="Filter by start date"),
+    end_date: date = Query(None, description="Filter by end date"),
+    location_id: int = Query(None, description="Filter by location ID"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    session_day_repo: AsyncCourseSessionDayRepository = Depends(get_session_day_repo)
+):
+    """Page through session days in calendar order using an opaque cursor."""
+    page = await session_day_repo.get_page_after(
+        cursor=cursor, limit=limit,
+        start_date=start_date, end_date=end_date, location_id=location_id
+    )
+    return {"items": page.items, "next_cursor": page.next_cursor}
 
 @router.get("/session-days/{session_day_id}", response_model=CourseSessionDayResponse)
 async def get_session_day(
     session_day_id: int,
-    session_day_repo: CourseSessionDayRepository = Depends(get_session_day_repo)
+    session_day_repo: AsyncCourseSessionDayRepository = Depends(get_session_day_repo)
 ):
     """Get a specific session day by ID."""
-    session_day = session_day_repo.get_by_id(session_day_id)
+    session_day = await session_day_repo.get_by_id(session_day_id)
     if not session_day:
         raise HTTPException(status_code=404, detail="Session day not found")
     return session_day
 
+@router.get("/session-days/{session_day_id}/candidates", response_model=List[StaffingCandidateResponse])
+async def get_staffing_candidates(
+    session_day_id: int,
+    load_window_days: int = Query(30, ge=0, le=365, description="Days either side of the session day counted as current load"),
+    limit: int = Query(100, ge=1, le=1000, description="Number of candidates to return"),
+    session_day_repo: AsyncCourseSessionDayRepository = Depends(get_session_day_repo),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """List active instructors cleared for the course and free at this time, least loaded first."""
+    session_day = await session_day_repo.get_by_id(session_day_id)
+    if not session_day:
+        raise HTTPException(status_code=404, detail="Session day not found")
+    
+    return await db.run_sync(find_staffing_candidates, session_day, load_window_days, limit)
+
 @router.put("/session-days/{session_day_id}", response_model=CourseSessionDayResponse)
 async def update_session_day(
     session_day_id: int,
     session_day_update: CourseSessionDayUpdate,
-    session_day_repo: CourseSessionDayRepository = Depends(get_session_day_repo),
-    db: Session = Depends(get_db_session)
+    session_day_repo: AsyncCourseSessionDayRepository = Depends(get_session_day_repo),
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """Update a session day."""
-    db_session_day = session_day_repo.get_by_id(session_day_id)
+    db_session_day = await session_day_repo.get_by_id(session_day_id)
     if not db_session_day:
         raise HTTPException(status_code=404, detail="Session day not found")
     
     # Validate location if provided
     if session_day_update.location_id:
-        location_repo = LocationRepository(db)
-        if not location_repo.get_by_id(session_day_update.location_id):
+        location_repo = AsyncLocationRepository(db)
+        if not await location_repo.get_cached(session_day_update.location_id):
             raise HTTPException(status_code=404, detail="Location not found")
     
     # Validate times if provided
@@ -96,18 +145,22 @@ async def update_session_day(
             setattr(db_session_day, field, value)
     
     try:
-        updated_session_day = session_day_repo.update(db_session_day)
+        updated_session_day = await session_day_repo.update(db_session_day)
         return updated_session_day
+    except LocationConflictError as e:
+        raise location_conflict(e)
+    except InstructorConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/session-days/{session_day_id}")
 async def delete_session_day(
     session_day_id: int,
-    session_day_repo: CourseSessionDayRepository = Depends(get_session_day_repo)
+    session_day_repo: AsyncCourseSessionDayRepository = Depends(get_session_day_repo)
 ):
     """Delete a session day."""
-    success = session_day_repo.delete(session_day_id)
+    success = await session_day_repo.delete(session_day_id)
     if not success:
         raise HTTPException(status_code=404, detail="Session day not found")
     
@@ -116,14 +169,14 @@ async def delete_session_day(
 @router.post("/", response_model=CourseSessionResponse, status_code=201)
 async def create_session(
     session: CourseSessionCreate,
-    repo: SessionRepository = Depends(get_session_repo),
-    db: Session = Depends(get_db_session)
+    repo: AsyncSessionRepository = Depends(get_session_repo),
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """Create a new class session."""
     
     # Verify course exists
-    course_repo = CourseRepository(db)
-    if not course_repo.get_by_id(session.course_id):
+    course_repo = AsyncCourseRepository(db)
+    if not await course_repo.get_cached(session.course_id):
         raise HTTPException(status_code=404, detail="Course not found")
     
     # Validate dates
@@ -131,7 +184,7 @@ async def create_session(
         raise HTTPException(status_code=400, detail="Invalid session dates")
     
     try:
-        db_session_obj = repo.create_session(
+        db_session_obj = await repo.create_session(
             course_id=session.course_id,
             session_name=session.session_name,
             start_date=session.start_date,
@@ -148,30 +201,21 @@ async def list_sessions(
     course_id: int = Query(None, description="Filter by course ID"),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
-    repo: SessionRepository = Depends(get_session_repo)
+    repo: AsyncSessionRepository = Depends(get_session_repo)
 ):
     """List all sessions with optional filtering."""
-    if status:
-        # Convert API enum to database enum
-        db_status = SessionStatus(status.value)
-        sessions = repo.get_by_status(db_status)
-    else:
-        sessions = repo.get_all()
-    
-    # Filter by course if provided
-    if course_id:
-        sessions = [s for s in sessions if s.course_id == course_id]
-    
-    # Apply pagination
-    return sessions[skip:skip + limit]
+    # Convert API enum to database enum
+    db_status = SessionStatus(status.value) if status else None
+    page = await repo.get_page(offset=skip, limit=limit, status=db_status, course_id=course_id)
+    return page.items
 
 @router.get("/{session_id}", response_model=CourseSessionResponse)
 async def get_session(
     session_id: int,
-    repo: SessionRepository = Depends(get_session_repo)
+    repo: AsyncSessionRepository = Depends(get_session_repo)
 ):
     """Get a specific session by ID."""
-    session = repo.get_by_id(session_id)
+    session = await repo.get_by_id(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     return session
@@ -180,11 +224,10 @@ async def get_session(
 async def update_session(
     session_id: int,
     session_update: CourseSessionUpdate,
-    repo: SessionRepository = Depends(get_session_repo),
-    db: Session = Depends(get_db_session)
+    repo: AsyncSessionRepository = Depends(get_session_repo)
 ):
     """Update a session."""
-    db_session = repo.get_by_id(session_id)
+    db_session = await repo.get_by_id(session_id)
     if not db_session:
         raise HTTPException(status_code=404, detail="Session not found")
     
@@ -204,12 +247,9 @@ async def update_session(
             setattr(db_session, field, value)
     
     try:
-        # Note: SessionRepository doesn't have an update method, so we'll use the session directly
-        # In a real implementation, you'd add this method to the repository
-        db.merge(db_session)
-        db.commit()
-        db.refresh(db_session)
-        return db_session
+        return await repo.update(db_session)
+    except RescheduleConflictError as e:
+        raise HTTPException(status_code=409, detail=e.problems)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -217,34 +257,74 @@ async def update_session(
 async def update_session_status(
     session_id: int,
     status: APISessionStatus,
-    repo: SessionRepository = Depends(get_session_repo)
+    repo: AsyncSessionRepository = Depends(get_session_repo)
 ):
     """Update session status."""
     # Convert API enum to database enum
     db_status = SessionStatus(status.value)
-    session = repo.update_status(session_id, db_status)
+    try:
+        session = await repo.update_status(session_id, db_status)
+    except RescheduleConflictError as e:
+        raise HTTPException(status_code=409, detail=e.problems)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
     return {"message": f"Session status updated to {status.value}"}
 
+@router.post("/{session_id}/reschedule", response_model=CourseSessionResponse)
+async def reschedule_course_session(
+    session_id: int,
+    reschedule: SessionReschedule,
+    repo: AsyncSessionRepository = Depends(get_session_repo),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """Move a session with all its days and assignments by a number of days."""
+    await check_shifted_dates(repo, session_id, reschedule.offset_days)
+    try:
+        session = await db.run_sync(reschedule_session, session_id, reschedule.offset_days)
+    except RescheduleConflictError as e:
+        raise HTTPException(status_code=409, detail=e.problems)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return session
+
+@router.post("/{session_id}/clone", response_model=CourseSessionResponse, status_code=201)
+async def clone_course_session(
+    session_id: int,
+    clone: SessionClone,
+    repo: AsyncSessionRepository = Depends(get_session_repo),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """Copy a session and its days, and optionally its assignments, shifted by a number of days."""
+    await check_shifted_dates(repo, session_id, clone.offset_days)
+    try:
+        session = await db.run_sync(
+            clone_session, session_id, clone.offset_days,
+            include_assignments=clone.include_assignments, session_name=clone.session_name
+        )
+    except RescheduleConflictError as e:
+        raise HTTPException(status_code=409, detail=e.problems)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return session
+
 @router.post("/{session_id}/days", response_model=CourseSessionDayResponse, status_code=201)
 async def create_session_day(
     session_id: int,
     session_day: CourseSessionDayCreate,
-    session_day_repo: CourseSessionDayRepository = Depends(get_session_day_repo),
-    db: Session = Depends(get_db_session)
+    session_day_repo: AsyncCourseSessionDayRepository = Depends(get_session_day_repo),
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """Create a new session day."""
     
     # Verify session exists
-    session_repo = SessionRepository(db)
-    if not session_repo.get_by_id(session_id):
+    session_repo = AsyncSessionRepository(db)
+    if not await session_repo.get_by_id(session_id):
         raise HTTPException(status_code=404, detail="Session not found")
     
     # Verify location exists
-    location_repo = LocationRepository(db)
-    if not location_repo.get_by_id(session_day.location_id):
+    location_repo = AsyncLocationRepository(db)
+    if not await location_repo.get_cached(session_day.location_id):
         raise HTTPException(status_code=404, detail="Location not found")
     
     # Validate times
@@ -257,7 +337,7 @@ async def create_session_day(
         # Convert API enum to database enum
         session_type = SessionType(session_day.session_type.value)
         
-        db_session_day = session_day_repo.create(
+        db_session_day = await session_day_repo.create(
             session_id=session_id,
             day_number=session_day.day_number,
             date=session_day.date,
@@ -268,47 +348,91 @@ async def create_session_day(
         )
         
         return db_session_day
+    except LocationConflictError as e:
+        raise location_conflict(e)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/{session_id}/days/generate", response_model=List[CourseSessionDayResponse], status_code=201)
+async def generate_session_days(
+    session_id: int,
+    spec: SessionDayGenerate,
+    session_day_repo: AsyncCourseSessionDayRepository = Depends(get_session_day_repo),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """Create every day of a session from a recurrence spec in one insert."""
+    session = await AsyncSessionRepository(db).get_by_id(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    if not await AsyncLocationRepository(db).get_cached(spec.location_id):
+        raise HTTPException(status_code=404, detail="Location not found")
+    
+    if not validate_session_times(spec.start_time, spec.end_time):
+        raise HTTPException(status_code=400, detail="Invalid session times")
+    
+    start_date = spec.start_date or session.start_date
+    end_date = spec.end_date or session.end_date
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="Invalid date range")
+    
+    day_count = spec.day_count
+    if day_count is None:
+        course = await AsyncCourseRepository(db).get_cached(session.course_id)
+        day_count = math.ceil(course.duration_days)
+    dates = recurring_dates(start_date, end_date, spec.weekdays, limit=day_count)
+    if len(dates) < day_count:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Only {len(dates)} of {day_count} days fall between {start_date} and {end_date}"
+        )
+    
+    try:
+        from src.database.models import SessionType
+        
+        return await session_day_repo.create_many(
+            session_id=session_id,
+            dates=dates,
+            location_id=spec.location_id,
+            start_time=spec.start_time,
+            end_time=spec.end_time,
+            session_type=SessionType(spec.session_type.value),
+            first_day_number=await session_day_repo.next_day_number(session_id)
+        )
+    except LocationConflictError as e:
+        raise location_conflict(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{session_id}/days", response_model=List[CourseSessionDayResponse])
 async def get_session_days(
     session_id: int,
-    session_day_repo: CourseSessionDayRepository = Depends(get_session_day_repo),
-    db: Session = Depends(get_db_session)
+    session_day_repo: AsyncCourseSessionDayRepository = Depends(get_session_day_repo),
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """Get all days for a specific session."""
     
     # Verify session exists
-    session_repo = SessionRepository(db)
-    if not session_repo.get_by_id(session_id):
+    session_repo = AsyncSessionRepository(db)
+    if not await session_repo.get_by_id(session_id):
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session_days = session_day_repo.get_by_session_id(session_id)
+    session_days = await session_day_repo.get_by_session_id(session_id)
     return session_days
 
 @router.post("/search", response_model=List[CourseSessionResponse])
 async def search_sessions(
     search_request: SessionSearchRequest,
-    repo: SessionRepository = Depends(get_session_repo)
+    repo: AsyncSessionRepository = Depends(get_session_repo)
 ):
     """Advanced search for sessions."""
-    if search_request.status:
-        # Convert API enum to database enum
-        db_status = SessionStatus(search_request.status.value)
-        sessions = repo.get_by_status(db_status)
-    else:
-        sessions = repo.get_all()
-    
-    # Filter by course if provided
-    if search_request.course_id:
-        sessions = [s for s in sessions if s.course_id == search_request.course_id]
-    
-    # Filter by date range if provided
-    if search_request.start_date_from:
-        sessions = [s for s in sessions if s.start_date >= search_request.start_date_from]
-    
-    if search_request.start_date_to:
-        sessions = [s for s in sessions if s.start_date <= search_request.start_date_to]
-    
-    return sessions
\ No newline at end of file
+    # Convert API enum to database enum
+    db_status = SessionStatus(search_request.status.value) if search_request.status else None
+    page = await repo.search(
+        course_id=search_request.course_id, status=db_status,
+        start_date_from=search_request.start_date_from,
+        start_date_to=search_request.start_date_to,
+        location_id=search_request.location_id,
+        offset=search_request.skip, limit=search_request.limit
+    )
+    return page.items
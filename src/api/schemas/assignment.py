@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Optional, List
 from pydantic import BaseModel, Field
 from enum import Enum
 from .session import SessionType
@@ -32,6 +32,10 @@ class InstructorAssignmentResponse(InstructorAssignmentBase):
     class Config:
         from_attributes = True
 
+class InstructorAssignmentPage(BaseModel):
+    items: List[InstructorAssignmentResponse]
+    next_cursor: Optional[str] = None
+
 class BulkAssignmentCreate(BaseModel):
     session_day_ids: list[int]
     instructor_id: int
@@ -40,4 +44,24 @@ class BulkAssignmentCreate(BaseModel):
 
 class AssignmentConflictCheck(BaseModel):
     instructor_id: int
-    session_day_id: int
\ No newline at end of file
+    session_day_id: int
+
+class BulkAssignmentConflictCheck(BaseModel):
+    instructor_id: int
+    session_day_ids: list[int]
+
+class SchedulePlanRequest(BaseModel):
+    date_from: date
+    date_to: date
+    max_load: int = Field(20, ge=1, le=1000)
+
+class PlannedAssignment(BaseModel):
+    session_day_id: int
+    instructor_id: int
+
+class SchedulePlanResponse(BaseModel):
+    assignments: List[PlannedAssignment]
+    unfilled_session_day_ids: List[int]
+
+class SchedulePlanCommit(BaseModel):
+    assignments: List[PlannedAssignment] = Field(..., min_length=1)
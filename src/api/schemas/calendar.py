@@ -0,0 +1,25 @@
+from datetime import date, time
+from typing import Optional
+from pydantic import BaseModel
+from .session import SessionStatus, SessionType
+
+class CalendarDayResponse(BaseModel):
+    session_day_id: int
+    date: date
+    start_time: time
+    end_time: time
+    day_number: int
+    session_type: SessionType
+    session_id: int
+    session_name: str
+    session_status: SessionStatus
+    course_id: int
+    course_name: str
+    course_code: str
+    location_id: int
+    location_name: str
+    city: Optional[str] = None
+    assignment_count: int
+
+    class Config:
+        from_attributes = True
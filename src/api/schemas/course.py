@@ -28,4 +28,6 @@ class CourseResponse(CourseBase):
 class CourseSearchRequest(BaseModel):
     name: Optional[str] = None
     code: Optional[str] = None
-    active_only: bool = True
\ No newline at end of file
+    active_only: bool = True
+    skip: int = Field(0, ge=0)
+    limit: int = Field(100, ge=1, le=1000)
\ No newline at end of file
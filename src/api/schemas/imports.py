@@ -0,0 +1,12 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+class ImportRowError(BaseModel):
+    row: int
+    field: Optional[str] = None
+    message: str
+
+class ImportReport(BaseModel):
+    rows: int
+    created: int
+    errors: List[ImportRowError] = []
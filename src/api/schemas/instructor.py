@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
-from .rating import InstructorCourseRatingResponse
+from .rating import InstructorCourseRatingResponse, RatingLevel
 from .assignment import InstructorAssignmentResponse
 
 class InstructorBase(BaseModel):
@@ -37,9 +37,17 @@ class InstructorDetailResponse(InstructorResponse):
 
     model_config = ConfigDict(from_attributes=True)
 
+class StaffingCandidateResponse(BaseModel):
+    instructor: InstructorResponse
+    current_load: int
+
+    model_config = ConfigDict(from_attributes=True)
+
 class InstructorSearchRequest(BaseModel):
     name: Optional[str] = None
     email: Optional[str] = None
     active_only: bool = True
     course_id: Optional[int] = None
-    rating_level: Optional[str] = None
\ No newline at end of file
+    rating_level: Optional[RatingLevel] = None
+    skip: int = Field(0, ge=0)
+    limit: int = Field(100, ge=1, le=1000)
\ No newline at end of file
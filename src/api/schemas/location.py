@@ -31,4 +31,6 @@ class LocationResponse(LocationBase):
 class LocationSearchRequest(BaseModel):
     name: Optional[str] = None
     city: Optional[str] = None
-    active_only: bool = True
\ No newline at end of file
+    active_only: bool = True
+    skip: int = Field(0, ge=0)
+    limit: int = Field(100, ge=1, le=1000)
\ No newline at end of file
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+class PayEligibilityRow(BaseModel):
+    instructor_id: int
+    first_name: str
+    last_name: str
+    email: str
+    assignments: int
+    eligible_assignments: int
+    eligible_hours: float
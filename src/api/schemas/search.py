@@ -0,0 +1,10 @@
+from typing import List
+from pydantic import BaseModel
+from .instructor import InstructorResponse
+from .course import CourseResponse
+from .location import LocationResponse
+
+class SearchResults(BaseModel):
+    instructors: List[InstructorResponse] = []
+    courses: List[CourseResponse] = []
+    locations: List[LocationResponse] = []
@@ -1,5 +1,5 @@
 from datetime import date, time, datetime
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from pydantic import BaseModel, Field
 from enum import Enum
 
@@ -37,6 +37,13 @@ class CourseSessionResponse(CourseSessionBase):
     class Config:
         from_attributes = True
 
+class SessionReschedule(BaseModel):
+    offset_days: int = Field(..., ge=-3660, le=3660)
+
+class SessionClone(SessionReschedule):
+    include_assignments: bool = False
+    session_name: Optional[str] = Field(None, min_length=1, max_length=200)
+
 class CourseSessionDayBase(BaseModel):
     session_id: int
     day_number: int = Field(..., ge=1)
@@ -57,15 +64,36 @@ class CourseSessionDayUpdate(BaseModel):
     end_time: Optional[time] = None
     session_type: Optional[SessionType] = None
 
+class SessionDayGenerate(BaseModel):
+    """Recurrence spec for the days of a session; Monday is weekday 0.
+
+    The date range defaults to the session's dates and the number of days to
+    the course's duration_days, rounded up.
+    """
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    weekdays: List[Annotated[int, Field(ge=0, le=6)]] = Field(default=[0, 1, 2, 3, 4], min_length=1)
+    day_count: Optional[int] = Field(None, ge=1, le=1000)
+    location_id: int
+    start_time: time
+    end_time: time
+    session_type: SessionType
+
 class CourseSessionDayResponse(CourseSessionDayBase):
     id: int
 
     class Config:
         from_attributes = True
 
+class CourseSessionDayPage(BaseModel):
+    items: List[CourseSessionDayResponse]
+    next_cursor: Optional[str] = None
+
 class SessionSearchRequest(BaseModel):
     course_id: Optional[int] = None
     status: Optional[SessionStatus] = None
     start_date_from: Optional[date] = None
     start_date_to: Optional[date] = None
-    location_id: Optional[int] = None
\ No newline at end of file
+    location_id: Optional[int] = None
+    skip: int = Field(0, ge=0)
+    limit: int = Field(100, ge=1, le=1000)
\ No newline at end of file
@@ -0,0 +1,59 @@
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime, time
+from typing import AsyncIterator, List, Sequence
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncResult
+
+# Rows fetched from the server-side cursor and written out per chunk
+EXPORT_BATCH_SIZE = 1000
+
+def _plain(value):
+    """Convert a column value to what CSV and JSON writers expect."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    return value
+
+def _csv_chunk(rows: Sequence[Sequence]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_plain(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+def _ndjson_chunk(keys: List[str], rows: Sequence[Sequence]) -> str:
+    return "".join(
+        json.dumps({key: _plain(value) for key, value in zip(keys, row)}) + "\n" for row in rows
+    )
+
+async def csv_chunks(result: AsyncResult) -> AsyncIterator[str]:
+    """Yield a CSV header line, then one chunk of lines per batch of rows from the cursor."""
+    yield _csv_chunk([list(result.keys())])
+    async for rows in result.partitions(EXPORT_BATCH_SIZE):
+        yield _csv_chunk(rows)
+
+async def ndjson_chunks(result: AsyncResult) -> AsyncIterator[str]:
+    """Yield one JSON object per row, newline delimited, a batch of rows per chunk."""
+    keys = list(result.keys())
+    async for rows in result.partitions(EXPORT_BATCH_SIZE):
+        yield _ndjson_chunk(keys, rows)
+
+EXPORT_FORMATS = {
+    "csv": (csv_chunks, "text/csv"),
+    "ndjson": (ndjson_chunks, "application/x-ndjson"),
+}
+
+def export_response(result: AsyncResult, export_format: str, filename: str) -> StreamingResponse:
+    """Stream a result to the client as a CSV or NDJSON attachment.
+
+    Only one batch of rows is held in memory at a time, however large the result.
+    """
+    chunks, media_type = EXPORT_FORMATS[export_format]
+    return StreamingResponse(
+        chunks(result),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'}
+    )
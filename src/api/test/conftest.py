@@ -4,18 +4,32 @@ import os
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from pytest_postgresql.factories import postgresql_proc, postgresql
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
 
-from src.database.connection import Base, get_db_session
+from src.database.connection import (
+    Base, get_db_session, get_async_db_session, create_async_session_factory
+)
 from src.database.models import *
+from src.database.cache import course_cache, location_cache
+from src.database.clearance import clearance_matrix
 from src.api.main import app
 
 # PostgreSQL process and database fixtures
 postgresql_proc = postgresql_proc(port=None, unixsocketdir='/tmp')
 postgresql = postgresql('postgresql_proc')
 
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """Start each test with empty in-process caches, since ids repeat across test databases."""
+    course_cache.clear()
+    location_cache.clear()
+    clearance_matrix.reset()
+    yield
+
 # Create test database engine
 @pytest.fixture(scope="function")
 def test_db_engine(postgresql):
@@ -37,12 +51,30 @@ def test_db_session(test_db_engine):
     session.close()
 
 @pytest.fixture(scope="function")
-def client(test_db_session):
-    """Create test client with database dependency override."""
+def test_async_db_engine(test_db_engine, postgresql):
+    """Create async test database engine on the same PostgreSQL database."""
+    # NullPool keeps asyncpg connections from outliving the client's event loop
+    engine = create_async_engine(
+        f"postgresql+asyncpg://{postgresql.info.user}:@{postgresql.info.host}:{postgresql.info.port}/{postgresql.info.dbname}",
+        poolclass=NullPool,
+        echo=False
+    )
+    yield engine
+    engine.sync_engine.dispose()
+
+@pytest.fixture(scope="function")
+def client(test_db_session, test_async_db_engine):
+    """Create test client with database dependency overrides."""
     def override_get_db():
         return test_db_session
     
+    AsyncTestingSessionLocal = create_async_session_factory(test_async_db_engine)
+    async def override_get_async_db():
+        async with AsyncTestingSessionLocal() as db:
+            yield db
+    
     app.dependency_overrides[get_db_session] = override_get_db
+    app.dependency_overrides[get_async_db_session] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
@@ -0,0 +1,138 @@
+import pytest
+from fastapi.testclient import TestClient
+from datetime import date, time
+from src.database.models import CourseSessionDay, Location, SessionType
+
+@pytest.fixture
+def session_days(test_db_session, sample_session):
+    """Create three consecutive full session days in a room of their own."""
+    annex = Location(location_name="Annex")
+    test_db_session.add(annex)
+    test_db_session.flush()
+    days = []
+    for i in range(3):
+        session_day = CourseSessionDay(
+            session_id=sample_session.id,
+            day_number=i + 1,
+            date=date(2025, 12, 1 + i),
+            location_id=annex.id,
+            start_time=time(9, 0),
+            end_time=time(17, 0),
+            session_type=SessionType.FULL_DAY
+        )
+        test_db_session.add(session_day)
+        days.append(session_day)
+    test_db_session.commit()
+    return days
+
+class TestAssignmentEndpoints:
+    def test_create_assignment(self, client: TestClient, sample_instructor, sample_session_day):
+        """Test creating an assignment."""
+        assignment_data = {
+            "session_day_id": sample_session_day.id,
+            "instructor_id": sample_instructor.id,
+            "assignment_type": "full_day"
+        }
+        
+        response = client.post("/api/v1/assignments/", json=assignment_data)
+        
+        assert response.status_code == 201
+        data = response.json()
+        assert data["session_day_id"] == sample_session_day.id
+        assert data["assignment_status"] == "assigned"
+
+    def test_create_assignment_conflict(self, client: TestClient, sample_assignment):
+        """Test that double-booking an instructor is rejected."""
+        assignment_data = {
+            "session_day_id": sample_assignment.session_day_id,
+            "instructor_id": sample_assignment.instructor_id,
+            "assignment_type": "full_day"
+        }
+        
+        response = client.post("/api/v1/assignments/", json=assignment_data)
+        
+        assert response.status_code == 409
+        assert "1 conflicting" in response.json()["detail"]
+
+    def test_bulk_create_assignments(self, client: TestClient, sample_instructor, session_days):
+        """Test assigning an instructor to several days at once."""
+        bulk_data = {
+            "session_day_ids": [d.id for d in session_days],
+            "instructor_id": sample_instructor.id,
+            "assignment_type": "full_day"
+        }
+        
+        response = client.post("/api/v1/assignments/bulk", json=bulk_data)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert sorted(a["session_day_id"] for a in data) == sorted(d.id for d in session_days)
+
+    def test_bulk_create_assignments_conflict(self, client: TestClient, sample_instructor, session_days):
+        """Test that bulk assignment reports every conflicting day."""
+        client.post("/api/v1/assignments/", json={
+            "session_day_id": session_days[1].id,
+            "instructor_id": sample_instructor.id,
+            "assignment_type": "full_day"
+        })
+        bulk_data = {
+            "session_day_ids": [d.id for d in session_days],
+            "instructor_id": sample_instructor.id,
+            "assignment_type": "full_day"
+        }
+        
+        response = client.post("/api/v1/assignments/bulk", json=bulk_data)
+        
+        assert response.status_code == 409
+        assert str([session_days[1].id]) in response.json()["detail"]
+
+    def test_check_bulk_conflicts(self, client: TestClient, sample_assignment, session_days):
+        """Test the per-day batch conflict report."""
+        check_data = {
+            "instructor_id": sample_assignment.instructor_id,
+            "session_day_ids": [d.id for d in session_days]
+        }
+        
+        response = client.post("/api/v1/assignments/check-conflicts/bulk", json=check_data)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["has_conflicts"] == True
+        # The sample assignment occupies 2025-12-01 09:00-17:00
+        assert data["session_days"][str(session_days[0].id)] == [sample_assignment.id]
+        assert data["session_days"][str(session_days[1].id)] == []
+
+    def test_propose_and_commit_plan(self, client: TestClient, sample_rating, sample_session_day):
+        """Test proposing a plan for unstaffed days and committing it."""
+        plan_request = {"date_from": "2025-12-01", "date_to": "2025-12-31"}
+        
+        response = client.post("/api/v1/assignments/plan", json=plan_request)
+        
+        assert response.status_code == 200
+        plan = response.json()
+        assert plan["assignments"] == [
+            {"session_day_id": sample_session_day.id, "instructor_id": sample_rating.instructor_id}
+        ]
+        assert plan["unfilled_session_day_ids"] == []
+        
+        response = client.post("/api/v1/assignments/plan/commit", json={"assignments": plan["assignments"]})
+        
+        assert response.status_code == 201
+        data = response.json()
+        assert [(a["session_day_id"], a["instructor_id"]) for a in data] == [
+            (sample_session_day.id, sample_rating.instructor_id)
+        ]
+        assert data[0]["assignment_type"] == "full_day"
+        
+        # Committing the same plan again conflicts with the assignment just made
+        response = client.post("/api/v1/assignments/plan/commit", json={"assignments": plan["assignments"]})
+        assert response.status_code == 409
+        assert response.json()["detail"] == [f"Session day {sample_session_day.id} is already staffed"]
+
+    def test_propose_plan_invalid_range(self, client: TestClient):
+        """Test a plan request with the dates reversed is rejected."""
+        plan_request = {"date_from": "2025-12-31", "date_to": "2025-12-01"}
+        
+        response = client.post("/api/v1/assignments/plan", json=plan_request)
+        
+        assert response.status_code == 400
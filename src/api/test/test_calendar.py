@@ -0,0 +1,33 @@
+import pytest
+from fastapi.testclient import TestClient
+
+class TestCalendarEndpoints:
+    def test_get_calendar(self, client: TestClient, sample_assignment, sample_session_day, sample_course, sample_location):
+        """Test the calendar returns each session day with its details and assignment count."""
+        response = client.get("/api/v1/calendar/", params={"start_date": "2025-12-01", "end_date": "2025-12-31"})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["session_day_id"] == sample_session_day.id
+        assert data[0]["date"] == "2025-12-01"
+        assert data[0]["course_code"] == sample_course.course_code
+        assert data[0]["location_name"] == sample_location.location_name
+        assert data[0]["session_status"] == "scheduled"
+        assert data[0]["assignment_count"] == 1
+
+    def test_get_calendar_filters(self, client: TestClient, sample_session_day, sample_location):
+        """Test the calendar can be narrowed to a location or date range."""
+        response = client.get("/api/v1/calendar/", params={
+            "start_date": "2025-12-01", "end_date": "2025-12-31", "location_id": sample_location.id + 1
+        })
+        assert response.json() == []
+        
+        response = client.get("/api/v1/calendar/", params={"start_date": "2025-12-02", "end_date": "2025-12-31"})
+        assert response.json() == []
+
+    def test_get_calendar_invalid_range(self, client: TestClient):
+        """Test a range that ends before it starts is rejected."""
+        response = client.get("/api/v1/calendar/", params={"start_date": "2025-12-31", "end_date": "2025-12-01"})
+        
+        assert response.status_code == 400
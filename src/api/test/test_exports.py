@@ -0,0 +1,92 @@
+import json
+import pytest
+from datetime import date, time, timedelta
+from fastapi.testclient import TestClient
+from src.api import streaming
+from src.database.models import CourseSessionDay, InstructorAssignment, SessionType, AssignmentStatus
+
+class TestExportEndpoints:
+    def test_export_assignments_csv(self, client: TestClient, sample_assignment, sample_session_day):
+        """Test assignments export as CSV with one line per assignment."""
+        response = client.get("/api/v1/exports/assignments")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="assignments.csv"' in response.headers["content-disposition"]
+        lines = response.text.splitlines()
+        assert lines[0].startswith("assignment_id,instructor_id,session_day_id,session_id,course_id,date")
+        fields = lines[1].split(",")
+        assert fields[:3] == [str(sample_assignment.id), str(sample_assignment.instructor_id), str(sample_session_day.id)]
+        assert "2025-12-01,09:00:00,17:00:00" in lines[1]
+        assert "full_day,assigned" in lines[1]
+        assert len(lines) == 2
+
+    def test_export_session_days_ndjson(self, client: TestClient, sample_session_day, sample_session):
+        """Test session days export as newline delimited JSON."""
+        response = client.get("/api/v1/exports/session-days", params={"format": "ndjson"})
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert rows == [{
+            "session_day_id": sample_session_day.id,
+            "session_id": sample_session.id,
+            "course_id": sample_session.course_id,
+            "session_name": "Test Session",
+            "session_status": "scheduled",
+            "day_number": 1,
+            "date": "2025-12-01",
+            "start_time": "09:00:00",
+            "end_time": "17:00:00",
+            "location_id": sample_session_day.location_id,
+            "session_type": "full_day"
+        }]
+
+    def test_export_date_range(self, client: TestClient, sample_assignment):
+        """Test exports only include session days within the date range."""
+        response = client.get("/api/v1/exports/assignments", params={
+            "format": "ndjson", "date_from": "2025-12-02"
+        })
+        
+        assert response.status_code == 200
+        assert response.text == ""
+        
+        response = client.get("/api/v1/exports/assignments", params={
+            "date_from": "2025-12-02", "date_to": "2025-12-01"
+        })
+        assert response.status_code == 400
+
+    def test_export_invalid_format(self, client: TestClient):
+        """Test unsupported export formats are rejected."""
+        response = client.get("/api/v1/exports/assignments", params={"format": "xml"})
+        
+        assert response.status_code == 422
+
+    def test_export_streams_in_batches(self, client: TestClient, test_db_session, sample_session,
+                                       sample_location, sample_instructor, monkeypatch):
+        """Test every row is exported when the result spans several batches."""
+        monkeypatch.setattr(streaming, "EXPORT_BATCH_SIZE", 3)
+        days = [
+            CourseSessionDay(
+                session_id=sample_session.id, day_number=n + 1, date=date(2025, 12, 1) + timedelta(days=n),
+                location_id=sample_location.id, start_time=time(9, 0), end_time=time(17, 0),
+                session_type=SessionType.FULL_DAY
+            )
+            for n in range(10)
+        ]
+        test_db_session.add_all(days)
+        test_db_session.flush()
+        test_db_session.add_all([
+            InstructorAssignment(
+                session_day_id=day.id, instructor_id=sample_instructor.id,
+                assignment_type=SessionType.FULL_DAY, assignment_status=AssignmentStatus.ASSIGNED
+            )
+            for day in days
+        ])
+        test_db_session.commit()
+        
+        response = client.get("/api/v1/exports/assignments", params={"format": "ndjson"})
+        
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["session_day_id"] for row in rows] == [day.id for day in days]
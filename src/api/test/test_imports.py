@@ -0,0 +1,117 @@
+import json
+import pytest
+from fastapi.testclient import TestClient
+from src.database.models import Instructor, Course, CourseSession
+
+def upload(client: TestClient, kind: str, content: str, format: str = "csv"):
+    return client.post(
+        f"/api/v1/imports/{kind}", params={"format": format},
+        files={"file": (f"{kind}.{format}", content.encode(), "text/plain")}
+    )
+
+class TestImportEndpoints:
+    def test_import_instructors_csv(self, client: TestClient, test_db_session):
+        """Test valid CSV rows are all created."""
+        content = (
+            "first_name,last_name,email,phone_number,call_sign\n"
+            "Ann,Able,ann@example.com,555-0001,Alpha\n"
+            "Bob,Baker,bob@example.com,,\n"
+        )
+        response = upload(client, "instructors", content)
+        
+        assert response.status_code == 200
+        assert response.json() == {"rows": 2, "created": 2, "errors": []}
+        instructors = test_db_session.query(Instructor).order_by(Instructor.email).all()
+        assert [(i.first_name, i.call_sign, i.phone_number) for i in instructors] == [
+            ("Ann", "Alpha", "555-0001"), ("Bob", None, None)
+        ]
+        assert all(i.active_status for i in instructors)
+
+    def test_import_reports_row_errors(self, client: TestClient, test_db_session, sample_instructor):
+        """Test invalid and conflicting rows are skipped and reported by row number."""
+        content = (
+            "first_name,last_name,email\n"
+            "Ann,Able,ann@example.com\n"
+            ",Blank,blank@example.com\n"
+            "Cal,Carter,not-an-email\n"
+            "John,Doe,john.doe@example.com\n"
+            "Ann,Again,ann@example.com\n"
+            "Dee,Dunn,dee@example.com\n"
+        )
+        response = upload(client, "instructors", content)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["rows"] == 6
+        assert data["created"] == 2
+        assert [(e["row"], e["field"]) for e in data["errors"]] == [
+            (2, "first_name"), (3, "email"), (4, "email"), (5, "email")
+        ]
+        assert "already exists" in data["errors"][2]["message"]
+        assert "more than once" in data["errors"][3]["message"]
+        emails = {i.email for i in test_db_session.query(Instructor).all()}
+        assert emails == {"john.doe@example.com", "ann@example.com", "dee@example.com"}
+
+    def test_import_courses_ndjson(self, client: TestClient, test_db_session):
+        """Test NDJSON uploads, including lines that are not valid JSON."""
+        content = "\n".join([
+            json.dumps({"course_name": "Alpha Course", "course_code": "AC101", "duration_days": 2}),
+            "{not json",
+            "",
+            json.dumps({"course_name": "Beta Course", "course_code": "BC101", "duration_days": 0.5}),
+        ])
+        response = upload(client, "courses", content, "ndjson")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["rows"] == 3
+        assert data["created"] == 2
+        assert [e["row"] for e in data["errors"]] == [2]
+        assert data["errors"][0]["message"].startswith("Invalid JSON")
+        assert {c.course_code for c in test_db_session.query(Course).all()} == {"AC101", "BC101"}
+
+    def test_import_sessions_checks_course(self, client: TestClient, test_db_session, sample_course):
+        """Test session rows must reference an existing course and have valid dates."""
+        content = (
+            "course_id,session_name,start_date,end_date\n"
+            f"{sample_course.id},Winter Session,2030-01-10,2030-01-12\n"
+            "999999,Unknown Course,2030-01-10,2030-01-12\n"
+            f"{sample_course.id},Backwards,2030-01-12,2030-01-10\n"
+        )
+        response = upload(client, "sessions", content)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 1
+        assert [(e["row"], e["field"]) for e in data["errors"]] == [(2, "course_id"), (3, "end_date")]
+        sessions = test_db_session.query(CourseSession).all()
+        assert [s.session_name for s in sessions] == ["Winter Session"]
+
+    def test_import_in_batches(self, client: TestClient, test_db_session, monkeypatch):
+        """Test rows are checked against earlier batches of the same import."""
+        from src.api.routes import imports
+        monkeypatch.setattr(imports, "IMPORT_BATCH_SIZE", 2)
+        content = "location_name,city\n" + "".join(f"Site {n},City {n}\n" for n in range(5))
+        response = upload(client, "locations", content)
+        
+        assert response.json() == {"rows": 5, "created": 5, "errors": []}
+        
+        content = "course_name,course_code,duration_days\nOne,X1,1\nTwo,X2,1\nThree,X1,1\n"
+        response = upload(client, "courses", content)
+        assert response.json()["created"] == 2
+        assert [e["row"] for e in response.json()["errors"]] == [3]
+
+    def test_import_unknown_kind(self, client: TestClient):
+        """Test only supported tables can be imported."""
+        response = upload(client, "ratings", "a,b\n1,2\n")
+        
+        assert response.status_code == 422
+
+    def test_import_rejects_unreadable_file(self, client: TestClient):
+        """Test files that are not UTF-8 text are rejected."""
+        response = client.post(
+            "/api/v1/imports/instructors",
+            files={"file": ("instructors.csv", b"first_name\n\xff\xfe\n", "text/csv")}
+        )
+        
+        assert response.status_code == 400
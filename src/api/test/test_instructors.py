@@ -89,6 +89,15 @@ class TestInstructorEndpoints:
         assert "course_ratings" in data
         assert "assignments" in data
 
+    def test_get_instructor_with_details(self, client: TestClient, sample_rating, sample_assignment):
+        """Test the detail response includes ratings and assignments."""
+        response = client.get(f"/api/v1/instructors/{sample_assignment.instructor_id}")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["id"] for r in data["course_ratings"]] == [sample_rating.id]
+        assert [a["id"] for a in data["assignments"]] == [sample_assignment.id]
+
     def test_get_instructor_not_found(self, client: TestClient):
         """Test getting non-existent instructor returns 404."""
         response = client.get("/api/v1/instructors/99999")
@@ -182,6 +191,25 @@ class TestInstructorEndpoints:
         assert len(data) == 1
         assert data[0]["email"] == sample_instructor.email
 
+    def test_search_instructors_by_course_rating(self, client: TestClient, sample_rating, sample_course):
+        """Test searching instructors cleared for a course."""
+        search_data = {"course_id": sample_course.id, "rating_level": "cleared"}
+        
+        response = client.post("/api/v1/instructors/search", json=search_data)
+        
+        assert response.status_code == 200
+        assert [i["id"] for i in response.json()] == [sample_rating.instructor_id]
+        
+        search_data["rating_level"] = "observe"
+        response = client.post("/api/v1/instructors/search", json=search_data)
+        assert response.json() == []
+
+    def test_search_instructors_invalid_rating_level(self, client: TestClient):
+        """Test an unknown rating level is rejected."""
+        response = client.post("/api/v1/instructors/search", json={"rating_level": "expert"})
+        
+        assert response.status_code == 422
+
     def test_pagination(self, client: TestClient, sample_instructor):
         """Test instructor list pagination."""
         # Test with limit
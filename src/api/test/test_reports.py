@@ -0,0 +1,51 @@
+import pytest
+from fastapi.testclient import TestClient
+
+class TestReportEndpoints:
+    def test_pay_eligibility(self, client: TestClient, sample_rating, sample_assignment):
+        """Test the pay eligibility report totals cleared hours per instructor."""
+        response = client.get("/api/v1/reports/pay-eligibility", params={
+            "date_from": "2025-12-01", "date_to": "2025-12-31"
+        })
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["instructor_id"] == sample_assignment.instructor_id
+        assert data[0]["assignments"] == 1
+        assert data[0]["eligible_assignments"] == 1
+        assert data[0]["eligible_hours"] == 8.0
+
+    def test_pay_eligibility_uncleared(self, client: TestClient, sample_assignment):
+        """Test assignments without a cleared rating count but are not eligible."""
+        response = client.get("/api/v1/reports/pay-eligibility", params={
+            "date_from": "2025-12-01", "date_to": "2025-12-31"
+        })
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data[0]["assignments"] == 1
+        assert data[0]["eligible_assignments"] == 0
+        assert data[0]["eligible_hours"] == 0.0
+
+    def test_pay_eligibility_invalid_range(self, client: TestClient):
+        """Test a date range that ends before it starts is rejected."""
+        response = client.get("/api/v1/reports/pay-eligibility", params={
+            "date_from": "2025-12-31", "date_to": "2025-12-01"
+        })
+        
+        assert response.status_code == 400
+
+    def test_export_pay_eligibility_csv(self, client: TestClient, sample_rating, sample_assignment):
+        """Test the pay eligibility export streams CSV with a header row."""
+        response = client.get("/api/v1/reports/pay-eligibility.csv", params={
+            "date_from": "2025-12-01", "date_to": "2025-12-31"
+        })
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "attachment" in response.headers["content-disposition"]
+        lines = response.text.splitlines()
+        assert lines[0] == "instructor_id,first_name,last_name,email,assignments,eligible_assignments,eligible_hours"
+        assert lines[1] == f"{sample_assignment.instructor_id},John,Doe,john.doe@example.com,1,1,8.0"
+        assert len(lines) == 2
@@ -0,0 +1,30 @@
+import pytest
+from fastapi.testclient import TestClient
+
+class TestSearchEndpoints:
+    def test_search_across_categories(self, client: TestClient, sample_instructor, sample_course, sample_location):
+        """Test typeahead search returns matches from each category."""
+        response = client.get("/api/v1/search/", params={"q": "jo"})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [i["id"] for i in data["instructors"]] == [sample_instructor.id]
+        assert data["courses"] == []
+        assert data["locations"] == []
+
+    def test_search_prefix_matches(self, client: TestClient, sample_course, sample_location):
+        """Test each word of the query matches as a prefix."""
+        response = client.get("/api/v1/search/", params={"q": "train"})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [l["id"] for l in data["locations"]] == [sample_location.id]
+        
+        response = client.get("/api/v1/search/", params={"q": "bfs1"})
+        assert [c["id"] for c in response.json()["courses"]] == [sample_course.id]
+
+    def test_search_requires_query(self, client: TestClient):
+        """Test search without a query is rejected."""
+        response = client.get("/api/v1/search/")
+        
+        assert response.status_code == 422
@@ -99,6 +99,58 @@ class TestSessionDayEndpoints:
         assert response.status_code == 400
         assert "Invalid session times" in response.json()["detail"]
 
+    def test_generate_session_days(self, client: TestClient, sample_session, sample_location):
+        """Test generating a session's days from its dates and the course duration."""
+        spec = {
+            "location_id": sample_location.id,
+            "start_time": "09:00:00",
+            "end_time": "17:00:00",
+            "session_type": "full_day"
+        }
+        
+        response = client.post(f"/api/v1/sessions/{sample_session.id}/days/generate", json=spec)
+        
+        assert response.status_code == 201
+        data = response.json()
+        # The course runs for two days and the session starts on Monday 2025-12-01
+        assert [(d["day_number"], d["date"]) for d in data] == [(1, "2025-12-01"), (2, "2025-12-02")]
+        
+        # A weekly run for a year continues the numbering
+        response = client.post(f"/api/v1/sessions/{sample_session.id}/days/generate", json={
+            **spec, "start_date": "2025-12-01", "end_date": "2026-11-30", "weekdays": [2], "day_count": 52
+        })
+        
+        assert response.status_code == 201
+        data = response.json()
+        assert len(data) == 52
+        assert (data[0]["day_number"], data[0]["date"]) == (3, "2025-12-03")
+        assert (data[-1]["day_number"], data[-1]["date"]) == (54, "2026-11-25")
+
+    def test_generate_session_days_rejected(self, client: TestClient, sample_session, sample_session_day):
+        """Test that a spec that does not fit or clashes writes nothing."""
+        spec = {
+            "location_id": sample_session_day.location_id,
+            "start_time": "13:00:00",
+            "end_time": "17:00:00",
+            "session_type": "half_day"
+        }
+        
+        response = client.post(f"/api/v1/sessions/{sample_session.id}/days/generate", json={
+            **spec, "weekdays": [5, 6]
+        })
+        assert response.status_code == 400
+        assert "Only 0 of 2 days" in response.json()["detail"]
+        
+        response = client.post(f"/api/v1/sessions/{sample_session.id}/days/generate", json={
+            **spec, "location_id": 99999
+        })
+        assert response.status_code == 404
+        
+        response = client.post(f"/api/v1/sessions/{sample_session.id}/days/generate", json=spec)
+        assert response.status_code == 409
+        assert [d["id"] for d in response.json()["detail"]["session_days"]] == [sample_session_day.id]
+        assert len(client.get(f"/api/v1/sessions/{sample_session.id}/days").json()) == 1
+
     def test_get_session_days(self, client: TestClient, sample_session, sample_location):
         """Test retrieving all session days for a session."""
         # Create multiple session days
@@ -195,6 +247,60 @@ class TestSessionDayEndpoints:
         assert data["session_type"] == "half_day"
         assert data["id"] == created_day["id"]
 
+    def test_location_double_booking(self, client: TestClient, sample_session, sample_location):
+        """Test that overlapping days in one location are rejected with the clashing days."""
+        session_day_data = {
+            "session_id": sample_session.id,
+            "day_number": 1,
+            "date": "2024-10-02",
+            "location_id": sample_location.id,
+            "start_time": "09:00:00",
+            "end_time": "12:00:00",
+            "session_type": "half_day"
+        }
+        booked = client.post(f"/api/v1/sessions/{sample_session.id}/days", json=session_day_data).json()
+        afternoon = client.post(f"/api/v1/sessions/{sample_session.id}/days", json={
+            **session_day_data, "day_number": 2, "start_time": "12:00:00", "end_time": "17:00:00"
+        }).json()
+        
+        response = client.post(f"/api/v1/sessions/{sample_session.id}/days", json={
+            **session_day_data, "day_number": 3, "start_time": "11:00:00", "end_time": "13:00:00"
+        })
+        
+        assert response.status_code == 409
+        detail = response.json()["detail"]
+        assert detail["message"] == f"Location {sample_location.id} is already booked at that time"
+        assert [d["id"] for d in detail["session_days"]] == [booked["id"], afternoon["id"]]
+        assert detail["session_days"][0]["start_time"] == "09:00:00"
+        
+        response = client.put(f"/api/v1/sessions/session-days/{afternoon['id']}", json={"start_time": "10:00:00"})
+        
+        assert response.status_code == 409
+        assert [d["id"] for d in response.json()["detail"]["session_days"]] == [booked["id"]]
+
+    def test_update_session_day_double_books_instructor(self, client: TestClient, sample_assignment, sample_session):
+        """Test that moving a day onto another of its instructor's days is rejected."""
+        annex = client.post("/api/v1/locations/", json={"location_name": "Annex"}).json()
+        evening = client.post(f"/api/v1/sessions/{sample_session.id}/days", json={
+            "session_id": sample_session.id,
+            "day_number": 2,
+            "date": "2025-12-01",
+            "location_id": annex["id"],
+            "start_time": "17:00:00",
+            "end_time": "20:00:00",
+            "session_type": "half_day"
+        }).json()
+        client.post("/api/v1/assignments/", json={
+            "session_day_id": evening["id"],
+            "instructor_id": sample_assignment.instructor_id,
+            "assignment_type": "half_day"
+        })
+        
+        response = client.put(f"/api/v1/sessions/session-days/{evening['id']}", json={"start_time": "16:00:00"})
+        
+        assert response.status_code == 409
+        assert str([evening["id"]]) in response.json()["detail"]
+
     def test_update_session_day_not_found(self, client: TestClient):
         """Test updating non-existent session day."""
         update_data = {
@@ -390,4 +496,60 @@ class TestSessionDayEndpoints:
         # Test with skip
         response = client.get("/api/v1/sessions/session-days?skip=2&limit=3")
         
-        assert response.status_code == 200
\ No newline at end of file
+        assert response.status_code == 200
+
+    def test_scroll_session_days(self, client: TestClient, sample_session, sample_location):
+        """Test paging through session days with a cursor."""
+        for i in range(5):
+            session_day_data = {
+                "session_id": sample_session.id,
+                "day_number": i + 1,
+                "date": f"2024-12-{10 + i:02d}",
+                "location_id": sample_location.id,
+                "start_time": "09:00:00",
+                "end_time": "17:00:00",
+                "session_type": "full_day"
+            }
+            client.post(f"/api/v1/sessions/{sample_session.id}/days", json=session_day_data)
+        
+        response = client.get("/api/v1/sessions/session-days/scroll?limit=3")
+        assert response.status_code == 200
+        first_page = response.json()
+        assert [d["date"] for d in first_page["items"]] == ["2024-12-10", "2024-12-11", "2024-12-12"]
+        assert first_page["next_cursor"] is not None
+        
+        response = client.get(
+            "/api/v1/sessions/session-days/scroll",
+            params={"limit": 3, "cursor": first_page["next_cursor"]}
+        )
+        second_page = response.json()
+        assert [d["date"] for d in second_page["items"]] == ["2024-12-13", "2024-12-14"]
+        assert second_page["next_cursor"] is None
+
+    def test_scroll_session_days_invalid_cursor(self, client: TestClient):
+        """Test that a malformed cursor is rejected."""
+        response = client.get("/api/v1/sessions/session-days/scroll?cursor=bogus")
+        
+        assert response.status_code == 400
+
+    def test_get_staffing_candidates(self, client: TestClient, sample_rating, sample_session_day):
+        """Test listing cleared, available instructors for a session day."""
+        response = client.get(f"/api/v1/sessions/session-days/{sample_session_day.id}/candidates")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert [c["instructor"]["id"] for c in data] == [sample_rating.instructor_id]
+        assert data[0]["current_load"] == 0
+
+    def test_get_staffing_candidates_excludes_assigned(self, client: TestClient, sample_rating, sample_assignment):
+        """Test instructors already assigned at that time are not candidates."""
+        response = client.get(f"/api/v1/sessions/session-days/{sample_assignment.session_day_id}/candidates")
+        
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_get_staffing_candidates_not_found(self, client: TestClient):
+        """Test candidates for a non-existent session day returns 404."""
+        response = client.get("/api/v1/sessions/session-days/99999/candidates")
+        
+        assert response.status_code == 404
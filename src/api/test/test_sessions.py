@@ -1,6 +1,7 @@
 import pytest
-from datetime import date
+from datetime import date, time, timedelta
 from fastapi.testclient import TestClient
+from src.database.models import CourseSession, CourseSessionDay, SessionType
 
 class TestSessionEndpoints:
     def test_create_course_session(self, client: TestClient, sample_course):
@@ -161,6 +162,30 @@ class TestSessionEndpoints:
         assert response.status_code == 200
         assert "completed" in response.json()["message"]
 
+    def test_reinstating_double_booked_session(self, client: TestClient, test_db_session, sample_session_day):
+        """A cancelled session releases its room, so reinstating it can clash."""
+        session_id = sample_session_day.session_id
+        response = client.patch(f"/api/v1/sessions/{session_id}/status?status=cancelled")
+        assert response.status_code == 200
+
+        other = CourseSession(
+            course_id=sample_session_day.session.course_id, session_name="Other",
+            start_date=date(2025, 12, 1), end_date=date(2025, 12, 1)
+        )
+        test_db_session.add(other)
+        test_db_session.flush()
+        test_db_session.add(CourseSessionDay(
+            session_id=other.id, day_number=1, date=date(2025, 12, 1), location_id=sample_session_day.location_id,
+            start_time=time(10, 0), end_time=time(12, 0), session_type=SessionType.HALF_DAY
+        ))
+        test_db_session.commit()
+
+        response = client.patch(f"/api/v1/sessions/{session_id}/status?status=scheduled")
+
+        assert response.status_code == 409
+        assert len(response.json()["detail"]) == 1
+        assert client.get(f"/api/v1/sessions/{session_id}").json()["status"] == "cancelled"
+
     def test_search_sessions(self, client: TestClient, sample_course, sample_session):
         """Test searching sessions."""
         search_data = {
@@ -196,6 +221,18 @@ class TestSessionEndpoints:
             session_start = session["start_date"]
             assert "2025-01-01" <= session_start <= "2025-12-31"
 
+    def test_search_sessions_by_location(self, client: TestClient, sample_session_day):
+        """Test searching sessions held at a location, with pagination."""
+        search_data = {"location_id": sample_session_day.location_id, "limit": 10}
+        
+        response = client.post("/api/v1/sessions/search", json=search_data)
+        
+        assert response.status_code == 200
+        assert [s["id"] for s in response.json()] == [sample_session_day.session_id]
+        
+        response = client.post("/api/v1/sessions/search", json={"location_id": 99999})
+        assert response.json() == []
+
     def test_get_session_days_empty(self, client: TestClient, sample_session):
         """Test getting session days for a session with no days."""
         response = client.get(f"/api/v1/sessions/{sample_session.id}/days")
@@ -251,4 +288,54 @@ class TestSessionEndpoints:
         response = client.put(f"/api/v1/sessions/{sample_session.id}", json=update_data)
         
         assert response.status_code == 400
-        assert "Invalid session dates" in response.json()["detail"]
\ No newline at end of file
+        assert "Invalid session dates" in response.json()["detail"]
+
+    def test_reschedule_session(self, client: TestClient, sample_session, sample_assignment):
+        """Test moving a session with its days and assignments."""
+        start = date.today() + timedelta(days=7)
+        offset = (start - sample_session.start_date).days
+        response = client.post(f"/api/v1/sessions/{sample_session.id}/reschedule", json={"offset_days": offset})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["start_date"], data["end_date"]) == (str(start), str(start + timedelta(days=2)))
+        days = client.get(f"/api/v1/sessions/{sample_session.id}/days").json()
+        assert [d["date"] for d in days] == [str(start)]
+        assignment = client.get(f"/api/v1/assignments/{sample_assignment.id}").json()
+        assert assignment["session_day_id"] == days[0]["id"]
+        
+        response = client.post("/api/v1/sessions/99999/reschedule", json={"offset_days": 1})
+        assert response.status_code == 404
+
+    def test_reschedule_session_into_past(self, client: TestClient, sample_session):
+        """Test that a session cannot be moved or copied onto past dates."""
+        offset = (date.today() - sample_session.start_date).days - 1
+        for action in ("reschedule", "clone"):
+            response = client.post(f"/api/v1/sessions/{sample_session.id}/{action}", json={"offset_days": offset})
+            
+            assert response.status_code == 400
+            assert "Invalid session dates" in response.json()["detail"]
+        assert client.get(f"/api/v1/sessions/{sample_session.id}").json()["start_date"] == "2025-12-01"
+        assert len(client.get("/api/v1/sessions/").json()) == 1
+
+    def test_clone_session(self, client: TestClient, sample_session, sample_assignment):
+        """Test copying a session with its days and assignments."""
+        start = date.today() + timedelta(days=7)
+        offset = (start - sample_session.start_date).days
+        response = client.post(f"/api/v1/sessions/{sample_session.id}/clone", json={
+            "offset_days": offset, "include_assignments": True, "session_name": "Next Week"
+        })
+        
+        assert response.status_code == 201
+        data = response.json()
+        assert data["id"] != sample_session.id
+        assert (data["session_name"], data["start_date"], data["status"]) == ("Next Week", str(start), "scheduled")
+        days = client.get(f"/api/v1/sessions/{data['id']}/days").json()
+        assert [d["date"] for d in days] == [str(start)]
+        assignments = client.get(f"/api/v1/assignments/?instructor_id={sample_assignment.instructor_id}").json()
+        assert sorted(a["session_day_id"] for a in assignments) == [sample_assignment.session_day_id, days[0]["id"]]
+        
+        # Copying onto the same dates clashes with the copied day
+        response = client.post(f"/api/v1/sessions/{data['id']}/clone", json={"offset_days": 0})
+        assert response.status_code == 409
+        assert f"would overlap session day {days[0]['id']}" in response.json()["detail"][0]
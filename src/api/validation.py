@@ -0,0 +1,8 @@
+from datetime import date
+from typing import Optional
+from fastapi import HTTPException
+
+def check_date_range(date_from: Optional[date], date_to: Optional[date]):
+    """Reject a date range that ends before it starts; either end may be open."""
+    if date_from and date_to and date_to < date_from:
+        raise HTTPException(status_code=400, detail="Invalid date range")
@@ -0,0 +1,59 @@
+from logging.config import fileConfig
+import sys
+import os
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from src.database.connection import Base, get_database_url
+from src.database import models  # noqa: F401 - registers the tables on Base.metadata
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+def run_migrations_offline():
+    """Emit migration SQL to stdout without connecting to the database."""
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url") or get_database_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_with_connection(connection):
+    context.configure(connection=connection, target_metadata=target_metadata)
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online():
+    """Run migrations against a live database.
+
+    Callers such as tests may pass an open connection via config.attributes;
+    otherwise one is made from the DB_* environment variables.
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        run_migrations_with_connection(connection)
+        return
+
+    engine = create_engine(
+        config.get_main_option("sqlalchemy.url") or get_database_url(),
+        poolclass=pool.NullPool
+    )
+    with engine.connect() as connection:
+        run_migrations_with_connection(connection)
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
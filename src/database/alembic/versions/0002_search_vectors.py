@@ -0,0 +1,58 @@
+"""search vectors
+
+Adds generated tsvector columns with GIN indexes for ranked name search on
+instructors, courses and locations.
+
+Adding a STORED generated column rewrites the whole table under an ACCESS
+EXCLUSIVE lock, so each of the three tables is unreadable and unwritable
+while its rows are rewritten. They hold reference data and are small, but on
+a large installation run this revision in a quiet period. The GIN indexes are
+built CONCURRENTLY outside the migration transaction, so they do not block
+writes while they build.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 09:02:41.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTORS = {
+    'instructors': ('first_name', 'last_name', 'call_sign'),
+    'courses': ('course_name', 'course_code'),
+    'locations': ('location_name', 'city'),
+}
+
+
+def upgrade():
+    for table, columns in SEARCH_VECTORS.items():
+        document = " || ' ' || ".join(f"coalesce({name}, '')" for name in columns)
+        op.add_column(table, sa.Column(
+            'search_vector', postgresql.TSVECTOR(),
+            sa.Computed(f"to_tsvector('simple'::regconfig, {document})", persisted=True),
+            nullable=True
+        ))
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction; the block
+    # commits the columns added above first
+    with op.get_context().autocommit_block():
+        for table in SEARCH_VECTORS:
+            op.create_index(f'ix_{table}_search_vector', table, ['search_vector'], unique=False,
+                            postgresql_using='gin', postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for table in SEARCH_VECTORS:
+            op.drop_index(f'ix_{table}_search_vector', table_name=table, postgresql_using='gin',
+                          postgresql_concurrently=True)
+    for table in SEARCH_VECTORS:
+        op.drop_column(table, 'search_vector')
@@ -0,0 +1,179 @@
+"""calendar days
+
+Adds the calendar_days read model: one row per session day with its session,
+course, location and assignment count, kept current by triggers and backfilled
+from the existing schedule.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 13:26:08.402317
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION calendar_days_refresh(day_ids integer[]) RETURNS void AS $$
+    BEGIN
+        DELETE FROM calendar_days WHERE session_day_id = ANY(day_ids);
+        INSERT INTO calendar_days (
+            session_day_id, date, start_time, end_time, day_number, session_type,
+            session_id, session_name, session_status, course_id, course_name, course_code,
+            location_id, location_name, city, assignment_count
+        )
+        SELECT d.id, d.date, d.start_time, d.end_time, d.day_number, d.session_type,
+               s.id, s.session_name, s.status, c.id, c.course_name, c.course_code,
+               l.id, l.location_name, l.city,
+               (SELECT count(*) FROM instructor_assignments a
+                WHERE a.session_day_id = d.id AND a.assignment_status <> 'CANCELLED')
+        FROM session_days d
+        JOIN course_sessions s ON s.id = d.session_id
+        JOIN courses c ON c.id = s.course_id
+        JOIN locations l ON l.id = d.location_id
+        WHERE d.id = ANY(day_ids);
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION calendar_days_session_day_changed() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM calendar_days WHERE session_day_id = OLD.id;
+        ELSE
+            PERFORM calendar_days_refresh(ARRAY[NEW.id]);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION calendar_days_assignment_changed() RETURNS trigger AS $$
+    DECLARE
+        day_ids integer[];
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            day_ids := ARRAY[NEW.session_day_id];
+        ELSIF TG_OP = 'DELETE' THEN
+            day_ids := ARRAY[OLD.session_day_id];
+        ELSE
+            day_ids := ARRAY[OLD.session_day_id, NEW.session_day_id];
+        END IF;
+        UPDATE calendar_days cd SET assignment_count = (
+            SELECT count(*) FROM instructor_assignments a
+            WHERE a.session_day_id = cd.session_day_id AND a.assignment_status <> 'CANCELLED'
+        )
+        WHERE cd.session_day_id = ANY(day_ids);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION calendar_days_session_changed() RETURNS trigger AS $$
+    BEGIN
+        PERFORM calendar_days_refresh(ARRAY(SELECT id FROM session_days WHERE session_id = NEW.id));
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION calendar_days_course_changed() RETURNS trigger AS $$
+    BEGIN
+        UPDATE calendar_days SET course_name = NEW.course_name, course_code = NEW.course_code
+        WHERE course_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION calendar_days_location_changed() RETURNS trigger AS $$
+    BEGIN
+        UPDATE calendar_days SET location_name = NEW.location_name, city = NEW.city
+        WHERE location_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+]
+
+TRIGGERS = [
+    """
+    CREATE OR REPLACE TRIGGER calendar_days_session_days
+    AFTER INSERT OR UPDATE OR DELETE ON session_days
+    FOR EACH ROW EXECUTE FUNCTION calendar_days_session_day_changed()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER calendar_days_instructor_assignments
+    AFTER INSERT OR UPDATE OF session_day_id, assignment_status OR DELETE ON instructor_assignments
+    FOR EACH ROW EXECUTE FUNCTION calendar_days_assignment_changed()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER calendar_days_course_sessions
+    AFTER UPDATE OF course_id, session_name, status ON course_sessions
+    FOR EACH ROW EXECUTE FUNCTION calendar_days_session_changed()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER calendar_days_courses
+    AFTER UPDATE OF course_name, course_code ON courses
+    FOR EACH ROW EXECUTE FUNCTION calendar_days_course_changed()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER calendar_days_locations
+    AFTER UPDATE OF location_name, city ON locations
+    FOR EACH ROW EXECUTE FUNCTION calendar_days_location_changed()
+    """,
+]
+
+DROP = [
+    "DROP FUNCTION IF EXISTS calendar_days_session_day_changed() CASCADE",
+    "DROP FUNCTION IF EXISTS calendar_days_assignment_changed() CASCADE",
+    "DROP FUNCTION IF EXISTS calendar_days_session_changed() CASCADE",
+    "DROP FUNCTION IF EXISTS calendar_days_course_changed() CASCADE",
+    "DROP FUNCTION IF EXISTS calendar_days_location_changed() CASCADE",
+    "DROP FUNCTION IF EXISTS calendar_days_refresh(integer[])",
+]
+
+
+def upgrade():
+    op.create_table('calendar_days',
+    sa.Column('session_day_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('start_time', sa.Time(), nullable=False),
+    sa.Column('end_time', sa.Time(), nullable=False),
+    sa.Column('day_number', sa.Integer(), nullable=False),
+    sa.Column('session_type', postgresql.ENUM('HALF_DAY', 'FULL_DAY', name='sessiontype', create_type=False), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('session_name', sa.String(length=200), nullable=False),
+    sa.Column('session_status', postgresql.ENUM('SCHEDULED', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED', name='sessionstatus', create_type=False), nullable=False),
+    sa.Column('course_id', sa.Integer(), nullable=False),
+    sa.Column('course_name', sa.String(length=200), nullable=False),
+    sa.Column('course_code', sa.String(length=50), nullable=False),
+    sa.Column('location_id', sa.Integer(), nullable=False),
+    sa.Column('location_name', sa.String(length=200), nullable=False),
+    sa.Column('city', sa.String(length=100), nullable=True),
+    sa.Column('assignment_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('session_day_id')
+    )
+    op.create_index('ix_calendar_days_date_start_time', 'calendar_days', ['date', 'start_time', 'session_day_id'], unique=False)
+    op.create_index('ix_calendar_days_location_id_date', 'calendar_days', ['location_id', 'date'], unique=False)
+    op.create_index('ix_calendar_days_course_id_date', 'calendar_days', ['course_id', 'date'], unique=False)
+    for statement in FUNCTIONS + TRIGGERS:
+        op.execute(statement)
+    op.execute("SELECT calendar_days_refresh(ARRAY(SELECT id FROM session_days))")
+
+
+def downgrade():
+    for statement in DROP:
+        op.execute(statement)
+    op.drop_index('ix_calendar_days_course_id_date', table_name='calendar_days')
+    op.drop_index('ix_calendar_days_location_id_date', table_name='calendar_days')
+    op.drop_index('ix_calendar_days_date_start_time', table_name='calendar_days')
+    op.drop_table('calendar_days')
@@ -0,0 +1,41 @@
+"""location booking exclusion
+
+Adds a generated tsrange booking column to session_days and an EXCLUDE
+constraint that stops two session days at one location from overlapping.
+Existing overlaps make the upgrade fail with the clashing rows named in the
+error; move or delete one day of each pair before upgrading, as days of
+cancelled sessions still hold their rooms until revision 0006.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 14:02:53.771920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('session_days', sa.Column(
+        'booking', postgresql.TSRANGE(),
+        sa.Computed('tsrange(date + start_time, date + end_time)', persisted=True),
+        nullable=True
+    ))
+    op.execute(
+        "ALTER TABLE session_days ADD CONSTRAINT ex_session_days_location_booking "
+        "EXCLUDE USING gist (int4range(location_id, location_id, '[]') WITH &&, booking WITH &&) "
+        "DEFERRABLE INITIALLY IMMEDIATE"
+    )
+
+
+def downgrade():
+    op.drop_constraint('ex_session_days_location_booking', 'session_days')
+    op.drop_column('session_days', 'booking')
@@ -0,0 +1,84 @@
+"""assignment booking exclusion
+
+Copies each session day's booking range onto its instructor assignments,
+kept current by triggers, and adds an EXCLUDE constraint that stops an
+instructor holding two overlapping assignments. Existing double bookings
+make the upgrade fail with the clashing rows named in the error; move or
+delete one assignment of each pair before upgrading, as cancelled
+assignments still count until revision 0008.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 15:11:40.218364
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION assignment_booking_set() RETURNS trigger AS $$
+    BEGIN
+        SELECT booking INTO NEW.booking FROM session_days WHERE id = NEW.session_day_id FOR SHARE;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION assignment_booking_session_day_moved() RETURNS trigger AS $$
+    BEGIN
+        UPDATE instructor_assignments SET booking = NEW.booking WHERE session_day_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+]
+
+TRIGGERS = [
+    """
+    CREATE OR REPLACE TRIGGER assignment_booking_instructor_assignments
+    BEFORE INSERT OR UPDATE OF session_day_id ON instructor_assignments
+    FOR EACH ROW EXECUTE FUNCTION assignment_booking_set()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER assignment_booking_session_days
+    AFTER UPDATE OF date, start_time, end_time ON session_days
+    FOR EACH ROW WHEN (OLD.booking IS DISTINCT FROM NEW.booking)
+    EXECUTE FUNCTION assignment_booking_session_day_moved()
+    """,
+]
+
+DROP = [
+    "DROP FUNCTION IF EXISTS assignment_booking_set() CASCADE",
+    "DROP FUNCTION IF EXISTS assignment_booking_session_day_moved() CASCADE",
+]
+
+
+def upgrade():
+    op.add_column('instructor_assignments', sa.Column('booking', postgresql.TSRANGE(), nullable=True))
+    op.execute(
+        "UPDATE instructor_assignments a SET booking = d.booking "
+        "FROM session_days d WHERE d.id = a.session_day_id"
+    )
+    for statement in FUNCTIONS + TRIGGERS:
+        op.execute(statement)
+    op.execute(
+        "ALTER TABLE instructor_assignments ADD CONSTRAINT ex_instructor_assignments_instructor_booking "
+        "EXCLUDE USING gist (int4range(instructor_id, instructor_id, '[]') WITH &&, booking WITH &&) "
+        "DEFERRABLE INITIALLY IMMEDIATE"
+    )
+
+
+def downgrade():
+    op.drop_constraint('ex_instructor_assignments_instructor_booking', 'instructor_assignments')
+    for statement in DROP:
+        op.execute(statement)
+    op.drop_column('instructor_assignments', 'booking')
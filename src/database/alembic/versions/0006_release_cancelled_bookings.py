@@ -0,0 +1,123 @@
+"""release cancelled bookings
+
+Turns session_days.booking from a generated column into one kept current by
+triggers, so that it can be NULL while the day's session is cancelled, and
+limits the location EXCLUDE constraint to booked days. Days of cancelled
+sessions no longer hold their rooms, and their assignments no longer hold
+their instructors. Reinstating a session books its days again, which fails
+if the rooms have been taken since; downgrading does the same for every
+cancelled session.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 18:20:41.553102
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION location_booking_set() RETURNS trigger AS $$
+    BEGIN
+        SELECT CASE WHEN status = 'CANCELLED' THEN NULL
+                    ELSE tsrange(NEW.date + NEW.start_time, NEW.date + NEW.end_time) END
+        INTO NEW.booking FROM course_sessions WHERE id = NEW.session_id FOR SHARE;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION location_booking_session_status_changed() RETURNS trigger AS $$
+    BEGIN
+        UPDATE session_days SET booking = CASE WHEN NEW.status = 'CANCELLED' THEN NULL
+                                               ELSE tsrange(date + start_time, date + end_time) END
+        WHERE session_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+]
+
+TRIGGERS = [
+    """
+    CREATE OR REPLACE TRIGGER location_booking_session_days
+    BEFORE INSERT OR UPDATE OF session_id, date, start_time, end_time ON session_days
+    FOR EACH ROW EXECUTE FUNCTION location_booking_set()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER location_booking_course_sessions
+    AFTER UPDATE OF status ON course_sessions
+    FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+    EXECUTE FUNCTION location_booking_session_status_changed()
+    """,
+]
+
+DROP = [
+    "DROP FUNCTION IF EXISTS location_booking_set() CASCADE",
+    "DROP FUNCTION IF EXISTS location_booking_session_status_changed() CASCADE",
+]
+
+# Assignments follow every change to their day's booking, not only moves
+ASSIGNMENT_TRIGGER = """
+    CREATE OR REPLACE TRIGGER assignment_booking_session_days
+    AFTER UPDATE ON session_days
+    FOR EACH ROW WHEN (OLD.booking IS DISTINCT FROM NEW.booking)
+    EXECUTE FUNCTION assignment_booking_session_day_moved()
+    """
+
+PREVIOUS_ASSIGNMENT_TRIGGER = """
+    CREATE OR REPLACE TRIGGER assignment_booking_session_days
+    AFTER UPDATE OF date, start_time, end_time ON session_days
+    FOR EACH ROW WHEN (OLD.booking IS DISTINCT FROM NEW.booking)
+    EXECUTE FUNCTION assignment_booking_session_day_moved()
+    """
+
+
+def upgrade():
+    op.drop_constraint('ex_session_days_location_booking', 'session_days')
+    op.execute("ALTER TABLE session_days ALTER COLUMN booking DROP EXPRESSION")
+    for statement in FUNCTIONS + TRIGGERS + [ASSIGNMENT_TRIGGER]:
+        op.execute(statement)
+    # The assignment trigger clears the bookings of these days' assignments too
+    op.execute(
+        "UPDATE session_days d SET booking = NULL FROM course_sessions s "
+        "WHERE s.id = d.session_id AND s.status = 'CANCELLED'"
+    )
+    op.execute(
+        "ALTER TABLE session_days ADD CONSTRAINT ex_session_days_location_booking "
+        "EXCLUDE USING gist (int4range(location_id, location_id, '[]') WITH &&, booking WITH &&) "
+        "WHERE (booking IS NOT NULL) DEFERRABLE INITIALLY IMMEDIATE"
+    )
+
+
+def downgrade():
+    op.drop_constraint('ex_session_days_location_booking', 'session_days')
+    for statement in DROP:
+        op.execute(statement)
+    # A generated column cannot be restored in place, and the trigger reads it
+    op.execute("DROP TRIGGER IF EXISTS assignment_booking_session_days ON session_days")
+    op.drop_column('session_days', 'booking')
+    op.add_column('session_days', sa.Column(
+        'booking', postgresql.TSRANGE(),
+        sa.Computed('tsrange(date + start_time, date + end_time)', persisted=True),
+        nullable=True
+    ))
+    op.execute(PREVIOUS_ASSIGNMENT_TRIGGER)
+    op.execute(
+        "UPDATE instructor_assignments a SET booking = d.booking "
+        "FROM session_days d WHERE d.id = a.session_day_id"
+    )
+    op.execute(
+        "ALTER TABLE session_days ADD CONSTRAINT ex_session_days_location_booking "
+        "EXCLUDE USING gist (int4range(location_id, location_id, '[]') WITH &&, booking WITH &&) "
+        "DEFERRABLE INITIALLY IMMEDIATE"
+    )
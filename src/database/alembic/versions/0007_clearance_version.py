@@ -0,0 +1,60 @@
+"""clearance version
+
+Adds the single-row clearance_version table and a statement-level trigger on
+instructor_course_ratings that bumps it, so that each process's clearance
+matrix can tell whether ratings have changed with one primary key lookup.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 20:05:12.604418
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION clearance_version_bump() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO clearance_version (id, version) VALUES (1, 1)
+        ON CONFLICT (id) DO UPDATE SET version = clearance_version.version + 1;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+]
+
+TRIGGERS = [
+    """
+    CREATE OR REPLACE TRIGGER clearance_version_instructor_course_ratings
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON instructor_course_ratings
+    FOR EACH STATEMENT EXECUTE FUNCTION clearance_version_bump()
+    """,
+]
+
+DROP = [
+    "DROP FUNCTION IF EXISTS clearance_version_bump() CASCADE",
+]
+
+
+def upgrade():
+    op.create_table('clearance_version',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    for statement in FUNCTIONS + TRIGGERS:
+        op.execute(statement)
+
+
+def downgrade():
+    for statement in DROP:
+        op.execute(statement)
+    op.drop_table('clearance_version')
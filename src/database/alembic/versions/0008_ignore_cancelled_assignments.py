@@ -0,0 +1,39 @@
+"""ignore cancelled assignments
+
+Limits the instructor booking EXCLUDE constraint to assignments that are not
+cancelled, so that cancelling an assignment frees its instructor for that
+time. Restoring a cancelled assignment is rejected if the instructor has been
+booked since; downgrading does the same for every cancelled assignment.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 21:14:37.902561
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_constraint('ex_instructor_assignments_instructor_booking', 'instructor_assignments')
+    op.execute(
+        "ALTER TABLE instructor_assignments ADD CONSTRAINT ex_instructor_assignments_instructor_booking "
+        "EXCLUDE USING gist (int4range(instructor_id, instructor_id, '[]') WITH &&, booking WITH &&) "
+        "WHERE (assignment_status <> 'CANCELLED') DEFERRABLE INITIALLY IMMEDIATE"
+    )
+
+
+def downgrade():
+    op.drop_constraint('ex_instructor_assignments_instructor_booking', 'instructor_assignments')
+    op.execute(
+        "ALTER TABLE instructor_assignments ADD CONSTRAINT ex_instructor_assignments_instructor_booking "
+        "EXCLUDE USING gist (int4range(instructor_id, instructor_id, '[]') WITH &&, booking WITH &&) "
+        "DEFERRABLE INITIALLY IMMEDIATE"
+    )
@@ -0,0 +1,51 @@
+"""Triggers that copy each session day's booking range onto its assignments.
+
+instructor_assignments.booking repeats session_days.booking so that an
+EXCLUDE constraint on (instructor, booking) can stop an instructor being
+assigned to two overlapping session days. The range is set when an
+assignment is written and copied again whenever its session day's booking
+changes, as when the day is moved or its session cancelled. The day is read
+FOR SHARE, so an assignment written while another transaction moves its day
+waits for that move and copies the new range rather than the old. The statements
+are attached to Base.metadata in models.py and repeated in Alembic revisions
+0005 and 0006.
+"""
+
+ASSIGNMENT_BOOKING_FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION assignment_booking_set() RETURNS trigger AS $$
+    BEGIN
+        SELECT booking INTO NEW.booking FROM session_days WHERE id = NEW.session_day_id FOR SHARE;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION assignment_booking_session_day_moved() RETURNS trigger AS $$
+    BEGIN
+        UPDATE instructor_assignments SET booking = NEW.booking WHERE session_day_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+]
+
+ASSIGNMENT_BOOKING_TRIGGERS = [
+    """
+    CREATE OR REPLACE TRIGGER assignment_booking_instructor_assignments
+    BEFORE INSERT OR UPDATE OF session_day_id ON instructor_assignments
+    FOR EACH ROW EXECUTE FUNCTION assignment_booking_set()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER assignment_booking_session_days
+    AFTER UPDATE ON session_days
+    FOR EACH ROW WHEN (OLD.booking IS DISTINCT FROM NEW.booking)
+    EXECUTE FUNCTION assignment_booking_session_day_moved()
+    """,
+]
+
+# Dropping the functions drops the triggers that call them
+ASSIGNMENT_BOOKING_DROP = [
+    "DROP FUNCTION IF EXISTS assignment_booking_set() CASCADE",
+    "DROP FUNCTION IF EXISTS assignment_booking_session_day_moved() CASCADE",
+]
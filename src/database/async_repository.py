@@ -0,0 +1,55 @@
+import functools
+from sqlalchemy.ext.asyncio import AsyncSession
+from .repository import (
+    InstructorRepository, CourseRepository, LocationRepository, RatingRepository,
+    SessionRepository, CourseSessionDayRepository, AssignmentRepository, CalendarRepository
+)
+
+class AsyncRepository:
+    """Awaitable counterpart of a synchronous repository class.
+
+    Every public method of ``repository_class`` is exposed as a coroutine that
+    runs the synchronous implementation through ``AsyncSession.run_sync``. The
+    queries go out over asyncpg without blocking the event loop, and the query
+    logic itself lives only in the synchronous repository.
+    """
+    repository_class = None
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def __getattr__(self, name):
+        method = getattr(self.repository_class, name, None)
+        if name.startswith('_') or not callable(method):
+            raise AttributeError(f"{type(self).__name__} has no method '{name}'")
+
+        @functools.wraps(method)
+        async def run(*args, **kwargs):
+            return await self.db.run_sync(
+                lambda session: method(self.repository_class(session), *args, **kwargs)
+            )
+        return run
+
+class AsyncInstructorRepository(AsyncRepository):
+    repository_class = InstructorRepository
+
+class AsyncCourseRepository(AsyncRepository):
+    repository_class = CourseRepository
+
+class AsyncLocationRepository(AsyncRepository):
+    repository_class = LocationRepository
+
+class AsyncRatingRepository(AsyncRepository):
+    repository_class = RatingRepository
+
+class AsyncSessionRepository(AsyncRepository):
+    repository_class = SessionRepository
+
+class AsyncCourseSessionDayRepository(AsyncRepository):
+    repository_class = CourseSessionDayRepository
+
+class AsyncAssignmentRepository(AsyncRepository):
+    repository_class = AssignmentRepository
+
+class AsyncCalendarRepository(AsyncRepository):
+    repository_class = CalendarRepository
@@ -0,0 +1,59 @@
+import os
+import threading
+import time
+from collections import namedtuple
+from typing import Any, Callable, Hashable
+from sqlalchemy import inspect
+from .models import Course, Location
+
+class TTLCache:
+    """A small thread-safe in-process cache whose entries expire after a fixed time.
+
+    Each worker process has its own cache, so changes made through another
+    process are seen once the entry expires.
+    """
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (value, self._clock() + self.ttl_seconds)
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+def _snapshot_type(model):
+    """Immutable record type holding a model's loaded column values."""
+    fields = [attr.key for attr in inspect(model).column_attrs if not attr.deferred]
+    return namedtuple(f"Cached{model.__name__}", fields)
+
+CachedCourse = _snapshot_type(Course)
+CachedLocation = _snapshot_type(Location)
+
+def snapshot(record_type, obj):
+    """Copy an ORM object's columns into a record that is safe to share between sessions."""
+    return record_type(**{field: getattr(obj, field) for field in record_type._fields})
+
+REFERENCE_CACHE_TTL = float(os.getenv('REFERENCE_CACHE_TTL', '300'))
+
+course_cache = TTLCache(REFERENCE_CACHE_TTL)
+location_cache = TTLCache(REFERENCE_CACHE_TTL)
@@ -0,0 +1,132 @@
+"""Triggers that keep the calendar_days read model in step with the schedule.
+
+calendar_days holds one row per session day with its session, course and
+location columns copied in and a count of assignments that are not cancelled,
+so a calendar range is one index scan with no joins. Rows are rebuilt by
+calendar_days_refresh() whenever a session day or one of its assignments
+changes, and renamed courses, locations and sessions are copied to their rows.
+The statements are attached to Base.metadata in models.py and repeated in
+Alembic revision 0003.
+"""
+
+CALENDAR_DAYS_FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION calendar_days_refresh(day_ids integer[]) RETURNS void AS $$
+    BEGIN
+        DELETE FROM calendar_days WHERE session_day_id = ANY(day_ids);
+        INSERT INTO calendar_days (
+            session_day_id, date, start_time, end_time, day_number, session_type,
+            session_id, session_name, session_status, course_id, course_name, course_code,
+            location_id, location_name, city, assignment_count
+        )
+        SELECT d.id, d.date, d.start_time, d.end_time, d.day_number, d.session_type,
+               s.id, s.session_name, s.status, c.id, c.course_name, c.course_code,
+               l.id, l.location_name, l.city,
+               (SELECT count(*) FROM instructor_assignments a
+                WHERE a.session_day_id = d.id AND a.assignment_status <> 'CANCELLED')
+        FROM session_days d
+        JOIN course_sessions s ON s.id = d.session_id
+        JOIN courses c ON c.id = s.course_id
+        JOIN locations l ON l.id = d.location_id
+        WHERE d.id = ANY(day_ids);
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION calendar_days_session_day_changed() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'DELETE' THEN
+            DELETE FROM calendar_days WHERE session_day_id = OLD.id;
+        ELSE
+            PERFORM calendar_days_refresh(ARRAY[NEW.id]);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION calendar_days_assignment_changed() RETURNS trigger AS $$
+    DECLARE
+        day_ids integer[];
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            day_ids := ARRAY[NEW.session_day_id];
+        ELSIF TG_OP = 'DELETE' THEN
+            day_ids := ARRAY[OLD.session_day_id];
+        ELSE
+            day_ids := ARRAY[OLD.session_day_id, NEW.session_day_id];
+        END IF;
+        UPDATE calendar_days cd SET assignment_count = (
+            SELECT count(*) FROM instructor_assignments a
+            WHERE a.session_day_id = cd.session_day_id AND a.assignment_status <> 'CANCELLED'
+        )
+        WHERE cd.session_day_id = ANY(day_ids);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION calendar_days_session_changed() RETURNS trigger AS $$
+    BEGIN
+        PERFORM calendar_days_refresh(ARRAY(SELECT id FROM session_days WHERE session_id = NEW.id));
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION calendar_days_course_changed() RETURNS trigger AS $$
+    BEGIN
+        UPDATE calendar_days SET course_name = NEW.course_name, course_code = NEW.course_code
+        WHERE course_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION calendar_days_location_changed() RETURNS trigger AS $$
+    BEGIN
+        UPDATE calendar_days SET location_name = NEW.location_name, city = NEW.city
+        WHERE location_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+]
+
+CALENDAR_DAYS_TRIGGERS = [
+    """
+    CREATE OR REPLACE TRIGGER calendar_days_session_days
+    AFTER INSERT OR UPDATE OR DELETE ON session_days
+    FOR EACH ROW EXECUTE FUNCTION calendar_days_session_day_changed()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER calendar_days_instructor_assignments
+    AFTER INSERT OR UPDATE OF session_day_id, assignment_status OR DELETE ON instructor_assignments
+    FOR EACH ROW EXECUTE FUNCTION calendar_days_assignment_changed()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER calendar_days_course_sessions
+    AFTER UPDATE OF course_id, session_name, status ON course_sessions
+    FOR EACH ROW EXECUTE FUNCTION calendar_days_session_changed()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER calendar_days_courses
+    AFTER UPDATE OF course_name, course_code ON courses
+    FOR EACH ROW EXECUTE FUNCTION calendar_days_course_changed()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER calendar_days_locations
+    AFTER UPDATE OF location_name, city ON locations
+    FOR EACH ROW EXECUTE FUNCTION calendar_days_location_changed()
+    """,
+]
+
+# Dropping the functions drops the triggers that call them
+CALENDAR_DAYS_DROP = [
+    "DROP FUNCTION IF EXISTS calendar_days_session_day_changed() CASCADE",
+    "DROP FUNCTION IF EXISTS calendar_days_assignment_changed() CASCADE",
+    "DROP FUNCTION IF EXISTS calendar_days_session_changed() CASCADE",
+    "DROP FUNCTION IF EXISTS calendar_days_course_changed() CASCADE",
+    "DROP FUNCTION IF EXISTS calendar_days_location_changed() CASCADE",
+    "DROP FUNCTION IF EXISTS calendar_days_refresh(integer[])",
+]
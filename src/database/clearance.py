@@ -0,0 +1,174 @@
+"""In-process matrix of which instructors are CLEARED for which courses.
+
+Each course maps to a bitset indexed by instructor id, stored as a bytearray so
+that point lookups and single-bit updates are constant time. The matrix is
+built with one query, and ORM writes to instructor_course_ratings keep it
+current through session events. Core statements that bypass the ORM, such as
+RatingRepository.bulk_upsert_ratings, update it explicitly. Writes made by
+other worker processes bump the version row in clearance_version; once the
+matrix is CLEARANCE_MATRIX_TTL seconds old, ensure_loaded reads that row by
+primary key and rebuilds the matrix only if the version has moved. Lookups in
+between cost no queries.
+"""
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from .models import ClearanceVersion, InstructorCourseRating, RatingType
+
+CLEARANCE_MATRIX_TTL = float(os.getenv('CLEARANCE_MATRIX_TTL', '5'))
+
+def _set_bits(bits: bytearray) -> List[int]:
+    mask = int.from_bytes(bits, "little")
+    positions = []
+    while mask:
+        low = mask & -mask
+        positions.append(low.bit_length() - 1)
+        mask ^= low
+    return positions
+
+class ClearanceMatrix:
+    """CLEARED ratings as one bitset per course over instructor ids."""
+    def __init__(self, ttl_seconds: float = CLEARANCE_MATRIX_TTL, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._by_course: Dict[int, bytearray] = {}
+        self._version: Optional[int] = None
+        self._checked_at: Optional[float] = None
+        # Changes recorded while a load is reading, replayed onto the new matrix
+        self._journals: List[list] = []
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._version is not None
+
+    @staticmethod
+    def current_version(db: Session) -> int:
+        """The clearance_version counter, 0 before ratings are first written."""
+        return db.query(ClearanceVersion.version).filter(ClearanceVersion.id == 1).scalar() or 0
+
+    def load(self, db: Session, version: Optional[int] = None):
+        """Rebuild the matrix from every CLEARED rating in one query, recording the version it matches."""
+        if version is None:
+            # Read before the ratings, so a write in between triggers another load rather than being missed
+            version = self.current_version(db)
+        journal = []
+        with self._lock:
+            self._journals.append(journal)
+        try:
+            by_course: Dict[int, bytearray] = {}
+            rows = db.query(InstructorCourseRating.course_id, InstructorCourseRating.instructor_id).filter(
+                InstructorCourseRating.rating == RatingType.CLEARED
+            )
+            for course_id, instructor_id in rows:
+                self._set_bit(by_course.setdefault(course_id, bytearray()), instructor_id, True)
+        except Exception:
+            with self._lock:
+                self._journals.remove(journal)
+            raise
+        with self._lock:
+            self._journals.remove(journal)
+            # set_cleared calls made during the query may be missing from its rows
+            for instructor_id, course_id, cleared in journal:
+                self._set_bit(by_course.setdefault(course_id, bytearray()), instructor_id, cleared)
+            self._by_course = by_course
+            self._version = version
+            self._checked_at = self._clock()
+
+    def ensure_loaded(self, db: Session) -> "ClearanceMatrix":
+        """Load the matrix if it is empty, or if its version is due a check and has moved."""
+        if self._checked_at is not None and self._clock() - self._checked_at < self.ttl_seconds:
+            return self
+        version = self.current_version(db)
+        if version != self._version:
+            self.load(db, version)
+        else:
+            self._checked_at = self._clock()
+        return self
+
+    def reset(self):
+        """Forget everything; the next ensure_loaded rebuilds from the database."""
+        with self._lock:
+            self._by_course = {}
+            self._version = None
+            self._checked_at = None
+
+    @staticmethod
+    def _set_bit(bits: bytearray, instructor_id: int, cleared: bool):
+        byte, bit = divmod(instructor_id, 8)
+        if byte >= len(bits):
+            if not cleared:
+                return
+            bits.extend(bytes(byte + 1 - len(bits)))
+        if cleared:
+            bits[byte] |= 1 << bit
+        else:
+            bits[byte] &= ~(1 << bit) & 0xFF
+
+    def set_cleared(self, instructor_id: int, course_id: int, cleared: bool):
+        """Record one instructor's clearance for a course. Ignored until the matrix is loaded."""
+        with self._lock:
+            for journal in self._journals:
+                journal.append((instructor_id, course_id, cleared))
+            if self._version is None:
+                return
+            self._set_bit(self._by_course.setdefault(course_id, bytearray()), instructor_id, cleared)
+
+    def is_cleared(self, instructor_id: int, course_id: int) -> bool:
+        bits = self._by_course.get(course_id)
+        byte, bit = divmod(instructor_id, 8)
+        return bits is not None and byte < len(bits) and bool(bits[byte] >> bit & 1)
+
+    def cleared_mask(self, course_id: int) -> int:
+        """The course's bitset as an int, for combining courses with & and |."""
+        return int.from_bytes(self._by_course.get(course_id, b""), "little")
+
+    def cleared_instructors(self, course_id: int) -> List[int]:
+        """Ids of every instructor cleared for a course, ascending."""
+        return _set_bits(self._by_course.get(course_id, bytearray()))
+
+    def cleared_courses(self, instructor_id: int, course_ids: Optional[Iterable[int]] = None) -> List[int]:
+        """Ids of the courses an instructor is cleared for, optionally among the given ones."""
+        if course_ids is None:
+            course_ids = self._by_course.keys()
+        return sorted(course_id for course_id in course_ids if self.is_cleared(instructor_id, course_id))
+
+clearance_matrix = ClearanceMatrix()
+
+def get_clearance_matrix(db: Session) -> ClearanceMatrix:
+    """The process-wide clearance matrix, built from the database if needed."""
+    return clearance_matrix.ensure_loaded(db)
+
+_PENDING_KEY = "clearance_changes"
+
+@event.listens_for(Session, "after_flush")
+def _collect_rating_changes(session, flush_context):
+    changes = session.info.setdefault(_PENDING_KEY, [])
+    for obj in session.new | session.dirty:
+        if isinstance(obj, InstructorCourseRating):
+            # A rating moved to another instructor or course no longer clears the old pair
+            attrs = inspect(obj).attrs
+            old_instructor = attrs.instructor_id.history.deleted
+            old_course = attrs.course_id.history.deleted
+            if old_instructor or old_course:
+                changes.append((
+                    old_instructor[0] if old_instructor else obj.instructor_id,
+                    old_course[0] if old_course else obj.course_id,
+                    False
+                ))
+            changes.append((obj.instructor_id, obj.course_id, obj.rating == RatingType.CLEARED))
+    for obj in session.deleted:
+        if isinstance(obj, InstructorCourseRating):
+            changes.append((obj.instructor_id, obj.course_id, False))
+
+@event.listens_for(Session, "after_commit")
+def _apply_rating_changes(session):
+    for instructor_id, course_id, cleared in session.info.pop(_PENDING_KEY, []):
+        clearance_matrix.set_cleared(instructor_id, course_id, cleared)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rating_changes(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,35 @@
+"""Trigger that counts writes to instructor_course_ratings.
+
+clearance_version holds a single row whose version is bumped by every
+statement that writes ratings, in the writing transaction, so it changes
+exactly when committed ratings do. Each process's clearance matrix compares
+it with the version it was built from to notice writes made elsewhere. The
+bump serializes transactions that write ratings, which are rare. The
+statements are attached to Base.metadata in models.py and repeated in
+Alembic revision 0007.
+"""
+
+CLEARANCE_VERSION_FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION clearance_version_bump() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO clearance_version (id, version) VALUES (1, 1)
+        ON CONFLICT (id) DO UPDATE SET version = clearance_version.version + 1;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+]
+
+CLEARANCE_VERSION_TRIGGERS = [
+    """
+    CREATE OR REPLACE TRIGGER clearance_version_instructor_course_ratings
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON instructor_course_ratings
+    FOR EACH STATEMENT EXECUTE FUNCTION clearance_version_bump()
+    """,
+]
+
+# Dropping the function drops the trigger that calls it
+CLEARANCE_VERSION_DROP = [
+    "DROP FUNCTION IF EXISTS clearance_version_bump() CASCADE",
+]
@@ -0,0 +1,206 @@
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Sequence
+from datetime import date, time, timedelta
+from sqlalchemy import exists, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased, contains_eager
+from .models import (
+    AssignmentStatus, CourseSession, CourseSessionDay, Instructor, InstructorAssignment,
+    InstructorCourseRating, RatingType
+)
+
+class AvailabilityResult(NamedTuple):
+    """Outcome of a conflict check: whether the slot is free and what blocks it."""
+    available: bool
+    conflicts: List[InstructorAssignment]
+
+class StaffingCandidate(NamedTuple):
+    """An instructor who can take a session day, with their assignment count around it."""
+    instructor: Instructor
+    current_load: int
+
+class LocationConflictError(ValueError):
+    """Raised when a session day would share its location with another at the same time."""
+    def __init__(self, location_id: int, clashes: List[CourseSessionDay]):
+        super().__init__(f"Location {location_id} is already booked at that time")
+        self.location_id = location_id
+        self.clashes = clashes
+
+class InstructorConflictError(ValueError):
+    """Raised when assignments would give an instructor two overlapping session days.
+
+    ``conflicts`` maps each session day being staffed to the existing
+    assignments it overlaps; it is empty for every day when the overlap is
+    between the new assignments themselves.
+    """
+    def __init__(self, conflicts: Dict[int, List[InstructorAssignment]]):
+        clashing = [day_id for day_id, assignments in conflicts.items() if assignments]
+        super().__init__(
+            f"Instructor is already assigned at that time on session days {clashing}" if clashing
+            else "Instructor would be assigned to overlapping session days"
+        )
+        self.conflicts = conflicts
+
+LOCATION_BOOKING_CONSTRAINT = "ex_session_days_location_booking"
+ASSIGNMENT_BOOKING_CONSTRAINT = "ex_instructor_assignments_instructor_booking"
+
+def is_exclusion_violation(error: IntegrityError, constraint_name: str) -> bool:
+    """Whether a database error was raised by the named EXCLUDE constraint."""
+    # psycopg and asyncpg both report the SQLSTATE; 23P01 is exclusion_violation
+    return getattr(error.orig, "sqlstate", None) == "23P01" and constraint_name in str(error.orig)
+
+def find_location_clashes(db: Session, location_id: int, check_date: date, start_time: time,
+                          end_time: time, exclude_id: Optional[int] = None) -> List[CourseSessionDay]:
+    """Session days at a location that overlap a time slot, in start time order.
+
+    Days of cancelled sessions have no booking and are never clashes.
+    """
+    query = db.query(CourseSessionDay).filter(
+        CourseSessionDay.booking.isnot(None),
+        CourseSessionDay.location_id == location_id,
+        CourseSessionDay.date == check_date,
+        CourseSessionDay.start_time < end_time,
+        CourseSessionDay.end_time > start_time
+    )
+    if exclude_id is not None:
+        query = query.filter(CourseSessionDay.id != exclude_id)
+    return query.order_by(CourseSessionDay.start_time, CourseSessionDay.id).all()
+
+def find_location_clashes_batch(db: Session, location_id: int, dates: Sequence[date],
+                                start_time: time, end_time: time) -> List[CourseSessionDay]:
+    """Session days at a location that overlap the same time slot on any of several dates."""
+    return db.query(CourseSessionDay).filter(
+        CourseSessionDay.booking.isnot(None),
+        CourseSessionDay.location_id == location_id,
+        CourseSessionDay.date.in_(set(dates)),
+        CourseSessionDay.start_time < end_time,
+        CourseSessionDay.end_time > start_time
+    ).order_by(CourseSessionDay.date, CourseSessionDay.start_time, CourseSessionDay.id).all()
+
+def find_instructor_conflicts(db: Session, instructor_id: int, check_date: date,
+                              start_time: time, end_time: time) -> AvailabilityResult:
+    """Find an instructor's assignments overlapping a time slot with a single query.
+
+    The overlap test runs in the WHERE clause, and each conflict's session day is
+    loaded in the same query, so callers can inspect it without further round trips.
+    Cancelled assignments and days of cancelled sessions hold nothing, as in the
+    booking constraints, so they are never conflicts.
+    """
+    conflicts = db.query(InstructorAssignment).join(InstructorAssignment.session_day).filter(
+        InstructorAssignment.instructor_id == instructor_id,
+        InstructorAssignment.assignment_status != AssignmentStatus.CANCELLED,
+        CourseSessionDay.booking.isnot(None),
+        CourseSessionDay.date == check_date,
+        CourseSessionDay.start_time < end_time,
+        CourseSessionDay.end_time > start_time
+    ).options(
+        contains_eager(InstructorAssignment.session_day)
+    ).order_by(CourseSessionDay.start_time, InstructorAssignment.id).all()
+
+    return AvailabilityResult(available=not conflicts, conflicts=conflicts)
+
+def find_instructor_conflicts_batch(db: Session, instructor_id: int,
+                                    session_days: Sequence[CourseSessionDay]
+                                    ) -> Dict[int, List[InstructorAssignment]]:
+    """Check one instructor against many session days with a single query.
+
+    All of the instructor's assignments across the spanned dates are fetched at
+    once and swept against the requested slots date by date. Returns a mapping of
+    each requested session day id to the assignments it conflicts with.
+    """
+    conflicts = {session_day.id: [] for session_day in session_days}
+    if not session_days:
+        return conflicts
+
+    existing = db.query(InstructorAssignment).join(InstructorAssignment.session_day).filter(
+        InstructorAssignment.instructor_id == instructor_id,
+        InstructorAssignment.assignment_status != AssignmentStatus.CANCELLED,
+        CourseSessionDay.booking.isnot(None),
+        CourseSessionDay.date >= min(sd.date for sd in session_days),
+        CourseSessionDay.date <= max(sd.date for sd in session_days)
+    ).options(
+        contains_eager(InstructorAssignment.session_day)
+    ).order_by(CourseSessionDay.date, CourseSessionDay.start_time, InstructorAssignment.id).all()
+
+    # Assignments arrive sorted by start time within each date
+    by_date = defaultdict(list)
+    for assignment in existing:
+        by_date[assignment.session_day.date].append(assignment)
+    start_times = {day: [a.session_day.start_time for a in assigned] for day, assigned in by_date.items()}
+
+    for session_day in session_days:
+        assigned = by_date.get(session_day.date)
+        if not assigned:
+            continue
+        # Only assignments starting before this slot ends can overlap it
+        candidates = assigned[:bisect_left(start_times[session_day.date], session_day.end_time)]
+        conflicts[session_day.id] = [
+            a for a in candidates if a.session_day.end_time > session_day.start_time
+        ]
+
+    return conflicts
+
+def find_assignment_clashes(db: Session, assignments: Sequence[dict]
+                            ) -> Dict[int, List[InstructorAssignment]]:
+    """Existing assignments overlapping each proposed one, keyed by session day id.
+
+    Each dict holds an instructor_id and session_day_id, as passed to
+    AssignmentRepository.create_assignments_bulk. Runs one batch check per instructor.
+    """
+    days = {day.id: day for day in db.query(CourseSessionDay).filter(
+        CourseSessionDay.id.in_({a["session_day_id"] for a in assignments})
+    )}
+    by_instructor = defaultdict(list)
+    for a in assignments:
+        if a["session_day_id"] in days:
+            by_instructor[a["instructor_id"]].append(days[a["session_day_id"]])
+    conflicts = {}
+    for instructor_id, session_days in by_instructor.items():
+        conflicts.update(find_instructor_conflicts_batch(db, instructor_id, session_days))
+    return conflicts
+
+def find_staffing_candidates(db: Session, session_day: CourseSessionDay,
+                             load_window_days: int = 30, limit: int = 100) -> List[StaffingCandidate]:
+    """Find active instructors cleared for a session day's course and free at its time.
+
+    One query: cleared instructors come from the course rating index, anyone with
+    an overlapping assignment is removed with an anti-join, and the rest are ranked
+    by how many live assignments they hold within ``load_window_days`` of the day.
+    """
+    busy_day = aliased(CourseSessionDay)
+    has_overlap = exists().where(
+        InstructorAssignment.instructor_id == Instructor.id,
+        InstructorAssignment.session_day_id == busy_day.id,
+        InstructorAssignment.assignment_status != AssignmentStatus.CANCELLED,
+        busy_day.booking.isnot(None),
+        busy_day.date == session_day.date,
+        busy_day.start_time < session_day.end_time,
+        busy_day.end_time > session_day.start_time
+    )
+
+    window = timedelta(days=load_window_days)
+    load_day = aliased(CourseSessionDay)
+    current_load = select(func.count(InstructorAssignment.id)).join(
+        load_day, InstructorAssignment.session_day_id == load_day.id
+    ).where(
+        InstructorAssignment.instructor_id == Instructor.id,
+        InstructorAssignment.assignment_status != AssignmentStatus.CANCELLED,
+        load_day.booking.isnot(None),
+        load_day.date.between(session_day.date - window, session_day.date + window)
+    ).correlate(Instructor).scalar_subquery()
+
+    course_id = select(CourseSession.course_id).where(
+        CourseSession.id == session_day.session_id
+    ).scalar_subquery()
+
+    rows = db.query(Instructor, current_load).join(
+        InstructorCourseRating, InstructorCourseRating.instructor_id == Instructor.id
+    ).filter(
+        InstructorCourseRating.course_id == course_id,
+        InstructorCourseRating.rating == RatingType.CLEARED,
+        Instructor.active_status == True,
+        ~has_overlap
+    ).order_by(current_load, Instructor.last_name, Instructor.id).limit(limit).all()
+
+    return [StaffingCandidate(instructor, load) for instructor, load in rows]
@@ -1,6 +1,7 @@
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker, declarative_base, raiseload
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -17,6 +18,10 @@ def get_database_url():
     
     return f"postgresql+psycopg://{username}:{password}@{host}:{port}/{database}"
 
+def get_async_database_url():
+    """Get the database URL for the asyncpg driver."""
+    return get_database_url().replace("postgresql+psycopg://", "postgresql+asyncpg://", 1)
+
 def create_db_engine(database_url=None):
     """Create SQLAlchemy engine."""
     if database_url is None:
@@ -35,9 +40,49 @@ def create_session_factory(engine):
     """Create session factory."""
     return sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def create_async_db_engine(database_url=None):
+    """Create SQLAlchemy async engine on asyncpg."""
+    if database_url is None:
+        database_url = get_async_database_url()
+    
+    return create_async_engine(
+        database_url,
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+        echo=os.getenv('DB_ECHO', 'false').lower() == 'true'
+    )
+
+class RaiseLoadSession(Session):
+    """Session whose queries leave unrequested relationships unloadable.
+
+    Accessing a relationship that was not loaded with an explicit loader option
+    raises instead of silently issuing another query.
+    """
+
+@event.listens_for(RaiseLoadSession, "do_orm_execute")
+def _default_to_raiseload(orm_execute_state):
+    if orm_execute_state.is_select and not orm_execute_state.is_relationship_load:
+        # Explicit loader options on the statement take precedence over the wildcard
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+def create_async_session_factory(engine):
+    """Create async session factory.
+
+    Objects stay loaded after commit, since refreshing an expired attribute
+    outside the session's greenlet is not allowed. Relationships default to
+    raising on lazy load, see RaiseLoadSession.
+    """
+    return async_sessionmaker(
+        bind=engine, autoflush=False, expire_on_commit=False,
+        sync_session_class=RaiseLoadSession
+    )
+
 # Global engine and session factory for the application
 engine = None
 SessionLocal = None
+async_engine = None
+AsyncSessionLocal = None
 
 def _get_engine():
     """Get or create the database engine."""
@@ -53,6 +98,20 @@ def _get_session_factory():
         SessionLocal = create_session_factory(_get_engine())
     return SessionLocal
 
+def _get_async_engine():
+    """Get or create the async database engine."""
+    global async_engine
+    if async_engine is None:
+        async_engine = create_async_db_engine()
+    return async_engine
+
+def _get_async_session_factory():
+    """Get or create the async session factory."""
+    global AsyncSessionLocal
+    if AsyncSessionLocal is None:
+        AsyncSessionLocal = create_async_session_factory(_get_async_engine())
+    return AsyncSessionLocal
+
 def get_db_session():
     """Get database session."""
     session_factory = _get_session_factory()
@@ -62,6 +121,12 @@ def get_db_session():
     finally:
         db.close()
 
+async def get_async_db_session():
+    """Get async database session."""
+    session_factory = _get_async_session_factory()
+    async with session_factory() as db:
+        yield db
+
 def init_database():
     """Initialize database tables."""
-    Base.metadata.create_all(bind=_get_engine())
\ No newline at end of file
+    Base.metadata.create_all(bind=_get_engine())
@@ -0,0 +1,64 @@
+"""Flat selects over the schedule for bulk export.
+
+The statements select plain columns rather than ORM entities, so exported rows
+are never turned into objects or tracked by a session. Execute them with
+stream_results (AsyncSession.stream does this) and yield_per to read through a
+server-side cursor in batches.
+"""
+from datetime import date
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.sql import Select
+from .models import CourseSession, CourseSessionDay, InstructorAssignment
+
+EXPORT_YIELD_PER = 1000
+
+def _date_range(statement: Select, date_from: Optional[date], date_to: Optional[date]) -> Select:
+    if date_from:
+        statement = statement.where(CourseSessionDay.date >= date_from)
+    if date_to:
+        statement = statement.where(CourseSessionDay.date <= date_to)
+    return statement.execution_options(yield_per=EXPORT_YIELD_PER)
+
+def session_day_export(date_from: Optional[date] = None, date_to: Optional[date] = None) -> Select:
+    """Every session day with its session's course and status, in date order."""
+    return _date_range(select(
+        CourseSessionDay.id.label("session_day_id"),
+        CourseSessionDay.session_id,
+        CourseSession.course_id,
+        CourseSession.session_name,
+        CourseSession.status.label("session_status"),
+        CourseSessionDay.day_number,
+        CourseSessionDay.date,
+        CourseSessionDay.start_time,
+        CourseSessionDay.end_time,
+        CourseSessionDay.location_id,
+        CourseSessionDay.session_type
+    ).join(
+        CourseSession, CourseSessionDay.session_id == CourseSession.id
+    ).order_by(
+        CourseSessionDay.date, CourseSessionDay.start_time, CourseSessionDay.id
+    ), date_from, date_to)
+
+def assignment_export(date_from: Optional[date] = None, date_to: Optional[date] = None) -> Select:
+    """Every assignment with the session day it staffs, in date order."""
+    return _date_range(select(
+        InstructorAssignment.id.label("assignment_id"),
+        InstructorAssignment.instructor_id,
+        InstructorAssignment.session_day_id,
+        CourseSessionDay.session_id,
+        CourseSession.course_id,
+        CourseSessionDay.date,
+        CourseSessionDay.start_time,
+        CourseSessionDay.end_time,
+        CourseSessionDay.location_id,
+        InstructorAssignment.assignment_type,
+        InstructorAssignment.assignment_status,
+        InstructorAssignment.created_date
+    ).join(
+        CourseSessionDay, InstructorAssignment.session_day_id == CourseSessionDay.id
+    ).join(
+        CourseSession, CourseSessionDay.session_id == CourseSession.id
+    ).order_by(
+        CourseSessionDay.date, CourseSessionDay.start_time, InstructorAssignment.id
+    ), date_from, date_to)
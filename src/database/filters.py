@@ -0,0 +1,7 @@
+from typing import Any
+from sqlalchemy.sql.elements import ColumnElement
+
+def contains(column: Any, text: str) -> ColumnElement:
+    """Case-insensitive substring match, treating LIKE wildcards in the text literally."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return column.ilike(f"%{escaped}%", escape="\\")
@@ -0,0 +1,96 @@
+"""Bulk loading of validated rows into reference and schedule tables.
+
+Rows are checked against the table and each other with one query per batch,
+then written with one INSERT per batch that unnests an array per column. Nothing is committed here, so
+every batch of an import can share one transaction.
+"""
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Type
+from sqlalchemy import bindparam, func, insert, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Insert
+from .models import Base, Course, CourseSession, Instructor, Location
+
+class RowError(NamedTuple):
+    """A problem with one input row; rows are numbered from 1."""
+    row: int
+    field: Optional[str]
+    message: str
+
+class ImportTarget(NamedTuple):
+    """A table rows can be imported into.
+
+    ``unique`` names a column that must not repeat within the file or match an
+    existing row; ``references`` maps foreign key columns to the model they point at.
+    """
+    model: Type[Base]
+    unique: Optional[str] = None
+    references: Dict[str, Type[Base]] = {}
+
+IMPORT_TARGETS = {
+    "instructors": ImportTarget(Instructor, unique="email"),
+    "courses": ImportTarget(Course, unique="course_code"),
+    "locations": ImportTarget(Location),
+    "sessions": ImportTarget(CourseSession, references={"course_id": Course}),
+}
+
+def unnest_insert(model: Type[Base], rows: Sequence[dict]) -> Insert:
+    """An INSERT ... SELECT FROM unnest() for rows, binding one array per column.
+
+    The statement has a fixed shape whatever the number of rows, so it is
+    compiled once and sent in one round trip. Columns missing from the rows
+    get their Python-side default, as an ORM insert would give them. Add
+    returning() to get the new rows back.
+    """
+    table = model.__table__
+    arrays = {key: [row[key] for row in rows] for key in rows[0]}
+    for column in table.columns:
+        if column.key not in arrays and column.default is not None and not column.primary_key:
+            default = column.default.arg(None) if column.default.is_callable else column.default.arg
+            arrays[column.key] = [default] * len(rows)
+    return insert(model).from_select([table.c[key] for key in arrays], select(*(
+        func.unnest(bindparam(key, values, type_=ARRAY(table.c[key].type))) for key, values in arrays.items()
+    )))
+
+def insert_rows(db: Session, model: Type[Base], rows: Sequence[dict]) -> int:
+    """Insert rows with a single INSERT ... SELECT FROM unnest(), binding one array per column."""
+    if not rows:
+        return 0
+    db.execute(unnest_insert(model, rows))
+    return len(rows)
+
+def import_batch(db: Session, target: ImportTarget, rows: Sequence[Tuple[int, dict]]) -> Tuple[int, List[RowError]]:
+    """Insert a batch of validated (row number, values) pairs, skipping rows that would conflict.
+
+    Returns the number of rows inserted and an error for each row skipped.
+    Rows inserted by earlier batches in the same transaction count as existing.
+    """
+    errors = []
+    rejected = set()
+    model = target.model
+
+    if target.unique:
+        column = getattr(model, target.unique)
+        keys = {values[target.unique] for _, values in rows}
+        existing = set(db.scalars(select(column).where(column.in_(keys)))) if keys else set()
+        seen = set()
+        for row, values in rows:
+            value = values[target.unique]
+            if value in existing:
+                errors.append(RowError(row, target.unique, f"{target.unique} {value} already exists"))
+                rejected.add(row)
+            elif value in seen:
+                errors.append(RowError(row, target.unique, f"{target.unique} {value} appears more than once"))
+                rejected.add(row)
+            seen.add(value)
+
+    for name, referenced in target.references.items():
+        ids = {values[name] for _, values in rows}
+        found = set(db.scalars(select(referenced.id).where(referenced.id.in_(ids)))) if ids else set()
+        for row, values in rows:
+            if values[name] not in found and row not in rejected:
+                errors.append(RowError(row, name, f"{referenced.__name__} {values[name]} not found"))
+                rejected.add(row)
+
+    created = insert_rows(db, model, [values for row, values in rows if row not in rejected])
+    return created, errors
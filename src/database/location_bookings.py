@@ -0,0 +1,53 @@
+"""Triggers that keep each session day's booking range current.
+
+session_days.booking is the day's time as a tsrange, which the EXCLUDE
+constraint on (location, booking) compares. It is NULL while the day's
+session is cancelled, so a cancelled session holds no room, and the triggers
+in assignment_bookings.py carry that on to its instructors. Reinstating the
+session books its days again, which the constraint rejects if the rooms have
+been taken since. The statements are attached to Base.metadata in models.py
+and repeated in Alembic revision 0006.
+"""
+
+LOCATION_BOOKING_FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION location_booking_set() RETURNS trigger AS $$
+    BEGIN
+        SELECT CASE WHEN status = 'CANCELLED' THEN NULL
+                    ELSE tsrange(NEW.date + NEW.start_time, NEW.date + NEW.end_time) END
+        INTO NEW.booking FROM course_sessions WHERE id = NEW.session_id FOR SHARE;
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION location_booking_session_status_changed() RETURNS trigger AS $$
+    BEGIN
+        UPDATE session_days SET booking = CASE WHEN NEW.status = 'CANCELLED' THEN NULL
+                                               ELSE tsrange(date + start_time, date + end_time) END
+        WHERE session_id = NEW.id;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+]
+
+LOCATION_BOOKING_TRIGGERS = [
+    """
+    CREATE OR REPLACE TRIGGER location_booking_session_days
+    BEFORE INSERT OR UPDATE OF session_id, date, start_time, end_time ON session_days
+    FOR EACH ROW EXECUTE FUNCTION location_booking_set()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER location_booking_course_sessions
+    AFTER UPDATE OF status ON course_sessions
+    FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+    EXECUTE FUNCTION location_booking_session_status_changed()
+    """,
+]
+
+# Dropping the functions drops the triggers that call them
+LOCATION_BOOKING_DROP = [
+    "DROP FUNCTION IF EXISTS location_booking_set() CASCADE",
+    "DROP FUNCTION IF EXISTS location_booking_session_status_changed() CASCADE",
+]
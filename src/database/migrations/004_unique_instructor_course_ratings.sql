@@ -0,0 +1,16 @@
+-- Migration: One rating per instructor and course
+-- Remove duplicate instructor/course ratings, keeping the most recently updated one,
+-- then enforce uniqueness so ratings can be upserted with INSERT ... ON CONFLICT
+
+BEGIN;
+
+DELETE FROM instructor_course_ratings r
+USING instructor_course_ratings newer
+WHERE r.instructor_id = newer.instructor_id
+AND r.course_id = newer.course_id
+AND (r.date_updated, r.id) < (newer.date_updated, newer.id);
+
+ALTER TABLE instructor_course_ratings
+    ADD CONSTRAINT uq_instructor_course_ratings_instructor_course UNIQUE (instructor_id, course_id);
+
+COMMIT;
@@ -0,0 +1,27 @@
+-- Migration: Indexes for the hot query shapes
+-- Session days are filtered by date, (location_id, date) and session_id; assignments by
+-- instructor_id and session_day_id; ratings by (course_id, rating). Lookups by
+-- (instructor_id, course_id) use the unique constraint added in 004.
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so there is no BEGIN/COMMIT;
+-- each statement is idempotent and can be re-run if one fails.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_session_days_date_start_time_id
+    ON session_days (date, start_time, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_session_days_location_id_date
+    ON session_days (location_id, date);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_session_days_session_id_day_number
+    ON session_days (session_id, day_number);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_instructor_assignments_instructor_id
+    ON instructor_assignments (instructor_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_instructor_assignments_session_day_id
+    ON instructor_assignments (session_day_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_instructor_assignments_created_date_id
+    ON instructor_assignments (created_date, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_instructor_course_ratings_course_id_rating
+    ON instructor_course_ratings (course_id, rating);
@@ -1,8 +1,17 @@
 from datetime import datetime
 from enum import Enum as PyEnum
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Enum, Time, Date, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import BigInteger, Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Enum, Time, Date, Float, UniqueConstraint, Index
+from sqlalchemy import DDL, event, text
+from sqlalchemy.dialects.postgresql import TSRANGE, ExcludeConstraint
+from sqlalchemy.orm import deferred, relationship
 from .connection import Base
+from .search import search_vector_column
+from .assignment_bookings import (
+    ASSIGNMENT_BOOKING_DROP, ASSIGNMENT_BOOKING_FUNCTIONS, ASSIGNMENT_BOOKING_TRIGGERS
+)
+from .calendar_days import CALENDAR_DAYS_DROP, CALENDAR_DAYS_FUNCTIONS, CALENDAR_DAYS_TRIGGERS
+from .clearance_versions import CLEARANCE_VERSION_DROP, CLEARANCE_VERSION_FUNCTIONS, CLEARANCE_VERSION_TRIGGERS
+from .location_bookings import LOCATION_BOOKING_DROP, LOCATION_BOOKING_FUNCTIONS, LOCATION_BOOKING_TRIGGERS
 
 class RatingType(PyEnum):
     OBSERVE = "observe"
@@ -27,6 +36,9 @@ class AssignmentStatus(PyEnum):
 
 class Instructor(Base):
     __tablename__ = "instructors"
+    __table_args__ = (
+        Index("ix_instructors_search_vector", "search_vector", postgresql_using="gin"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     first_name = Column(String(100), nullable=False)
@@ -37,6 +49,7 @@ class Instructor(Base):
     active_status = Column(Boolean, default=True, nullable=False)
     created_date = Column(DateTime, default=datetime.utcnow, nullable=False)
     notes = Column(Text)
+    search_vector = search_vector_column("first_name", "last_name", "call_sign")
     
     # Relationships
     course_ratings = relationship("InstructorCourseRating", back_populates="instructor")
@@ -44,6 +57,9 @@ class Instructor(Base):
 
 class Course(Base):
     __tablename__ = "courses"
+    __table_args__ = (
+        Index("ix_courses_search_vector", "search_vector", postgresql_using="gin"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     course_name = Column(String(200), nullable=False)
@@ -52,6 +68,7 @@ class Course(Base):
     duration_days = Column(Float, nullable=False)
     active_status = Column(Boolean, default=True, nullable=False)
     created_date = Column(DateTime, default=datetime.utcnow, nullable=False)
+    search_vector = search_vector_column("course_name", "course_code")
     
     # Relationships
     instructor_ratings = relationship("InstructorCourseRating", back_populates="course")
@@ -59,6 +76,9 @@ class Course(Base):
 
 class Location(Base):
     __tablename__ = "locations"
+    __table_args__ = (
+        Index("ix_locations_search_vector", "search_vector", postgresql_using="gin"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     location_name = Column(String(200), nullable=False)
@@ -68,12 +88,18 @@ class Location(Base):
     postal_code = Column(String(20))
     active_status = Column(Boolean, default=True, nullable=False)
     notes = Column(Text)
+    search_vector = search_vector_column("location_name", "city")
     
     # Relationships
     session_days = relationship("CourseSessionDay", back_populates="location")
 
 class InstructorCourseRating(Base):
     __tablename__ = "instructor_course_ratings"
+    __table_args__ = (
+        # Also serves lookups by (instructor_id, course_id) and by instructor_id alone
+        UniqueConstraint("instructor_id", "course_id", name="uq_instructor_course_ratings_instructor_course"),
+        Index("ix_instructor_course_ratings_course_id_rating", "course_id", "rating"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     instructor_id = Column(Integer, ForeignKey("instructors.id"), nullable=False)
@@ -87,6 +113,13 @@ class InstructorCourseRating(Base):
     instructor = relationship("Instructor", back_populates="course_ratings")
     course = relationship("Course", back_populates="instructor_ratings")
 
+class ClearanceVersion(Base):
+    """One row counting writes to instructor_course_ratings; see clearance_versions.py."""
+    __tablename__ = "clearance_version"
+    
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    version = Column(BigInteger, nullable=False)
+
 class CourseSession(Base):
     __tablename__ = "course_sessions"
     
@@ -104,6 +137,25 @@ class CourseSession(Base):
 
 class CourseSessionDay(Base):
     __tablename__ = "session_days"
+    __table_args__ = (
+        # Date filters, calendar ordering and keyset pagination
+        Index("ix_session_days_date_start_time_id", "date", "start_time", "id"),
+        Index("ix_session_days_location_id_date", "location_id", "date"),
+        Index("ix_session_days_session_id_day_number", "session_id", "day_number"),
+        # A location can hold one session day at a time. GiST has no equality operator
+        # for plain integers without btree_gist, so the location is matched as a
+        # single-value range. Deferrable so a transaction can move several days at once.
+        # Days of cancelled sessions have no booking and hold nothing.
+        ExcludeConstraint(
+            (text("int4range(location_id, location_id, '[]')"), "&&"),
+            ("booking", "&&"),
+            name="ex_session_days_location_booking",
+            using="gist",
+            where=text("booking IS NOT NULL"),
+            deferrable=True,
+            initially="IMMEDIATE"
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(Integer, ForeignKey("course_sessions.id"), nullable=False)
@@ -113,6 +165,9 @@ class CourseSessionDay(Base):
     start_time = Column(Time, nullable=False)
     end_time = Column(Time, nullable=False)
     session_type = Column(Enum(SessionType), nullable=False)
+    # The day's time as one range, or NULL while its session is cancelled; set by
+    # the triggers in location_bookings.py
+    booking = deferred(Column(TSRANGE))
     
     # Relationships
     session = relationship("CourseSession", back_populates="session_days")
@@ -121,6 +176,23 @@ class CourseSessionDay(Base):
 
 class InstructorAssignment(Base):
     __tablename__ = "instructor_assignments"
+    __table_args__ = (
+        Index("ix_instructor_assignments_instructor_id", "instructor_id"),
+        Index("ix_instructor_assignments_session_day_id", "session_day_id"),
+        # Keyset pagination
+        Index("ix_instructor_assignments_created_date_id", "created_date", "id"),
+        # An instructor can teach one session day at a time; matched like
+        # ex_session_days_location_booking. Cancelled assignments hold nothing.
+        ExcludeConstraint(
+            (text("int4range(instructor_id, instructor_id, '[]')"), "&&"),
+            ("booking", "&&"),
+            name="ex_instructor_assignments_instructor_booking",
+            using="gist",
+            where=text("assignment_status <> 'CANCELLED'"),
+            deferrable=True,
+            initially="IMMEDIATE"
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     session_day_id = Column(Integer, ForeignKey("session_days.id"), nullable=False)
@@ -129,7 +201,49 @@ class InstructorAssignment(Base):
     assignment_status = Column(Enum(AssignmentStatus), default=AssignmentStatus.ASSIGNED, nullable=False)
     created_date = Column(DateTime, default=datetime.utcnow, nullable=False)
     notes = Column(Text)
+    # The session day's booking, copied in by the triggers in assignment_bookings.py
+    booking = deferred(Column(TSRANGE))
     
     # Relationships
     session_day = relationship("CourseSessionDay", back_populates="instructor_assignments")
-    instructor = relationship("Instructor", back_populates="assignments")
\ No newline at end of file
+    instructor = relationship("Instructor", back_populates="assignments")
+
+class CalendarDay(Base):
+    """One row per session day with its session, course, location and assignment count.
+
+    A read model kept current by the triggers in calendar_days.py; the
+    application never writes to it.
+    """
+    __tablename__ = "calendar_days"
+    __table_args__ = (
+        # Calendar ranges, optionally per location or course
+        Index("ix_calendar_days_date_start_time", "date", "start_time", "session_day_id"),
+        Index("ix_calendar_days_location_id_date", "location_id", "date"),
+        Index("ix_calendar_days_course_id_date", "course_id", "date"),
+    )
+    
+    session_day_id = Column(Integer, primary_key=True, autoincrement=False)
+    date = Column(Date, nullable=False)
+    start_time = Column(Time, nullable=False)
+    end_time = Column(Time, nullable=False)
+    day_number = Column(Integer, nullable=False)
+    session_type = Column(Enum(SessionType), nullable=False)
+    session_id = Column(Integer, nullable=False)
+    session_name = Column(String(200), nullable=False)
+    session_status = Column(Enum(SessionStatus), nullable=False)
+    course_id = Column(Integer, nullable=False)
+    course_name = Column(String(200), nullable=False)
+    course_code = Column(String(50), nullable=False)
+    location_id = Column(Integer, nullable=False)
+    location_name = Column(String(200), nullable=False)
+    city = Column(String(100))
+    assignment_count = Column(Integer, nullable=False)
+
+# Triggers reference every table, so they are created once all tables exist
+for statement in (CALENDAR_DAYS_FUNCTIONS + CALENDAR_DAYS_TRIGGERS
+                  + LOCATION_BOOKING_FUNCTIONS + LOCATION_BOOKING_TRIGGERS
+                  + ASSIGNMENT_BOOKING_FUNCTIONS + ASSIGNMENT_BOOKING_TRIGGERS
+                  + CLEARANCE_VERSION_FUNCTIONS + CLEARANCE_VERSION_TRIGGERS):
+    event.listen(Base.metadata, "after_create", DDL(statement))
+for statement in CALENDAR_DAYS_DROP + LOCATION_BOOKING_DROP + ASSIGNMENT_BOOKING_DROP + CLEARANCE_VERSION_DROP:
+    event.listen(Base.metadata, "before_drop", DDL(statement))
@@ -0,0 +1,63 @@
+import base64
+import json
+from datetime import date, datetime, time
+from typing import Any, List, NamedTuple, Optional, Sequence
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+class Page(NamedTuple):
+    """A single page of query results with an optional total row count."""
+    items: List[Any]
+    total: Optional[int] = None
+
+class CursorPage(NamedTuple):
+    """A single keyset page and the opaque cursor for the page after it."""
+    items: List[Any]
+    next_cursor: Optional[str] = None
+
+def paginate(query: Query, offset: int = 0, limit: Optional[int] = None,
+             with_total: bool = False) -> Page:
+    """Apply OFFSET/LIMIT to an ordered query and optionally count all matching rows."""
+    total = query.order_by(None).count() if with_total else None
+    if offset:
+        query = query.offset(offset)
+    if limit is not None:
+        query = query.limit(limit)
+    return Page(items=query.all(), total=total)
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode sort key values as an opaque, URL-safe cursor string."""
+    payload = [v.isoformat() if isinstance(v, (date, time, datetime)) else v for v in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+def decode_cursor(cursor: str, types: Sequence[type]) -> tuple:
+    """Decode a cursor produced by encode_cursor, converting each value to the given type."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if len(payload) != len(types):
+            raise ValueError
+        return tuple(
+            t.fromisoformat(v) if t in (date, time, datetime) else t(v)
+            for t, v in zip(types, payload)
+        )
+    except (ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor")
+
+def keyset_paginate(query: Query, key_columns: Sequence[Any], cursor: Optional[str] = None,
+                    limit: int = 100) -> CursorPage:
+    """Return the rows that sort after the cursor, seeking on the key columns.
+
+    The key columns must be unique together (end them with the primary key) and
+    should match an index so each page is a single range scan regardless of depth.
+    """
+    if cursor:
+        key_types = [column.type.python_type for column in key_columns]
+        query = query.filter(tuple_(*key_columns) > tuple_(*decode_cursor(cursor, key_types)))
+    rows = query.order_by(*key_columns).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, column.key) for column in key_columns])
+    return CursorPage(items=rows, next_cursor=next_cursor)
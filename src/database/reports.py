@@ -0,0 +1,65 @@
+"""Aggregate reports computed in the database.
+
+Each report is built as a single select so that it can be executed in one
+round trip, or streamed row by row with AsyncSession.stream for exports.
+"""
+from datetime import date
+from sqlalchemy import Float, and_, case, cast, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from .models import (
+    CourseSession, CourseSessionDay, Instructor, InstructorAssignment,
+    InstructorCourseRating, AssignmentStatus, RatingType, SessionStatus
+)
+
+def session_day_hours():
+    """SQL expression for a session day's length in hours, as get_session_duration_hours computes it."""
+    return cast(
+        func.extract("epoch", CourseSessionDay.end_time - CourseSessionDay.start_time) / 3600, Float
+    )
+
+def cleared_rating_condition():
+    """Join condition matching an assignment to its instructor's CLEARED rating for the session's course.
+
+    The query must already join CourseSessionDay and CourseSession to the assignment.
+    """
+    return and_(
+        InstructorCourseRating.instructor_id == InstructorAssignment.instructor_id,
+        InstructorCourseRating.course_id == CourseSession.course_id,
+        InstructorCourseRating.rating == RatingType.CLEARED
+    )
+
+def pay_eligibility_report(date_from: date, date_to: date) -> Select:
+    """Per-instructor pay eligibility for assignments on session days between two dates.
+
+    An assignment is pay eligible when its instructor is CLEARED for the course.
+    Cancelled assignments and assignments on cancelled sessions are left out.
+    Rows are ordered by instructor name.
+    """
+    eligible = InstructorCourseRating.id.is_not(None)
+    hours = session_day_hours()
+    return select(
+        Instructor.id.label("instructor_id"),
+        Instructor.first_name,
+        Instructor.last_name,
+        Instructor.email,
+        func.count(InstructorAssignment.id).label("assignments"),
+        func.count(InstructorAssignment.id).filter(eligible).label("eligible_assignments"),
+        func.coalesce(func.sum(case((eligible, hours), else_=0.0)), 0.0).label("eligible_hours")
+    ).select_from(InstructorAssignment).join(
+        Instructor, InstructorAssignment.instructor_id == Instructor.id
+    ).join(
+        CourseSessionDay, InstructorAssignment.session_day_id == CourseSessionDay.id
+    ).join(
+        CourseSession, CourseSessionDay.session_id == CourseSession.id
+    ).outerjoin(
+        InstructorCourseRating, cleared_rating_condition()
+    ).where(
+        CourseSessionDay.date.between(date_from, date_to),
+        InstructorAssignment.assignment_status != AssignmentStatus.CANCELLED,
+        CourseSession.status != SessionStatus.CANCELLED
+    ).group_by(Instructor.id).order_by(Instructor.last_name, Instructor.first_name, Instructor.id)
+
+def get_pay_eligibility_report(db: Session, date_from: date, date_to: date):
+    """Run pay_eligibility_report and return all of its rows."""
+    return db.execute(pay_eligibility_report(date_from, date_to)).all()
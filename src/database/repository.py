@@ -1,12 +1,27 @@
 from typing import List, Optional
 from datetime import date, datetime, time
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
 from .models import (
     Instructor, Course, Location, InstructorCourseRating, 
-    CourseSession, CourseSessionDay, InstructorAssignment,
+    CourseSession, CourseSessionDay, InstructorAssignment, CalendarDay,
     RatingType, SessionStatus, AssignmentStatus, SessionType
 )
+from .pagination import CursorPage, Page, keyset_paginate, paginate
+from .filters import contains
+from .search import ranked_search
+from .cache import CachedCourse, CachedLocation, course_cache, location_cache, snapshot
+from .clearance import clearance_matrix
+from .reports import cleared_rating_condition
+from .imports import unnest_insert
+from .conflicts import (
+    ASSIGNMENT_BOOKING_CONSTRAINT, LOCATION_BOOKING_CONSTRAINT, InstructorConflictError,
+    LocationConflictError, find_assignment_clashes, find_instructor_conflicts,
+    find_location_clashes, find_location_clashes_batch, is_exclusion_violation
+)
+from .rescheduling import RescheduleConflictError, find_reschedule_conflicts
 
 class InstructorRepository:
     def __init__(self, db: Session):
@@ -29,15 +44,40 @@ class InstructorRepository:
     def get_by_id(self, instructor_id: int) -> Optional[Instructor]:
         return self.db.query(Instructor).filter(Instructor.id == instructor_id).first()
     
+    def get_with_details(self, instructor_id: int) -> Optional[Instructor]:
+        """Get an instructor with course ratings and assignments loaded up front."""
+        return self.db.query(Instructor).filter(Instructor.id == instructor_id).options(
+            selectinload(Instructor.course_ratings),
+            selectinload(Instructor.assignments)
+        ).first()
+    
     def get_by_email(self, email: str) -> Optional[Instructor]:
         return self.db.query(Instructor).filter(Instructor.email == email).first()
     
+    def get_existing_ids(self, instructor_ids: List[int]) -> set:
+        """Return which of the given instructor ids exist, using a single IN query."""
+        if not instructor_ids:
+            return set()
+        rows = self.db.query(Instructor.id).filter(Instructor.id.in_(instructor_ids)).all()
+        return {row.id for row in rows}
+    
     def get_all(self, active_only: bool = True) -> List[Instructor]:
         query = self.db.query(Instructor)
         if active_only:
             query = query.filter(Instructor.active_status == True)
         return query.all()
     
+    def get_page(self, offset: int = 0, limit: Optional[int] = 100, active_only: bool = True,
+                 name: Optional[str] = None, with_total: bool = False) -> Page:
+        query = self.db.query(Instructor)
+        if active_only:
+            query = query.filter(Instructor.active_status == True)
+        if name:
+            query = ranked_search(query, Instructor.search_vector, name, Instructor.id)
+        else:
+            query = query.order_by(Instructor.id)
+        return paginate(query, offset, limit, with_total)
+    
     def update(self, instructor: Instructor) -> Instructor:
         self.db.commit()
         self.db.refresh(instructor)
@@ -50,17 +90,45 @@ class InstructorRepository:
             return self.update(instructor)
         return None
     
-    def search_by_name(self, name: str, active_only: bool = True) -> List[Instructor]:
+    def search(self, name: Optional[str] = None, email: Optional[str] = None,
+               active_only: bool = True, course_id: Optional[int] = None,
+               rating: Optional[RatingType] = None, offset: int = 0,
+               limit: Optional[int] = 100, with_total: bool = False) -> Page:
+        """Find instructors matching every given filter in a single query.
+
+        course_id and rating select instructors holding a matching course rating
+        through a semi-join on instructor_course_ratings, served by its
+        (instructor_id, course_id) and (course_id, rating) indexes. Name matches
+        come back best first, everything else by id.
+        """
         query = self.db.query(Instructor)
         if active_only:
             query = query.filter(Instructor.active_status == True)
-        search_term = f"%{name}%"
-        return query.filter(
-            or_(
-                Instructor.first_name.ilike(search_term),
-                Instructor.last_name.ilike(search_term)
-            )
-        ).all()
+        if email:
+            query = query.filter(Instructor.email == email)
+        if course_id or rating:
+            rating_filters = []
+            if course_id:
+                rating_filters.append(InstructorCourseRating.course_id == course_id)
+            if rating:
+                rating_filters.append(InstructorCourseRating.rating == rating)
+            query = query.filter(Instructor.course_ratings.any(and_(*rating_filters)))
+        if name:
+            query = ranked_search(query, Instructor.search_vector, name, Instructor.id)
+        else:
+            query = query.order_by(Instructor.id)
+        return paginate(query, offset, limit, with_total)
+    
+    def search_by_name(self, name: str, active_only: bool = True,
+                       limit: Optional[int] = None) -> List[Instructor]:
+        """Find instructors whose name or call sign words start with the search words, best first."""
+        query = self.db.query(Instructor)
+        if active_only:
+            query = query.filter(Instructor.active_status == True)
+        query = ranked_search(query, Instructor.search_vector, name, Instructor.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
 
 class CourseRepository:
     def __init__(self, db: Session):
@@ -77,11 +145,23 @@ class CourseRepository:
         self.db.add(course)
         self.db.commit()
         self.db.refresh(course)
+        course_cache.invalidate(course.id)
         return course
     
     def get_by_id(self, course_id: int) -> Optional[Course]:
         return self.db.query(Course).filter(Course.id == course_id).first()
     
+    def get_cached(self, course_id: int) -> Optional[CachedCourse]:
+        """Read-only course snapshot by id, served from the in-process reference cache."""
+        cached = course_cache.get(course_id)
+        if cached is None:
+            course = self.get_by_id(course_id)
+            if course is None:
+                return None
+            cached = snapshot(CachedCourse, course)
+            course_cache.set(course_id, cached)
+        return cached
+    
     def get_by_code(self, course_code: str) -> Optional[Course]:
         return self.db.query(Course).filter(Course.course_code == course_code).first()
     
@@ -91,9 +171,41 @@ class CourseRepository:
             query = query.filter(Course.active_status == True)
         return query.all()
     
+    def get_page(self, offset: int = 0, limit: Optional[int] = 100, active_only: bool = True,
+                 with_total: bool = False) -> Page:
+        query = self.db.query(Course)
+        if active_only:
+            query = query.filter(Course.active_status == True)
+        return paginate(query.order_by(Course.id), offset, limit, with_total)
+    
+    def search(self, name: Optional[str] = None, code: Optional[str] = None,
+               active_only: bool = True, offset: int = 0, limit: Optional[int] = 100,
+               with_total: bool = False) -> Page:
+        """Find courses whose name and code contain the given text, filtered in SQL."""
+        query = self.db.query(Course)
+        if active_only:
+            query = query.filter(Course.active_status == True)
+        if name:
+            query = query.filter(contains(Course.course_name, name))
+        if code:
+            query = query.filter(contains(Course.course_code, code))
+        return paginate(query.order_by(Course.id), offset, limit, with_total)
+    
+    def search_text(self, text: str, active_only: bool = True,
+                    limit: Optional[int] = 20) -> List[Course]:
+        """Ranked prefix search over course names and codes."""
+        query = self.db.query(Course)
+        if active_only:
+            query = query.filter(Course.active_status == True)
+        query = ranked_search(query, Course.search_vector, text, Course.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+    
     def update(self, course: Course) -> Course:
         self.db.commit()
         self.db.refresh(course)
+        course_cache.invalidate(course.id)
         return course
     
     def set_active_status(self, course_id: int, active: bool) -> Optional[Course]:
@@ -121,20 +233,64 @@ class LocationRepository:
         self.db.add(location)
         self.db.commit()
         self.db.refresh(location)
+        location_cache.invalidate(location.id)
         return location
     
     def get_by_id(self, location_id: int) -> Optional[Location]:
         return self.db.query(Location).filter(Location.id == location_id).first()
     
+    def get_cached(self, location_id: int) -> Optional[CachedLocation]:
+        """Read-only location snapshot by id, served from the in-process reference cache."""
+        cached = location_cache.get(location_id)
+        if cached is None:
+            location = self.get_by_id(location_id)
+            if location is None:
+                return None
+            cached = snapshot(CachedLocation, location)
+            location_cache.set(location_id, cached)
+        return cached
+    
     def get_all(self, active_only: bool = True) -> List[Location]:
         query = self.db.query(Location)
         if active_only:
             query = query.filter(Location.active_status == True)
         return query.all()
     
+    def get_page(self, offset: int = 0, limit: Optional[int] = 100, active_only: bool = True,
+                 with_total: bool = False) -> Page:
+        query = self.db.query(Location)
+        if active_only:
+            query = query.filter(Location.active_status == True)
+        return paginate(query.order_by(Location.id), offset, limit, with_total)
+    
+    def search(self, name: Optional[str] = None, city: Optional[str] = None,
+               active_only: bool = True, offset: int = 0, limit: Optional[int] = 100,
+               with_total: bool = False) -> Page:
+        """Find locations whose name and city contain the given text, filtered in SQL."""
+        query = self.db.query(Location)
+        if active_only:
+            query = query.filter(Location.active_status == True)
+        if name:
+            query = query.filter(contains(Location.location_name, name))
+        if city:
+            query = query.filter(contains(Location.city, city))
+        return paginate(query.order_by(Location.id), offset, limit, with_total)
+    
+    def search_text(self, text: str, active_only: bool = True,
+                    limit: Optional[int] = 20) -> List[Location]:
+        """Ranked prefix search over location names and cities."""
+        query = self.db.query(Location)
+        if active_only:
+            query = query.filter(Location.active_status == True)
+        query = ranked_search(query, Location.search_vector, text, Location.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+    
     def update(self, location: Location) -> Location:
         self.db.commit()
         self.db.refresh(location)
+        location_cache.invalidate(location.id)
         return location
     
     def set_active_status(self, location_id: int, active: bool) -> Optional[Location]:
@@ -170,6 +326,49 @@ class RatingRepository:
             self.db.refresh(new_rating)
             return new_rating
     
+    def bulk_upsert_ratings(self, instructor_ids: List[int], course_id: int,
+                            rating: RatingType, notes: Optional[str] = None) -> List[InstructorCourseRating]:
+        """Set one course rating for many instructors with a single INSERT ... ON CONFLICT DO UPDATE."""
+        # A row may only be upserted once per statement
+        instructor_ids = list(dict.fromkeys(instructor_ids))
+        if not instructor_ids:
+            return []
+        now = datetime.utcnow()
+        stmt = pg_insert(InstructorCourseRating).values([
+            {
+                "instructor_id": instructor_id,
+                "course_id": course_id,
+                "rating": rating,
+                "notes": notes,
+                "date_assigned": now,
+                "date_updated": now
+            }
+            for instructor_id in instructor_ids
+        ])
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_instructor_course_ratings_instructor_course",
+            set_={
+                "rating": stmt.excluded.rating,
+                "notes": stmt.excluded.notes,
+                "date_updated": stmt.excluded.date_updated
+            }
+        ).returning(InstructorCourseRating.id)
+        try:
+            ids = self.db.scalars(stmt).all()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        # The upsert bypasses the ORM, so the session events never see these rows
+        for instructor_id in instructor_ids:
+            clearance_matrix.set_cleared(instructor_id, course_id, rating == RatingType.CLEARED)
+        # Load the committed rows in one query, with populate_existing so that
+        # ratings already in the session show the upserted values
+        by_instructor = {r.instructor_id: r for r in self.db.query(InstructorCourseRating).filter(
+            InstructorCourseRating.id.in_(ids)
+        ).populate_existing()}
+        return [by_instructor[instructor_id] for instructor_id in instructor_ids]
+    
     def get_rating(self, instructor_id: int, course_id: int) -> Optional[InstructorCourseRating]:
         return self.db.query(InstructorCourseRating).filter(
             and_(
@@ -189,13 +388,12 @@ class RatingRepository:
         ).all()
     
     def get_cleared_instructors_for_course(self, course_id: int) -> List[int]:
-        ratings = self.db.query(InstructorCourseRating).filter(
-            and_(
-                InstructorCourseRating.course_id == course_id,
-                InstructorCourseRating.rating == RatingType.CLEARED
-            )
-        ).all()
-        return [rating.instructor_id for rating in ratings]
+        """Ids of instructors cleared for a course, ascending, from the clearance matrix."""
+        return clearance_matrix.ensure_loaded(self.db).cleared_instructors(course_id)
+    
+    def get_cleared_courses_for_instructor(self, instructor_id: int) -> List[int]:
+        """Ids of courses an instructor is cleared for, ascending, from the clearance matrix."""
+        return clearance_matrix.ensure_loaded(self.db).cleared_courses(instructor_id)
 
 class SessionRepository:
     def __init__(self, db: Session):
@@ -221,16 +419,72 @@ class SessionRepository:
     def get_all(self) -> List[CourseSession]:
         return self.db.query(CourseSession).all()
     
+    def get_page(self, offset: int = 0, limit: Optional[int] = 100,
+                 status: Optional[SessionStatus] = None, course_id: Optional[int] = None,
+                 with_total: bool = False) -> Page:
+        query = self.db.query(CourseSession)
+        if status:
+            query = query.filter(CourseSession.status == status)
+        if course_id:
+            query = query.filter(CourseSession.course_id == course_id)
+        return paginate(query.order_by(CourseSession.id), offset, limit, with_total)
+    
+    def search(self, course_id: Optional[int] = None, status: Optional[SessionStatus] = None,
+               start_date_from: Optional[date] = None, start_date_to: Optional[date] = None,
+               location_id: Optional[int] = None, offset: int = 0, limit: Optional[int] = 100,
+               with_total: bool = False) -> Page:
+        """Find sessions matching every given filter in a single query.
+
+        A location matches a session when any of the session's days is held there.
+        """
+        query = self.db.query(CourseSession)
+        if course_id:
+            query = query.filter(CourseSession.course_id == course_id)
+        if status:
+            query = query.filter(CourseSession.status == status)
+        if start_date_from:
+            query = query.filter(CourseSession.start_date >= start_date_from)
+        if start_date_to:
+            query = query.filter(CourseSession.start_date <= start_date_to)
+        if location_id:
+            query = query.filter(CourseSession.session_days.any(CourseSessionDay.location_id == location_id))
+        return paginate(query.order_by(CourseSession.id), offset, limit, with_total)
+    
     def get_by_status(self, status: SessionStatus) -> List[CourseSession]:
         return self.db.query(CourseSession).filter(CourseSession.status == status).all()
     
+    def update(self, session: CourseSession) -> CourseSession:
+        self._commit_booking(session)
+        self.db.refresh(session)
+        return session
+    
     def update_status(self, session_id: int, status: SessionStatus) -> Optional[CourseSession]:
         session = self.get_by_id(session_id)
         if session:
             session.status = status
-            self.db.commit()
+            self._commit_booking(session)
             self.db.refresh(session)
         return session
+    
+    def _commit_booking(self, session: CourseSession):
+        """Commit, turning a double booking into RescheduleConflictError.
+
+        Cancelled sessions hold no bookings, so reinstating one books its days
+        again, which fails if their rooms or instructors have been taken since.
+        """
+        with self.db.no_autoflush:
+            session_id = session.id
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            if (is_exclusion_violation(e, LOCATION_BOOKING_CONSTRAINT)
+                    or is_exclusion_violation(e, ASSIGNMENT_BOOKING_CONSTRAINT)):
+                raise RescheduleConflictError(
+                    find_reschedule_conflicts(self.db, session_id, 0, moving=True)
+                    or ["The schedule changed during the update"]
+                ) from e
+            raise
 
 class CourseSessionDayRepository:
     def __init__(self, db: Session):
@@ -248,13 +502,86 @@ class CourseSessionDayRepository:
             session_type=session_type
         )
         self.db.add(session_day)
-        self.db.commit()
+        self._commit_booking(session_day)
         self.db.refresh(session_day)
         return session_day
     
+    def create_many(self, session_id: int, dates: List[date], location_id: int, start_time: time,
+                    end_time: time, session_type: SessionType, first_day_number: int = 1
+                    ) -> List[CourseSessionDay]:
+        """Create a day on each date in one INSERT, numbering them from first_day_number.
+
+        Either every day is written or none are; a clash with a day already
+        booked in the location raises LocationConflictError listing every clash.
+        """
+        if not dates:
+            return []
+        statement = unnest_insert(CourseSessionDay, [
+            {"session_id": session_id, "day_number": day_number, "date": day, "location_id": location_id,
+             "start_time": start_time, "end_time": end_time, "session_type": session_type}
+            for day_number, day in enumerate(dates, start=first_day_number)
+        ])
+        try:
+            ids = self.db.scalars(statement.returning(CourseSessionDay.id)).all()
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            if is_exclusion_violation(e, LOCATION_BOOKING_CONSTRAINT):
+                raise LocationConflictError(location_id, find_location_clashes_batch(
+                    self.db, location_id, dates, start_time, end_time
+                )) from e
+            raise
+        # Load the committed rows in one query rather than refreshing each
+        return self.db.query(CourseSessionDay).filter(
+            CourseSessionDay.id.in_(ids)
+        ).order_by(CourseSessionDay.day_number).all()
+    
+    def next_day_number(self, session_id: int) -> int:
+        """The day number following the last day of a session."""
+        return (self.db.query(func.max(CourseSessionDay.day_number)).filter(
+            CourseSessionDay.session_id == session_id
+        ).scalar() or 0) + 1
+    
+    def _commit_booking(self, session_day: CourseSessionDay):
+        """Commit, turning a location double booking into LocationConflictError.
+
+        The database enforces the booking with an EXCLUDE constraint, so the
+        clashing days are only looked up once a write has been rejected. Moving
+        a day so that one of its instructors is double-booked raises
+        InstructorConflictError.
+        """
+        # Rolling back expires the object, so note what it was booking first,
+        # without letting a reload flush the change outside the try below
+        with self.db.no_autoflush:
+            session_day_id = session_day.id
+            slot = (session_day.location_id, session_day.date, session_day.start_time, session_day.end_time)
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            if is_exclusion_violation(e, LOCATION_BOOKING_CONSTRAINT):
+                raise LocationConflictError(slot[0], find_location_clashes(
+                    self.db, *slot, exclude_id=session_day_id
+                )) from e
+            if is_exclusion_violation(e, ASSIGNMENT_BOOKING_CONSTRAINT):
+                instructor_ids = {a.instructor_id for a in self.db.query(InstructorAssignment).filter(
+                    InstructorAssignment.session_day_id == session_day_id
+                )}
+                raise InstructorConflictError({session_day_id: [
+                    conflict for instructor_id in sorted(instructor_ids)
+                    for conflict in find_instructor_conflicts(self.db, instructor_id, *slot[1:]).conflicts
+                    if conflict.session_day_id != session_day_id
+                ]}) from e
+            raise
+    
     def get_by_id(self, session_day_id: int) -> Optional[CourseSessionDay]:
         return self.db.query(CourseSessionDay).filter(CourseSessionDay.id == session_day_id).first()
     
+    def get_by_ids(self, session_day_ids: List[int]) -> List[CourseSessionDay]:
+        return self.db.query(CourseSessionDay).filter(
+            CourseSessionDay.id.in_(session_day_ids)
+        ).all()
+    
     def get_by_session_id(self, session_id: int) -> List[CourseSessionDay]:
         return self.db.query(CourseSessionDay).filter(
             CourseSessionDay.session_id == session_id
@@ -277,7 +604,7 @@ class CourseSessionDayRepository:
         ).order_by(CourseSessionDay.start_time).all()
     
     def update(self, session_day: CourseSessionDay) -> CourseSessionDay:
-        self.db.commit()
+        self._commit_booking(session_day)
         self.db.refresh(session_day)
         return session_day
     
@@ -293,11 +620,55 @@ class CourseSessionDayRepository:
         return self.db.query(CourseSessionDay).order_by(
             CourseSessionDay.date, CourseSessionDay.start_time
         ).all()
+    
+    def _filtered_query(self, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                        location_id: Optional[int] = None):
+        query = self.db.query(CourseSessionDay)
+        if start_date and end_date:
+            query = query.filter(
+                and_(
+                    CourseSessionDay.date >= start_date,
+                    CourseSessionDay.date <= end_date
+                )
+            )
+        elif start_date and location_id:
+            query = query.filter(CourseSessionDay.date == start_date)
+        if location_id:
+            query = query.filter(CourseSessionDay.location_id == location_id)
+        return query
+    
+    def get_page(self, offset: int = 0, limit: Optional[int] = 100,
+                 start_date: Optional[date] = None, end_date: Optional[date] = None,
+                 location_id: Optional[int] = None, with_total: bool = False) -> Page:
+        query = self._filtered_query(start_date, end_date, location_id).order_by(
+            CourseSessionDay.date, CourseSessionDay.start_time, CourseSessionDay.id
+        )
+        return paginate(query, offset, limit, with_total)
+    
+    def get_page_after(self, cursor: Optional[str] = None, limit: int = 100,
+                       start_date: Optional[date] = None, end_date: Optional[date] = None,
+                       location_id: Optional[int] = None) -> CursorPage:
+        """Keyset page ordered by (date, start_time, id), starting after the cursor."""
+        return keyset_paginate(
+            self._filtered_query(start_date, end_date, location_id),
+            [CourseSessionDay.date, CourseSessionDay.start_time, CourseSessionDay.id],
+            cursor, limit
+        )
 
 class AssignmentRepository:
     def __init__(self, db: Session):
         self.db = db
     
+    def _raise_on_double_booking(self, error: IntegrityError, assignments: List[dict]):
+        """Roll back a rejected write, raising InstructorConflictError if it double-booked an instructor.
+
+        The database enforces this with an EXCLUDE constraint, so the clashing
+        assignments are only looked up once a write has been rejected.
+        """
+        self.db.rollback()
+        if is_exclusion_violation(error, ASSIGNMENT_BOOKING_CONSTRAINT):
+            raise InstructorConflictError(find_assignment_clashes(self.db, assignments)) from error
+    
     def create_assignment(self, session_day_id: int, instructor_id: int,
                          assignment_type: str, notes: Optional[str] = None) -> InstructorAssignment:
         assignment = InstructorAssignment(
@@ -307,10 +678,39 @@ class AssignmentRepository:
             notes=notes
         )
         self.db.add(assignment)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self._raise_on_double_booking(e, [{"session_day_id": session_day_id, "instructor_id": instructor_id}])
+            raise
         self.db.refresh(assignment)
         return assignment
     
+    def create_assignments_bulk(self, assignments: List[dict]) -> List[InstructorAssignment]:
+        """Insert many assignments in one transaction using a multi-row INSERT ... RETURNING.
+
+        Each dict holds the create_assignment arguments. Either every row is
+        written or, on any error, none are.
+        """
+        if not assignments:
+            return []
+        try:
+            ids = self.db.scalars(
+                insert(InstructorAssignment).returning(InstructorAssignment.id, sort_by_parameter_order=True),
+                assignments
+            ).all()
+            self.db.commit()
+        except IntegrityError as e:
+            self._raise_on_double_booking(e, assignments)
+            raise
+        except Exception:
+            self.db.rollback()
+            raise
+        # Load the committed rows in one query; rows returned before the commit
+        # would be expired by it and refreshed one at a time
+        by_id = {a.id: a for a in self.db.query(InstructorAssignment).filter(InstructorAssignment.id.in_(ids))}
+        return [by_id[assignment_id] for assignment_id in ids]
+    
     def get_by_id(self, assignment_id: int) -> Optional[InstructorAssignment]:
         return self.db.query(InstructorAssignment).filter(
             InstructorAssignment.id == assignment_id
@@ -321,6 +721,41 @@ class AssignmentRepository:
             InstructorAssignment.instructor_id == instructor_id
         ).all()
     
+    def _filtered_query(self, instructor_id: Optional[int] = None,
+                        status: Optional[AssignmentStatus] = None,
+                        date_from: Optional[date] = None, date_to: Optional[date] = None):
+        query = self.db.query(InstructorAssignment)
+        if instructor_id:
+            query = query.filter(InstructorAssignment.instructor_id == instructor_id)
+        if status:
+            query = query.filter(InstructorAssignment.assignment_status == status)
+        if date_from or date_to:
+            query = query.join(CourseSessionDay)
+            if date_from:
+                query = query.filter(CourseSessionDay.date >= date_from)
+            if date_to:
+                query = query.filter(CourseSessionDay.date <= date_to)
+        return query
+    
+    def get_page(self, offset: int = 0, limit: Optional[int] = 100,
+                 instructor_id: Optional[int] = None, status: Optional[AssignmentStatus] = None,
+                 date_from: Optional[date] = None, date_to: Optional[date] = None,
+                 with_total: bool = False) -> Page:
+        query = self._filtered_query(instructor_id, status, date_from, date_to).order_by(
+            InstructorAssignment.created_date, InstructorAssignment.id
+        )
+        return paginate(query, offset, limit, with_total)
+    
+    def get_page_after(self, cursor: Optional[str] = None, limit: int = 100,
+                       instructor_id: Optional[int] = None, status: Optional[AssignmentStatus] = None,
+                       date_from: Optional[date] = None, date_to: Optional[date] = None) -> CursorPage:
+        """Keyset page ordered by (created_date, id), starting after the cursor."""
+        return keyset_paginate(
+            self._filtered_query(instructor_id, status, date_from, date_to),
+            [InstructorAssignment.created_date, InstructorAssignment.id],
+            cursor, limit
+        )
+    
     def get_assignments_by_date_range(self, start_date: date, end_date: date) -> List[InstructorAssignment]:
         return self.db.query(InstructorAssignment).join(CourseSessionDay).filter(
             and_(
@@ -329,16 +764,53 @@ class AssignmentRepository:
             )
         ).all()
     
+    def update(self, assignment: InstructorAssignment) -> InstructorAssignment:
+        with self.db.no_autoflush:
+            booked = {"session_day_id": assignment.session_day_id, "instructor_id": assignment.instructor_id}
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self._raise_on_double_booking(e, [booked])
+            raise
+        self.db.refresh(assignment)
+        return assignment
+    
     def update_status(self, assignment_id: int, status: AssignmentStatus) -> Optional[InstructorAssignment]:
+        """Set an assignment's status; restoring a cancelled one that now overlaps raises InstructorConflictError."""
         assignment = self.get_by_id(assignment_id)
         if assignment:
             assignment.assignment_status = status
-            self.db.commit()
-            self.db.refresh(assignment)
+            self.update(assignment)
         return assignment
     
-    def get_pay_eligible_assignments(self) -> List[InstructorAssignment]:
-        # Pay eligibility is now determined by instructor being cleared for the course
-        # This method would need to join with ratings to determine eligibility
-        # For now, returning all assignments as a placeholder
-        return self.db.query(InstructorAssignment).all()
\ No newline at end of file
+    def get_pay_eligible_assignments(self, date_from: Optional[date] = None,
+                                     date_to: Optional[date] = None) -> List[InstructorAssignment]:
+        """Assignments whose instructor is CLEARED for the course, optionally within a date range."""
+        query = self.db.query(InstructorAssignment).join(
+            CourseSessionDay, InstructorAssignment.session_day_id == CourseSessionDay.id
+        ).join(
+            CourseSession, CourseSessionDay.session_id == CourseSession.id
+        ).join(InstructorCourseRating, cleared_rating_condition())
+        if date_from:
+            query = query.filter(CourseSessionDay.date >= date_from)
+        if date_to:
+            query = query.filter(CourseSessionDay.date <= date_to)
+        return query.order_by(CourseSessionDay.date, CourseSessionDay.start_time, InstructorAssignment.id).all()
+
+class CalendarRepository:
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def get_range(self, start_date: date, end_date: date, location_id: Optional[int] = None,
+                  course_id: Optional[int] = None) -> List[CalendarDay]:
+        """Calendar rows for every session day in a date range, in calendar order.
+
+        A single range scan over calendar_days, which already holds each day's
+        session, course, location and assignment count.
+        """
+        query = self.db.query(CalendarDay).filter(CalendarDay.date.between(start_date, end_date))
+        if location_id:
+            query = query.filter(CalendarDay.location_id == location_id)
+        if course_id:
+            query = query.filter(CalendarDay.course_id == course_id)
+        return query.order_by(CalendarDay.date, CalendarDay.start_time, CalendarDay.session_day_id).all()
@@ -0,0 +1,167 @@
+"""Moving and copying whole sessions by a number of days.
+
+Both operations check every shifted day at once, with one query for
+location clashes and one for instructor double bookings, and then write
+every day, and any assignments, with one set-based statement each in a
+single transaction. The EXCLUDE constraints on session_days and
+instructor_assignments still guard against changes made after the check.
+"""
+from datetime import datetime, timedelta
+from typing import List, Optional
+from sqlalchemy import DateTime, and_, insert, literal, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+from .models import AssignmentStatus, CourseSession, CourseSessionDay, InstructorAssignment, SessionStatus
+from .conflicts import ASSIGNMENT_BOOKING_CONSTRAINT, LOCATION_BOOKING_CONSTRAINT, is_exclusion_violation
+
+class RescheduleConflictError(ValueError):
+    """Raised when a session cannot be moved, copied or reinstated without double booking."""
+    def __init__(self, problems: List[str]):
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+def find_reschedule_conflicts(db: Session, session_id: int, offset_days: int, moving: bool,
+                              include_assignments: bool = True) -> List[str]:
+    """Describe every clash the session's days would have once shifted by offset_days.
+
+    When moving, the session's own days are not counted as clashes, since
+    they move too. Cancelled assignments and days of cancelled sessions hold
+    nothing, so they are never clashes.
+    """
+    day, other = aliased(CourseSessionDay), aliased(CourseSessionDay)
+    overlaps = and_(
+        other.booking.isnot(None),
+        other.date == day.date + offset_days,
+        other.start_time < day.end_time,
+        other.end_time > day.start_time
+    )
+    if moving:
+        overlaps = and_(overlaps, other.session_id != session_id)
+
+    problems = [
+        f"Session day {day_id} would overlap session day {other_id} at location {location_id}"
+        for day_id, other_id, location_id in db.query(day.id, other.id, day.location_id).join(
+            other, and_(overlaps, other.location_id == day.location_id)
+        ).filter(day.session_id == session_id).order_by(day.date, day.start_time, other.id)
+    ]
+    if include_assignments:
+        assignment, booked = aliased(InstructorAssignment), aliased(InstructorAssignment)
+        query = db.query(assignment.instructor_id, day.id, other.id).select_from(day).join(
+            assignment, assignment.session_day_id == day.id
+        ).join(
+            booked, and_(
+                booked.instructor_id == assignment.instructor_id,
+                booked.assignment_status != AssignmentStatus.CANCELLED
+            )
+        ).join(
+            other, and_(overlaps, other.id == booked.session_day_id)
+        ).filter(day.session_id == session_id, assignment.assignment_status != AssignmentStatus.CANCELLED)
+        problems += [
+            f"Instructor {instructor_id} would be double-booked on session days {day_id} and {other_id}"
+            for instructor_id, day_id, other_id in query.order_by(day.date, day.start_time, other.id)
+        ]
+    return problems
+
+def _commit(db: Session, recheck):
+    """Commit, turning a booking constraint violation into RescheduleConflictError."""
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if (is_exclusion_violation(e, LOCATION_BOOKING_CONSTRAINT)
+                or is_exclusion_violation(e, ASSIGNMENT_BOOKING_CONSTRAINT)):
+            raise RescheduleConflictError(recheck() or ["The schedule changed during the update"]) from e
+        raise
+
+def reschedule_session(db: Session, session_id: int, offset_days: int) -> Optional[CourseSession]:
+    """Move a session, its days and their assignments by offset_days.
+
+    Returns None if the session does not exist; raises RescheduleConflictError
+    listing every clash the move would cause. A cancelled session books
+    nothing, so it can always be moved; reinstating it is checked instead.
+    """
+    session = db.query(CourseSession).filter(CourseSession.id == session_id).first()
+    if session is None:
+        return None
+    check = lambda: find_reschedule_conflicts(db, session_id, offset_days, moving=True)
+    problems = check() if session.status != SessionStatus.CANCELLED else []
+    if problems:
+        raise RescheduleConflictError(problems)
+
+    # The trigger moves each day's assignments in a statement of its own, which can
+    # briefly overlap a later day of the session that has not moved yet
+    db.execute(text(f"SET CONSTRAINTS {ASSIGNMENT_BOOKING_CONSTRAINT} DEFERRED"))
+    session.start_date += timedelta(days=offset_days)
+    session.end_date += timedelta(days=offset_days)
+    db.execute(
+        update(CourseSessionDay).where(CourseSessionDay.session_id == session_id).values(
+            date=CourseSessionDay.date + offset_days
+        ),
+        execution_options={"synchronize_session": False}
+    )
+    _commit(db, check)
+    db.refresh(session)
+    return session
+
+def clone_session(db: Session, session_id: int, offset_days: int, include_assignments: bool = False,
+                  session_name: Optional[str] = None) -> Optional[CourseSession]:
+    """Copy a session and its days, shifted by offset_days, as a new scheduled session.
+
+    Assignments that are not cancelled are copied too when include_assignments
+    is set, as new ASSIGNED assignments. The copy is scheduled even when the
+    source is cancelled, so it is checked like any other. Returns None if the
+    session does not exist; raises RescheduleConflictError listing every clash
+    the copy would cause.
+    """
+    source = db.query(CourseSession).filter(CourseSession.id == session_id).first()
+    if source is None:
+        return None
+    check = lambda: find_reschedule_conflicts(
+        db, session_id, offset_days, moving=False, include_assignments=include_assignments
+    )
+    problems = check()
+    if problems:
+        raise RescheduleConflictError(problems)
+
+    clone = CourseSession(
+        course_id=source.course_id,
+        session_name=session_name or source.session_name,
+        start_date=source.start_date + timedelta(days=offset_days),
+        end_date=source.end_date + timedelta(days=offset_days),
+        notes=source.notes
+    )
+    db.add(clone)
+    db.flush()
+
+    day = CourseSessionDay
+    db.execute(insert(CourseSessionDay).from_select(
+        ["session_id", "day_number", "date", "location_id", "start_time", "end_time", "session_type"],
+        select(
+            literal(clone.id), day.day_number, day.date + offset_days, day.location_id,
+            day.start_time, day.end_time, day.session_type
+        ).where(day.session_id == session_id)
+    ))
+    if include_assignments:
+        # A location holds one day at a time, so location, date and start time identify the copy
+        copy = aliased(CourseSessionDay)
+        db.execute(insert(InstructorAssignment).from_select(
+            ["session_day_id", "instructor_id", "assignment_type", "assignment_status", "created_date", "notes"],
+            select(
+                copy.id, InstructorAssignment.instructor_id, InstructorAssignment.assignment_type,
+                literal(AssignmentStatus.ASSIGNED, InstructorAssignment.assignment_status.type),
+                literal(datetime.utcnow(), DateTime), InstructorAssignment.notes
+            ).join(
+                day, InstructorAssignment.session_day_id == day.id
+            ).join(copy, and_(
+                copy.session_id == clone.id,
+                copy.location_id == day.location_id,
+                copy.date == day.date + offset_days,
+                copy.start_time == day.start_time
+            )).where(
+                day.session_id == session_id,
+                InstructorAssignment.assignment_status != AssignmentStatus.CANCELLED
+            )
+        ))
+    _commit(db, check)
+    db.refresh(clone)
+    return clone
@@ -0,0 +1,38 @@
+import re
+from typing import Any, Optional
+from sqlalchemy import Column, Computed, false, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Query, deferred
+
+# The 'simple' configuration lowercases words without stemming or stop words,
+# which suits names, codes and cities
+SEARCH_CONFIG = "simple"
+
+def search_vector_column(*column_names: str):
+    """A generated tsvector column over the given text columns, kept current by PostgreSQL.
+
+    Deferred so that it is never loaded into ORM objects.
+    """
+    document = " || ' ' || ".join(f"coalesce({name}, '')" for name in column_names)
+    return deferred(Column(
+        TSVECTOR, Computed(f"to_tsvector('{SEARCH_CONFIG}'::regconfig, {document})", persisted=True)
+    ))
+
+def prefix_tsquery(text: str) -> Optional[str]:
+    """Turn free text into a tsquery matching every word as a prefix, e.g. 'jo sm' -> 'jo:* & sm:*'."""
+    words = re.findall(r"[^\W_]+", text.lower())
+    return " & ".join(f"{word}:*" for word in words) or None
+
+def ranked_search(query: Query, vector: Any, text: str, *tiebreak: Any) -> Query:
+    """Filter a query to rows whose search vector matches the text, best matches first.
+
+    Matching uses the vector's GIN index; rows are ranked with ts_rank and then
+    ordered by the tiebreak columns.
+    """
+    tsquery_text = prefix_tsquery(text)
+    if tsquery_text is None:
+        return query.filter(false())
+    tsquery = func.to_tsquery(SEARCH_CONFIG, tsquery_text)
+    return query.filter(vector.op("@@")(tsquery)).order_by(
+        func.ts_rank(vector, tsquery).desc(), *tiebreak
+    )
@@ -0,0 +1,309 @@
+"""Automatic staffing of unstaffed session days.
+
+Availability is precomputed as Python int bitsets over instructor indexes: for
+every open session day, one mask of the instructors who are cleared for its
+course, active and not already booked at that time. The solver staffs the most
+constrained days first, each with the least loaded free instructor, and then
+retries unfilled days along augmenting paths that hand an instructor's other
+day to someone else, as in Kuhn's bipartite matching algorithm.
+"""
+from collections import Counter, defaultdict, deque
+from datetime import date
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Set
+from sqlalchemy import exists
+from sqlalchemy.orm import Session
+from .models import (
+    AssignmentStatus, CourseSession, CourseSessionDay, Instructor, InstructorAssignment,
+    InstructorCourseRating, RatingType, SessionStatus
+)
+from .repository import AssignmentRepository
+
+class ProposedAssignment(NamedTuple):
+    """One instructor placed on one session day by the solver."""
+    session_day_id: int
+    instructor_id: int
+
+class SchedulePlan(NamedTuple):
+    """A proposed set of assignments and the session days that could not be staffed."""
+    assignments: List[ProposedAssignment]
+    unfilled: List[int]
+
+class PlanConflictError(ValueError):
+    """Raised when a plan can no longer be committed as proposed."""
+    def __init__(self, problems: List[str]):
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+def _bits(mask: int) -> Iterator[int]:
+    """Yield the index of each set bit, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+def _overlapping_pairs(slots: Sequence) -> Iterator[tuple]:
+    """Yield index pairs of slots that overlap in time on the same date.
+
+    Each slot is a (date, start_time, end_time, ...) tuple.
+    """
+    by_date = defaultdict(list)
+    for k, slot in enumerate(slots):
+        by_date[slot[0]].append(k)
+    for same_date in by_date.values():
+        same_date.sort(key=lambda k: slots[k][1])
+        for position, k in enumerate(same_date):
+            for other in same_date[position + 1:]:
+                # Sorted by start time, so nothing later can overlap once one starts after k ends
+                if slots[other][1] >= slots[k][2]:
+                    break
+                yield k, other
+
+class _Solver:
+    def __init__(self, eligible: List[int], overlaps: List[List[int]], load: List[int], max_load: int):
+        self.eligible = eligible
+        self.overlaps = overlaps
+        self.load = load
+        self.max_load = max_load
+        self.assignment: List[Optional[int]] = [None] * len(eligible)
+        self.held: Dict[int, Set[int]] = defaultdict(set)
+        self.under_limit = 0
+        for i, count in enumerate(load):
+            if count < max_load:
+                self.under_limit |= 1 << i
+
+    def _taken(self, k: int) -> int:
+        """Instructors holding a slot that overlaps slot k."""
+        taken = 0
+        for other in self.overlaps[k]:
+            i = self.assignment[other]
+            if i is not None:
+                taken |= 1 << i
+        return taken
+
+    def _assign(self, k: int, i: int):
+        self.assignment[k] = i
+        self.held[i].add(k)
+        self.load[i] += 1
+        if self.load[i] >= self.max_load:
+            self.under_limit &= ~(1 << i)
+
+    def _unassign(self, k: int):
+        i = self.assignment[k]
+        self.assignment[k] = None
+        self.held[i].discard(k)
+        self.load[i] -= 1
+        if self.load[i] < self.max_load:
+            self.under_limit |= 1 << i
+
+    def _least_loaded(self, mask: int) -> int:
+        return min(_bits(mask), key=lambda i: (self.load[i], i))
+
+    def _place(self, k: int) -> bool:
+        """Give slot k the least loaded instructor who can take it outright."""
+        ready = self.eligible[k] & ~self._taken(k) & self.under_limit
+        if not ready:
+            return False
+        self._assign(k, self._least_loaded(ready))
+        return True
+
+    def _augment(self, root: int) -> bool:
+        """Staff slot root by moving other slots to new instructors along an alternating path.
+
+        Breadth-first search from the unstaffed slot. An eligible instructor who
+        is held back by a single slot of theirs (overlapping in time, or using
+        their last unit of load) can take the slot if that slot is passed on to
+        someone else. The shortest path ending at an instructor who is free
+        outright is applied. Each instructor appears once, so every swap along
+        the path stays valid.
+        """
+        parent = {root: None}
+        seen_instructors = 0
+        queue = deque([root])
+        while queue:
+            k = queue.popleft()
+            candidates = self.eligible[k] & ~seen_instructors
+            seen_instructors |= candidates
+            for i in _bits(candidates):
+                blockers = self.held[i].intersection(self.overlaps[k])
+                if not blockers and self.load[i] < self.max_load:
+                    self._apply_path(parent, k, i)
+                    return True
+                if len(blockers) == 1:
+                    handoffs = blockers
+                elif not blockers:
+                    handoffs = self.held[i]
+                else:
+                    continue
+                for other in handoffs:
+                    if other not in parent:
+                        parent[other] = (k, i)
+                        queue.append(other)
+        return False
+
+    def _apply_path(self, parent: dict, k: int, i: int):
+        """Give slot k to instructor i, then each slot up the path to the instructor it freed."""
+        while True:
+            link = parent[k]
+            if self.assignment[k] is not None:
+                self._unassign(k)
+            self._assign(k, i)
+            if link is None:
+                return
+            k, i = link
+
+    def solve(self) -> List[Optional[int]]:
+        # Most constrained slots first, while there is the most choice left for them
+        order = sorted(range(len(self.eligible)), key=lambda k: self.eligible[k].bit_count())
+        unfilled = [k for k in order if not self._place(k)]
+        for k in unfilled:
+            if self.eligible[k]:
+                self._augment(k)
+        return self.assignment
+
+def propose_schedule(db: Session, date_from: date, date_to: date, max_load: int = 20) -> SchedulePlan:
+    """Propose instructors for every unstaffed session day between two dates.
+
+    A session day is unstaffed when it has no assignments that are not cancelled
+    and its session is not cancelled. Proposed instructors are active, CLEARED
+    for the course, free at that time, and hold at most ``max_load`` assignments
+    in the date range, counting existing ones. Cancelled assignments and days of
+    cancelled sessions hold nothing, so they neither block nor load anyone. Nothing is written; commit the plan with commit_plan.
+    """
+    slots = db.query(
+        CourseSessionDay.date, CourseSessionDay.start_time, CourseSessionDay.end_time,
+        CourseSessionDay.id, CourseSession.course_id
+    ).join(CourseSession, CourseSessionDay.session_id == CourseSession.id).filter(
+        CourseSessionDay.date.between(date_from, date_to),
+        CourseSession.status != SessionStatus.CANCELLED,
+        ~exists().where(
+            InstructorAssignment.session_day_id == CourseSessionDay.id,
+            InstructorAssignment.assignment_status != AssignmentStatus.CANCELLED
+        )
+    ).order_by(CourseSessionDay.date, CourseSessionDay.start_time, CourseSessionDay.id).all()
+    if not slots:
+        return SchedulePlan(assignments=[], unfilled=[])
+
+    cleared = db.query(InstructorCourseRating.instructor_id, InstructorCourseRating.course_id).join(
+        Instructor, InstructorCourseRating.instructor_id == Instructor.id
+    ).filter(
+        InstructorCourseRating.course_id.in_({slot.course_id for slot in slots}),
+        InstructorCourseRating.rating == RatingType.CLEARED,
+        Instructor.active_status == True
+    ).all()
+    instructor_ids = sorted({instructor_id for instructor_id, _ in cleared})
+    index = {instructor_id: i for i, instructor_id in enumerate(instructor_ids)}
+    cleared_mask = defaultdict(int)
+    for instructor_id, course_id in cleared:
+        cleared_mask[course_id] |= 1 << index[instructor_id]
+
+    booked = db.query(
+        CourseSessionDay.date, CourseSessionDay.start_time, CourseSessionDay.end_time,
+        InstructorAssignment.instructor_id
+    ).join(InstructorAssignment.session_day).filter(
+        CourseSessionDay.date.between(date_from, date_to),
+        CourseSessionDay.booking.isnot(None),
+        InstructorAssignment.instructor_id.in_(instructor_ids),
+        InstructorAssignment.assignment_status != AssignmentStatus.CANCELLED
+    ).all() if instructor_ids else []
+    load = [0] * len(instructor_ids)
+    for booking in booked:
+        load[index[booking.instructor_id]] += 1
+
+    # Existing bookings and open slots share one timeline; overlaps between
+    # two open slots constrain the solver, those with a booking rule it out
+    eligible = [cleared_mask[slot.course_id] for slot in slots]
+    overlaps = [[] for _ in slots]
+    timeline = list(slots) + list(booked)
+    for a, b in _overlapping_pairs(timeline):
+        a, b = min(a, b), max(a, b)
+        if b < len(slots):
+            overlaps[a].append(b)
+            overlaps[b].append(a)
+        elif a < len(slots):
+            eligible[a] &= ~(1 << index[timeline[b].instructor_id])
+
+    assignment = _Solver(eligible, overlaps, load, max_load).solve()
+    return SchedulePlan(
+        assignments=[
+            ProposedAssignment(slot.id, instructor_ids[i])
+            for slot, i in zip(slots, assignment) if i is not None
+        ],
+        unfilled=[slot.id for slot, i in zip(slots, assignment) if i is None]
+    )
+
+def commit_plan(db: Session, assignments: Sequence[ProposedAssignment]) -> List[InstructorAssignment]:
+    """Create every assignment in a plan in one transaction, or none of them.
+
+    The plan is checked again first, since the schedule may have changed since
+    it was proposed. Raises PlanConflictError listing every problem found.
+    """
+    day_ids = [a.session_day_id for a in assignments]
+    instructor_ids = {a.instructor_id for a in assignments}
+    days = {
+        day.id: day for day in db.query(
+            CourseSessionDay.id, CourseSessionDay.date, CourseSessionDay.start_time,
+            CourseSessionDay.end_time, CourseSessionDay.session_type, CourseSession.course_id,
+            exists().where(
+                InstructorAssignment.session_day_id == CourseSessionDay.id,
+                InstructorAssignment.assignment_status != AssignmentStatus.CANCELLED
+            ).label("staffed")
+        ).join(CourseSession, CourseSessionDay.session_id == CourseSession.id).filter(
+            CourseSessionDay.id.in_(day_ids)
+        )
+    }
+    cleared = set(db.query(InstructorCourseRating.instructor_id, InstructorCourseRating.course_id).join(
+        Instructor, InstructorCourseRating.instructor_id == Instructor.id
+    ).filter(
+        InstructorCourseRating.instructor_id.in_(instructor_ids),
+        InstructorCourseRating.rating == RatingType.CLEARED,
+        Instructor.active_status == True
+    ).all())
+
+    problems = []
+    for day_id, count in Counter(day_ids).items():
+        if count > 1:
+            problems.append(f"Session day {day_id} is in the plan more than once")
+    planned = []
+    seen = set()
+    for a in assignments:
+        day = days.get(a.session_day_id)
+        if a.session_day_id in seen:
+            continue
+        seen.add(a.session_day_id)
+        if day is None:
+            problems.append(f"Session day {a.session_day_id} not found")
+        elif day.staffed:
+            problems.append(f"Session day {day.id} is already staffed")
+        elif (a.instructor_id, day.course_id) not in cleared:
+            problems.append(f"Instructor {a.instructor_id} is not cleared for session day {day.id}")
+        else:
+            planned.append((day.date, day.start_time, day.end_time, a.instructor_id, day.id))
+
+    if planned:
+        booked = db.query(
+            CourseSessionDay.date, CourseSessionDay.start_time, CourseSessionDay.end_time,
+            InstructorAssignment.instructor_id, CourseSessionDay.id
+        ).join(InstructorAssignment.session_day).filter(
+            CourseSessionDay.date.between(min(p[0] for p in planned), max(p[0] for p in planned)),
+            CourseSessionDay.booking.isnot(None),
+            InstructorAssignment.instructor_id.in_(instructor_ids),
+            InstructorAssignment.assignment_status != AssignmentStatus.CANCELLED
+        ).all()
+        timeline = planned + [tuple(b) for b in booked]
+        for a, b in _overlapping_pairs(timeline):
+            if timeline[a][3] == timeline[b][3] and min(a, b) < len(planned):
+                first, second = sorted((timeline[a][4], timeline[b][4]))
+                problems.append(
+                    f"Instructor {timeline[a][3]} would be double-booked on session days {first} and {second}"
+                )
+    if problems:
+        raise PlanConflictError(problems)
+
+    return AssignmentRepository(db).create_assignments_bulk([
+        {
+            "session_day_id": a.session_day_id,
+            "instructor_id": a.instructor_id,
+            "assignment_type": days[a.session_day_id].session_type
+        }
+        for a in assignments
+    ])
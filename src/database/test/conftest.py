@@ -8,11 +8,21 @@ from sqlalchemy.orm import sessionmaker
 from pytest_postgresql.factories import postgresql_proc, postgresql
 from src.database.connection import Base
 from src.database.models import *
+from src.database.cache import course_cache, location_cache
+from src.database.clearance import clearance_matrix
 
 # PostgreSQL process and database fixtures
 postgresql_proc = postgresql_proc(port=None, unixsocketdir='/tmp')
 postgresql = postgresql('postgresql_proc')
 
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    '''Start each test with empty in-process caches, since ids repeat across test databases.'''
+    course_cache.clear()
+    location_cache.clear()
+    clearance_matrix.reset()
+    yield
+
 @pytest.fixture(scope='function')
 def db_engine(postgresql):
     """Create test database engine using PostgreSQL for testing."""
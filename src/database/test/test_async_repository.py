@@ -0,0 +1,66 @@
+import pytest
+import pytest_asyncio
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from src.database.connection import create_async_session_factory
+from src.database.async_repository import AsyncInstructorRepository, AsyncCourseRepository
+
+@pytest_asyncio.fixture
+async def async_db_session(db_engine, postgresql):
+    """Create an async session on the test database."""
+    engine = create_async_engine(
+        f"postgresql+asyncpg://{postgresql.info.user}:@{postgresql.info.host}:{postgresql.info.port}/{postgresql.info.dbname}",
+        poolclass=NullPool,
+        echo=False
+    )
+    async with create_async_session_factory(engine)() as session:
+        yield session
+    await engine.dispose()
+
+class TestAsyncRepository:
+    @pytest.mark.asyncio
+    async def test_create_and_get(self, async_db_session):
+        repo = AsyncInstructorRepository(async_db_session)
+
+        instructor = await repo.create(
+            first_name="Jane", last_name="Smith", email="jane.smith@example.com"
+        )
+        found = await repo.get_by_id(instructor.id)
+
+        assert found.id == instructor.id
+        assert found.email == "jane.smith@example.com"
+
+    @pytest.mark.asyncio
+    async def test_sees_committed_data(self, async_db_session, sample_course):
+        repo = AsyncCourseRepository(async_db_session)
+
+        page = await repo.get_page(with_total=True)
+
+        assert page.total == 1
+        assert [c.id for c in page.items] == [sample_course.id]
+
+    @pytest.mark.asyncio
+    async def test_private_methods_not_exposed(self, async_db_session):
+        repo = AsyncInstructorRepository(async_db_session)
+
+        with pytest.raises(AttributeError):
+            repo._filtered_query
+        with pytest.raises(AttributeError):
+            repo.missing_method
+
+    @pytest.mark.asyncio
+    async def test_relationships_raise_unless_loaded(self, async_db_session, instructor_with_rating):
+        sample_instructor, _, sample_rating = instructor_with_rating
+        repo = AsyncInstructorRepository(async_db_session)
+
+        instructor = await repo.get_by_id(sample_instructor.id)
+        with pytest.raises(InvalidRequestError):
+            instructor.course_ratings
+
+        detailed = await repo.get_with_details(sample_instructor.id)
+        assert [r.id for r in detailed.course_ratings] == [sample_rating.id]
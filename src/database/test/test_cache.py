@@ -0,0 +1,74 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from sqlalchemy import event, text
+from src.database.cache import TTLCache
+from src.database.repository import CourseRepository, LocationRepository
+
+@pytest.fixture
+def query_count(db_engine):
+    """Count statements executed on the test engine."""
+    statements = []
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    event.listen(db_engine, "before_cursor_execute", count)
+    yield statements
+    event.remove(db_engine, "before_cursor_execute", count)
+
+class TestTTLCache:
+    def test_entries_expire(self):
+        now = [0.0]
+        cache = TTLCache(ttl_seconds=10, clock=lambda: now[0])
+        cache.set("a", 1)
+
+        now[0] = 9.9
+        assert cache.get("a") == 1
+        now[0] = 10
+        assert cache.get("a") is None
+
+    def test_invalidate_and_clear(self):
+        cache = TTLCache(ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        assert cache.get("a", "missing") == "missing"
+        assert cache.get("b") == 2
+        cache.clear()
+        assert cache.get("b") is None
+
+class TestReferenceCache:
+    def test_course_read_through(self, db_session, sample_course, query_count):
+        repo = CourseRepository(db_session)
+
+        first = repo.get_cached(sample_course.id)
+        queries = len(query_count)
+        second = repo.get_cached(sample_course.id)
+
+        assert first.course_code == sample_course.course_code
+        assert second == first
+        assert len(query_count) == queries
+        assert repo.get_cached(99999) is None
+
+    def test_course_invalidated_on_update(self, db_session, sample_course):
+        repo = CourseRepository(db_session)
+        repo.get_cached(sample_course.id)
+
+        repo.set_active_status(sample_course.id, False)
+
+        assert repo.get_cached(sample_course.id).active_status == False
+
+    def test_location_invalidated_on_update(self, db_session, sample_location):
+        repo = LocationRepository(db_session)
+        original_city = repo.get_cached(sample_location.id).city
+
+        # Changes made outside the repository are only seen once the entry expires
+        db_session.execute(text("UPDATE locations SET city = 'Elsewhere'"))
+        db_session.commit()
+        assert repo.get_cached(sample_location.id).city == original_city
+
+        sample_location.city = "Updated City"
+        repo.update(sample_location)
+        assert repo.get_cached(sample_location.id).city == "Updated City"
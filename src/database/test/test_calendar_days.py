@@ -0,0 +1,107 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from datetime import date, time
+from src.database.repository import (
+    InstructorRepository, CourseRepository, LocationRepository, SessionRepository,
+    AssignmentRepository, CalendarRepository
+)
+from src.database.models import (
+    CalendarDay, CourseSessionDay, SessionType, SessionStatus, AssignmentStatus
+)
+
+@pytest.fixture
+def session_day(db_session, sample_course, sample_location):
+    session = SessionRepository(db_session).create_session(
+        sample_course.id, "July Session", date(2024, 7, 1), date(2024, 7, 2)
+    )
+    day = CourseSessionDay(
+        session_id=session.id, day_number=1, date=date(2024, 7, 1), location_id=sample_location.id,
+        start_time=time(9, 0), end_time=time(17, 0), session_type=SessionType.FULL_DAY
+    )
+    db_session.add(day)
+    db_session.commit()
+    return day
+
+def calendar_row(db_session, session_day_id):
+    db_session.expire_all()
+    return db_session.get(CalendarDay, session_day_id)
+
+class TestCalendarDays:
+    def test_row_added_with_session_day(self, db_session, session_day, sample_course, sample_location):
+        row = calendar_row(db_session, session_day.id)
+
+        assert row.date == date(2024, 7, 1)
+        assert (row.start_time, row.end_time) == (time(9, 0), time(17, 0))
+        assert row.session_type == SessionType.FULL_DAY
+        assert row.session_name == "July Session"
+        assert row.session_status == SessionStatus.SCHEDULED
+        assert (row.course_id, row.course_name, row.course_code) == (
+            sample_course.id, sample_course.course_name, sample_course.course_code
+        )
+        assert (row.location_id, row.location_name, row.city) == (
+            sample_location.id, sample_location.location_name, sample_location.city
+        )
+        assert row.assignment_count == 0
+
+    def test_assignment_count_follows_assignments(self, db_session, session_day, sample_instructor):
+        repo = AssignmentRepository(db_session)
+        other = InstructorRepository(db_session).create("Other", "Instructor", "other@test.com")
+        first = repo.create_assignment(session_day.id, sample_instructor.id, SessionType.FULL_DAY)
+        repo.create_assignments_bulk([
+            {"session_day_id": session_day.id, "instructor_id": other.id, "assignment_type": SessionType.FULL_DAY}
+        ])
+        assert calendar_row(db_session, session_day.id).assignment_count == 2
+
+        repo.update_status(first.id, AssignmentStatus.CANCELLED)
+        assert calendar_row(db_session, session_day.id).assignment_count == 1
+
+        db_session.delete(repo.get_by_id(first.id))
+        db_session.commit()
+        assert calendar_row(db_session, session_day.id).assignment_count == 1
+
+    def test_row_follows_session_day_changes(self, db_session, session_day):
+        session_day.date = date(2024, 7, 2)
+        session_day.start_time = time(13, 0)
+        db_session.commit()
+        row = calendar_row(db_session, session_day.id)
+        assert (row.date, row.start_time) == (date(2024, 7, 2), time(13, 0))
+
+        db_session.delete(session_day)
+        db_session.commit()
+        assert calendar_row(db_session, session_day.id) is None
+
+    def test_row_follows_referenced_rows(self, db_session, session_day, sample_course, sample_location):
+        sample_course.course_name = "Renamed Course"
+        CourseRepository(db_session).update(sample_course)
+        sample_location.city = "New City"
+        LocationRepository(db_session).update(sample_location)
+        SessionRepository(db_session).update_status(session_day.session_id, SessionStatus.CANCELLED)
+
+        row = calendar_row(db_session, session_day.id)
+        assert row.course_name == "Renamed Course"
+        assert row.city == "New City"
+        assert row.session_status == SessionStatus.CANCELLED
+
+    def test_get_range(self, db_session, session_day, sample_course, sample_location):
+        other_location = LocationRepository(db_session).create("Other Site")
+        later = CourseSessionDay(
+            session_id=session_day.session_id, day_number=2, date=date(2024, 7, 2), location_id=other_location.id,
+            start_time=time(9, 0), end_time=time(12, 0), session_type=SessionType.HALF_DAY
+        )
+        outside = CourseSessionDay(
+            session_id=session_day.session_id, day_number=3, date=date(2024, 8, 1), location_id=sample_location.id,
+            start_time=time(9, 0), end_time=time(17, 0), session_type=SessionType.FULL_DAY
+        )
+        db_session.add_all([later, outside])
+        db_session.commit()
+        repo = CalendarRepository(db_session)
+
+        july = repo.get_range(date(2024, 7, 1), date(2024, 7, 31))
+        assert [row.session_day_id for row in july] == [session_day.id, later.id]
+        assert [row.session_day_id for row in repo.get_range(
+            date(2024, 7, 1), date(2024, 7, 31), location_id=other_location.id
+        )] == [later.id]
+        assert repo.get_range(date(2024, 7, 1), date(2024, 7, 31), course_id=sample_course.id + 1) == []
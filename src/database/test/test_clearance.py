@@ -0,0 +1,175 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from sqlalchemy import event, text
+from src.database.clearance import ClearanceMatrix, clearance_matrix, get_clearance_matrix
+from src.database.utils import is_instructor_cleared_for_course
+from src.database.repository import InstructorRepository, CourseRepository, RatingRepository
+from src.database.models import RatingType
+
+@pytest.fixture
+def ratings(db_session):
+    """Two courses; Ann cleared for both, Ben for the first, Cal observing the second."""
+    instructor_repo = InstructorRepository(db_session)
+    course_repo = CourseRepository(db_session)
+    ann, ben, cal = [
+        instructor_repo.create(name, "Instructor", f"{name.lower()}@test.com")
+        for name in ("Ann", "Ben", "Cal")
+    ]
+    first = course_repo.create("First Course", "FC101")
+    second = course_repo.create("Second Course", "SC101")
+    rating_repo = RatingRepository(db_session)
+    rating_repo.create_or_update_rating(ann.id, first.id, RatingType.CLEARED)
+    rating_repo.create_or_update_rating(ann.id, second.id, RatingType.CLEARED)
+    rating_repo.create_or_update_rating(ben.id, first.id, RatingType.CLEARED)
+    rating_repo.create_or_update_rating(cal.id, second.id, RatingType.OBSERVE)
+    return ann, ben, cal, first, second
+
+class TestClearanceMatrix:
+    def test_bit_operations(self):
+        matrix = ClearanceMatrix()
+        matrix._version = 0
+        matrix.set_cleared(3, 1, True)
+        matrix.set_cleared(1000, 1, True)
+        matrix.set_cleared(3, 2, True)
+        matrix.set_cleared(3, 2, False)
+        matrix.set_cleared(5000, 2, False)
+
+        assert matrix.is_cleared(3, 1)
+        assert not matrix.is_cleared(4, 1)
+        assert not matrix.is_cleared(3, 2)
+        assert not matrix.is_cleared(3, 99)
+        assert matrix.cleared_instructors(1) == [3, 1000]
+        assert matrix.cleared_mask(1) == (1 << 3) | (1 << 1000)
+        assert matrix.cleared_courses(3) == [1]
+
+    def test_repeated_lookups_cost_no_queries(self, db_session, db_engine, ratings):
+        instructor_ids = [instructor.id for instructor in ratings[:3]]
+        course_ids = [course.id for course in ratings[3:]]
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            # The version and the ratings, once
+            matrix = get_clearance_matrix(db_session)
+            assert len(statements) == 2
+            lookups = [
+                is_instructor_cleared_for_course(db_session, i, c) for i in instructor_ids for c in course_ids
+            ]
+            cleared = RatingRepository(db_session).get_cleared_instructors_for_course(course_ids[0])
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+
+        assert len(statements) == 2
+        ann, ben, cal = instructor_ids
+        first, second = course_ids
+        assert lookups == [True, True, True, False, False, False]
+        assert cleared == [ann, ben]
+        assert matrix.cleared_courses(ann) == [first, second]
+        assert matrix.cleared_mask(first) & matrix.cleared_mask(second) == 1 << ann
+
+    def test_kept_current_on_orm_writes(self, db_session, ratings):
+        ann, ben, cal, first, second = ratings
+        matrix = get_clearance_matrix(db_session)
+        rating_repo = RatingRepository(db_session)
+
+        rating_repo.create_or_update_rating(cal.id, second.id, RatingType.CLEARED)
+        rating_repo.create_or_update_rating(ann.id, first.id, RatingType.CO_TEACH)
+        db_session.delete(rating_repo.get_rating(ben.id, first.id))
+        db_session.commit()
+
+        assert matrix.cleared_instructors(second.id) == [ann.id, cal.id]
+        assert matrix.cleared_instructors(first.id) == []
+
+    def test_moved_rating_clears_old_pair(self, db_session, ratings):
+        ann, ben, cal, first, second = ratings
+        matrix = get_clearance_matrix(db_session)
+
+        rating = RatingRepository(db_session).get_rating(ben.id, first.id)
+        rating.course_id = second.id
+        db_session.commit()
+
+        assert not matrix.is_cleared(ben.id, first.id)
+        assert matrix.is_cleared(ben.id, second.id)
+
+    def test_rollback_discards_changes(self, db_session, ratings):
+        ann, ben, cal, first, second = ratings
+        matrix = get_clearance_matrix(db_session)
+
+        rating = RatingRepository(db_session).get_rating(cal.id, second.id)
+        rating.rating = RatingType.CLEARED
+        db_session.flush()
+        db_session.rollback()
+        db_session.commit()
+
+        assert not matrix.is_cleared(cal.id, second.id)
+
+    def test_kept_current_on_bulk_upsert(self, db_session, ratings):
+        ann, ben, cal, first, second = ratings
+        matrix = get_clearance_matrix(db_session)
+
+        RatingRepository(db_session).bulk_upsert_ratings([ben.id, cal.id], second.id, RatingType.CLEARED)
+
+        assert matrix.cleared_instructors(second.id) == [ann.id, ben.id, cal.id]
+        assert clearance_matrix.is_cleared(cal.id, second.id)
+
+    def test_sees_writes_from_other_processes_once_due(self, db_session, db_engine, ratings):
+        ann, ben, cal, first, second = ratings
+        now = [0.0]
+        matrix = ClearanceMatrix(ttl_seconds=5, clock=lambda: now[0])
+        assert not matrix.ensure_loaded(db_session).is_cleared(cal.id, second.id)
+
+        # Statements on another connection fire none of this process's session events
+        with db_engine.begin() as conn:
+            conn.execute(text(
+                "UPDATE instructor_course_ratings SET rating = 'CLEARED' "
+                "WHERE instructor_id = :instructor AND course_id = :course"
+            ), {"instructor": cal.id, "course": second.id})
+        now[0] = 4.0
+        assert not matrix.ensure_loaded(db_session).is_cleared(cal.id, second.id)
+        now[0] = 5.0
+        assert matrix.ensure_loaded(db_session).is_cleared(cal.id, second.id)
+
+        with db_engine.begin() as conn:
+            conn.execute(text("DELETE FROM instructor_course_ratings WHERE instructor_id = :instructor"),
+                         {"instructor": ann.id})
+        now[0] = 10.0
+        assert matrix.ensure_loaded(db_session).cleared_instructors(second.id) == [cal.id]
+
+    def test_unchanged_version_is_not_reloaded(self, db_session, db_engine, ratings):
+        now = [0.0]
+        matrix = ClearanceMatrix(ttl_seconds=5, clock=lambda: now[0])
+        matrix.ensure_loaded(db_session)
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            now[0] = 5.0
+            matrix.ensure_loaded(db_session)
+            matrix.ensure_loaded(db_session)
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+
+        # One primary key lookup of the version, then trusted for another ttl
+        assert len(statements) == 1
+        assert "clearance_version" in statements[0]
+
+    def test_keeps_changes_made_during_a_load(self, db_session, db_engine, ratings):
+        ann, ben, cal, first, second = ratings
+        matrix = ClearanceMatrix()
+        matrix.load(db_session)
+
+        def commit_elsewhere(conn, cursor, statement, *args):
+            # Another thread commits a change while the rows are being read
+            if "instructor_course_ratings.course_id" in statement:
+                matrix.set_cleared(cal.id, second.id, True)
+        event.listen(db_engine, "before_cursor_execute", commit_elsewhere)
+        try:
+            matrix.load(db_session)
+        finally:
+            event.remove(db_engine, "before_cursor_execute", commit_elsewhere)
+
+        assert matrix.is_cleared(cal.id, second.id)
+        assert matrix.cleared_instructors(first.id) == [ann.id, ben.id]
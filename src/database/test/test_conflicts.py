@@ -0,0 +1,314 @@
+import pytest
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from datetime import date, time
+from sqlalchemy import text
+from src.database.conflicts import (
+    InstructorConflictError, LocationConflictError, find_instructor_conflicts, find_instructor_conflicts_batch,
+    find_staffing_candidates
+)
+from src.database.repository import (
+    InstructorRepository, LocationRepository, RatingRepository, SessionRepository,
+    CourseSessionDayRepository, AssignmentRepository
+)
+from src.database.rescheduling import RescheduleConflictError
+from src.database.models import AssignmentStatus, InstructorAssignment, RatingType, SessionStatus, SessionType
+
+@pytest.fixture
+def assigned_morning(db_session, sample_instructor, sample_course, sample_location):
+    """Assign the sample instructor to a 09:00-12:00 session day."""
+    session = SessionRepository(db_session).create_session(
+        sample_course.id, "Morning Session", date(2024, 9, 2), date(2024, 9, 2)
+    )
+    session_day = CourseSessionDayRepository(db_session).create(
+        session.id, 1, date(2024, 9, 2), sample_location.id,
+        time(9, 0), time(12, 0), SessionType.HALF_DAY
+    )
+    return AssignmentRepository(db_session).create_assignment(
+        session_day.id, sample_instructor.id, SessionType.HALF_DAY
+    )
+
+@pytest.fixture
+def new_room(db_session):
+    """Create a fresh location, for session days that overlap ones already booked elsewhere."""
+    rooms = iter(range(1, 100))
+    return lambda: LocationRepository(db_session).create(f"Room {next(rooms)}")
+
+class TestFindInstructorConflicts:
+    def test_no_assignments(self, db_session, sample_instructor):
+        result = find_instructor_conflicts(
+            db_session, sample_instructor.id, date(2024, 9, 2), time(9, 0), time(17, 0)
+        )
+
+        assert result.available == True
+        assert result.conflicts == []
+
+    def test_overlapping_assignment(self, db_session, sample_instructor, assigned_morning):
+        result = find_instructor_conflicts(
+            db_session, sample_instructor.id, date(2024, 9, 2), time(11, 0), time(15, 0)
+        )
+
+        assert result.available == False
+        assert [a.id for a in result.conflicts] == [assigned_morning.id]
+        # The session day comes back with the conflict
+        assert 'session_day' in result.conflicts[0].__dict__
+        assert result.conflicts[0].session_day.start_time == time(9, 0)
+
+    def test_adjacent_slot_is_available(self, db_session, sample_instructor, assigned_morning):
+        result = find_instructor_conflicts(
+            db_session, sample_instructor.id, date(2024, 9, 2), time(12, 0), time(16, 0)
+        )
+
+        assert result.available == True
+
+    def test_other_date_is_available(self, db_session, sample_instructor, assigned_morning):
+        result = find_instructor_conflicts(
+            db_session, sample_instructor.id, date(2024, 9, 3), time(9, 0), time(12, 0)
+        )
+
+        assert result.available == True
+
+class TestFindInstructorConflictsBatch:
+    def test_reports_conflicts_per_session_day(self, db_session, sample_instructor, sample_course,
+                                               sample_location, new_room, assigned_morning):
+        session = SessionRepository(db_session).create_session(
+            sample_course.id, "Requested Session", date(2024, 9, 2), date(2024, 9, 4)
+        )
+        day_repo = CourseSessionDayRepository(db_session)
+        overlapping = day_repo.create(
+            session.id, 1, date(2024, 9, 2), new_room().id,
+            time(11, 0), time(15, 0), SessionType.HALF_DAY
+        )
+        afternoon = day_repo.create(
+            session.id, 2, date(2024, 9, 2), new_room().id,
+            time(13, 0), time(17, 0), SessionType.HALF_DAY
+        )
+        next_day = day_repo.create(
+            session.id, 3, date(2024, 9, 4), sample_location.id,
+            time(9, 0), time(12, 0), SessionType.HALF_DAY
+        )
+
+        conflicts = find_instructor_conflicts_batch(
+            db_session, sample_instructor.id, [overlapping, afternoon, next_day]
+        )
+
+        assert [a.id for a in conflicts[overlapping.id]] == [assigned_morning.id]
+        assert conflicts[afternoon.id] == []
+        assert conflicts[next_day.id] == []
+
+    def test_empty_request(self, db_session, sample_instructor):
+        assert find_instructor_conflicts_batch(db_session, sample_instructor.id, []) == {}
+
+class TestFindStaffingCandidates:
+    def test_cleared_free_instructors_ranked_by_load(self, db_session, sample_instructor, sample_course,
+                                                     sample_location, new_room, assigned_morning):
+        instructor_repo = InstructorRepository(db_session)
+        rating_repo = RatingRepository(db_session)
+        free = instructor_repo.create("Fay", "Free", "fay@test.com")
+        busy_elsewhere = instructor_repo.create("Lou", "Loaded", "lou@test.com")
+        co_teach = instructor_repo.create("Cody", "Coteach", "cody@test.com")
+        inactive = instructor_repo.create("Ina", "Inactive", "ina@test.com")
+        instructor_repo.set_active_status(inactive.id, False)
+        for instructor in (sample_instructor, free, busy_elsewhere, inactive):
+            rating_repo.create_or_update_rating(instructor.id, sample_course.id, RatingType.CLEARED)
+        rating_repo.create_or_update_rating(co_teach.id, sample_course.id, RatingType.CO_TEACH)
+
+        session = SessionRepository(db_session).create_session(
+            sample_course.id, "Requested Session", date(2024, 9, 2), date(2024, 9, 3)
+        )
+        day_repo = CourseSessionDayRepository(db_session)
+        requested = day_repo.create(
+            session.id, 1, date(2024, 9, 2), new_room().id,
+            time(11, 0), time(15, 0), SessionType.HALF_DAY
+        )
+        next_day = day_repo.create(
+            session.id, 2, date(2024, 9, 3), sample_location.id,
+            time(9, 0), time(12, 0), SessionType.HALF_DAY
+        )
+        AssignmentRepository(db_session).create_assignment(
+            next_day.id, busy_elsewhere.id, SessionType.HALF_DAY
+        )
+
+        candidates = find_staffing_candidates(db_session, requested)
+
+        # sample_instructor overlaps; co-teach and inactive instructors are not eligible
+        assert [(c.instructor.id, c.current_load) for c in candidates] == [
+            (free.id, 0), (busy_elsewhere.id, 1)
+        ]
+
+    def test_load_window(self, db_session, sample_instructor, sample_course, sample_location, assigned_morning):
+        RatingRepository(db_session).create_or_update_rating(
+            sample_instructor.id, sample_course.id, RatingType.CLEARED
+        )
+        session = SessionRepository(db_session).create_session(
+            sample_course.id, "Later Session", date(2024, 10, 1), date(2024, 10, 1)
+        )
+        later = CourseSessionDayRepository(db_session).create(
+            session.id, 1, date(2024, 10, 1), sample_location.id,
+            time(9, 0), time(12, 0), SessionType.HALF_DAY
+        )
+
+        assert [c.current_load for c in find_staffing_candidates(db_session, later)] == [1]
+        assert [c.current_load for c in find_staffing_candidates(db_session, later, load_window_days=7)] == [0]
+
+class TestLocationBooking:
+    @pytest.fixture
+    def book(self, db_session, sample_course):
+        """Create a half day on 2024-09-02 at a location and time."""
+        session = SessionRepository(db_session).create_session(
+            sample_course.id, "Bookings", date(2024, 9, 2), date(2024, 9, 2)
+        )
+        day_numbers = iter(range(1, 100))
+        return lambda location, start, end: CourseSessionDayRepository(db_session).create(
+            session.id, next(day_numbers), date(2024, 9, 2), location.id, start, end, SessionType.HALF_DAY
+        )
+
+    def test_overlap_is_rejected_with_clashes(self, db_session, sample_location, assigned_morning, book):
+        with pytest.raises(LocationConflictError) as exc_info:
+            book(sample_location, time(11, 0), time(14, 0))
+        assert exc_info.value.location_id == sample_location.id
+        assert [d.id for d in exc_info.value.clashes] == [assigned_morning.session_day_id]
+        # The session is still usable after the rejected write
+        assert len(CourseSessionDayRepository(db_session).get_by_location_and_date(
+            sample_location.id, date(2024, 9, 2)
+        )) == 1
+
+    def test_adjacent_slot_and_other_room_are_allowed(self, sample_location, assigned_morning, book, new_room):
+        assert book(sample_location, time(12, 0), time(15, 0)).id is not None
+        assert book(new_room(), time(9, 0), time(12, 0)).id is not None
+
+    def test_update_into_overlap_is_rejected(self, db_session, sample_location, assigned_morning, book):
+        afternoon = book(sample_location, time(13, 0), time(16, 0))
+        afternoon.start_time = time(10, 0)
+        repo = CourseSessionDayRepository(db_session)
+        with pytest.raises(LocationConflictError) as exc_info:
+            repo.update(afternoon)
+        assert [d.id for d in exc_info.value.clashes] == [assigned_morning.session_day_id]
+        assert repo.get_by_id(afternoon.id).start_time == time(13, 0)
+
+    def test_cancelled_session_releases_its_room(self, db_session, sample_location, sample_instructor,
+                                                 assigned_morning, book):
+        session_repo = SessionRepository(db_session)
+        cancelled = assigned_morning.session_day.session_id
+        session_repo.update_status(cancelled, SessionStatus.CANCELLED)
+
+        # Both the room and the instructor are free while the session is cancelled
+        taken = book(sample_location, time(10, 0), time(13, 0))
+        AssignmentRepository(db_session).create_assignment(taken.id, sample_instructor.id, SessionType.HALF_DAY)
+        assert find_instructor_conflicts(
+            db_session, sample_instructor.id, date(2024, 9, 2), time(9, 0), time(12, 0)
+        ).conflicts[0].session_day_id == taken.id
+
+        with pytest.raises(RescheduleConflictError) as exc_info:
+            session_repo.update_status(cancelled, SessionStatus.SCHEDULED)
+        assert exc_info.value.problems == [
+            f"Session day {assigned_morning.session_day_id} would overlap session day {taken.id} "
+            f"at location {sample_location.id}",
+            f"Instructor {sample_instructor.id} would be double-booked on session days "
+            f"{assigned_morning.session_day_id} and {taken.id}",
+        ]
+        assert session_repo.get_by_id(cancelled).status == SessionStatus.CANCELLED
+
+class TestInstructorBooking:
+    @pytest.fixture
+    def book(self, db_session, sample_course, new_room):
+        """Create a half day on 2024-09-02 in a room of its own."""
+        session = SessionRepository(db_session).create_session(
+            sample_course.id, "Bookings", date(2024, 9, 2), date(2024, 9, 2)
+        )
+        day_numbers = iter(range(1, 100))
+        return lambda start, end: CourseSessionDayRepository(db_session).create(
+            session.id, next(day_numbers), date(2024, 9, 2), new_room().id, start, end, SessionType.HALF_DAY
+        )
+
+    def test_overlapping_assignment_is_rejected(self, db_session, sample_instructor, assigned_morning, book):
+        overlapping = book(time(11, 0), time(14, 0))
+        repo = AssignmentRepository(db_session)
+        with pytest.raises(InstructorConflictError) as exc_info:
+            repo.create_assignment(overlapping.id, sample_instructor.id, SessionType.HALF_DAY)
+        assert {day_id: [a.id for a in clashes] for day_id, clashes in exc_info.value.conflicts.items()} == {
+            overlapping.id: [assigned_morning.id]
+        }
+        assert [a.id for a in repo.get_instructor_assignments(sample_instructor.id)] == [assigned_morning.id]
+
+        adjacent = book(time(12, 0), time(15, 0))
+        assert repo.create_assignment(adjacent.id, sample_instructor.id, SessionType.HALF_DAY).id is not None
+
+    def test_cancelled_assignment_frees_instructor(self, db_session, sample_instructor, assigned_morning, book):
+        repo = AssignmentRepository(db_session)
+        repo.update_status(assigned_morning.id, AssignmentStatus.CANCELLED)
+        overlapping = book(time(11, 0), time(14, 0))
+
+        assert find_instructor_conflicts(
+            db_session, sample_instructor.id, date(2024, 9, 2), time(11, 0), time(14, 0)
+        ).available
+        reassigned = repo.create_assignment(overlapping.id, sample_instructor.id, SessionType.HALF_DAY)
+
+        # Restoring the cancelled assignment would now double-book the instructor
+        with pytest.raises(InstructorConflictError) as exc_info:
+            repo.update_status(assigned_morning.id, AssignmentStatus.ASSIGNED)
+        assert [a.id for a in exc_info.value.conflicts[assigned_morning.session_day_id]] == [reassigned.id]
+        assert repo.get_by_id(assigned_morning.id).assignment_status == AssignmentStatus.CANCELLED
+
+    def test_bulk_assignments_overlapping_each_other(self, db_session, sample_instructor, book):
+        first, second = book(time(9, 0), time(12, 0)), book(time(11, 0), time(14, 0))
+        repo = AssignmentRepository(db_session)
+        with pytest.raises(InstructorConflictError, match="overlapping session days") as exc_info:
+            repo.create_assignments_bulk([
+                {"session_day_id": day.id, "instructor_id": sample_instructor.id,
+                 "assignment_type": SessionType.HALF_DAY}
+                for day in (first, second)
+            ])
+        assert exc_info.value.conflicts == {first.id: [], second.id: []}
+        assert repo.get_instructor_assignments(sample_instructor.id) == []
+
+    def test_moving_session_day_carries_its_assignments(self, db_session, assigned_morning, book):
+        afternoon = book(time(13, 0), time(16, 0))
+        AssignmentRepository(db_session).create_assignment(
+            afternoon.id, assigned_morning.instructor_id, SessionType.HALF_DAY
+        )
+        repo = CourseSessionDayRepository(db_session)
+
+        afternoon.start_time = time(11, 0)
+        with pytest.raises(InstructorConflictError) as exc_info:
+            repo.update(afternoon)
+        assert [a.id for a in exc_info.value.conflicts[afternoon.id]] == [assigned_morning.id]
+        assert repo.get_by_id(afternoon.id).start_time == time(13, 0)
+
+        afternoon.start_time = time(12, 0)
+        repo.update(afternoon)
+        booking = db_session.query(InstructorAssignment.booking).filter(
+            InstructorAssignment.session_day_id == afternoon.id
+        ).scalar()
+        assert booking.lower.time() == time(12, 0)
+
+    def test_assignment_waits_for_concurrent_move(self, db_engine, db_session, assigned_morning):
+        other = InstructorRepository(db_session).create("Ben", "Ray", "ben.ray@example.com")
+        day_id = assigned_morning.session_day_id
+
+        def assign():
+            with db_engine.begin() as conn:
+                conn.execute(text(
+                    "INSERT INTO instructor_assignments (session_day_id, instructor_id, assignment_type, "
+                    "assignment_status, created_date) VALUES (:day, :instructor, 'HALF_DAY', 'ASSIGNED', now())"
+                ), {"day": day_id, "instructor": other.id})
+
+        with db_engine.connect() as mover:
+            mover.execute(text(
+                "UPDATE session_days SET start_time = '13:00', end_time = '16:00' WHERE id = :day"
+            ), {"day": day_id})
+            # The insert blocks on the moved day's row until the move commits
+            writer = threading.Thread(target=assign)
+            writer.start()
+            writer.join(0.5)
+            assert writer.is_alive()
+            mover.commit()
+            writer.join(10)
+
+        bookings = db_session.query(InstructorAssignment.booking).filter(
+            InstructorAssignment.session_day_id == day_id
+        ).all()
+        assert [booking.lower.time() for booking, in bookings] == [time(13, 0), time(13, 0)]
@@ -0,0 +1,60 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from sqlalchemy import event
+from src.database.imports import IMPORT_TARGETS, RowError, import_batch, insert_rows
+from datetime import date
+from src.database.models import CourseSession, Instructor, Location, SessionStatus
+
+class TestImports:
+    def test_insert_rows_in_one_statement(self, db_session, db_engine):
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            created = insert_rows(db_session, Location, [
+                {"location_name": f"Site {n}", "city": "Town" if n % 2 else None} for n in range(500)
+            ])
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+        db_session.commit()
+
+        assert created == 500
+        assert len(statements) == 1
+        locations = db_session.query(Location).order_by(Location.id).all()
+        assert [(l.location_name, l.city) for l in locations[:2]] == [("Site 0", None), ("Site 1", "Town")]
+        assert all(l.active_status for l in locations)
+
+    def test_insert_rows_applies_enum_defaults(self, db_session, sample_course):
+        insert_rows(db_session, CourseSession, [
+            {"course_id": sample_course.id, "session_name": "Imported",
+             "start_date": date(2030, 1, 1), "end_date": date(2030, 1, 2), "notes": None}
+        ])
+        db_session.commit()
+
+        assert db_session.query(CourseSession).one().status == SessionStatus.SCHEDULED
+
+    def test_import_batch_skips_conflicts(self, db_session, sample_instructor):
+        rows = [
+            (1, {"first_name": "Ann", "last_name": "Able", "email": "ann@test.com"}),
+            (2, {"first_name": "Dup", "last_name": "Existing", "email": sample_instructor.email}),
+            (3, {"first_name": "Ann", "last_name": "Again", "email": "ann@test.com"}),
+        ]
+        created, errors = import_batch(db_session, IMPORT_TARGETS["instructors"], rows)
+        db_session.commit()
+
+        assert created == 1
+        assert [(error.row, error.field) for error in errors] == [(2, "email"), (3, "email")]
+        assert db_session.query(Instructor).filter(Instructor.email == "ann@test.com").one().last_name == "Able"
+
+    def test_import_batch_checks_references(self, db_session, sample_course):
+        rows = [
+            (1, {"course_id": sample_course.id, "session_name": "Kept", "start_date": "2030-01-01", "end_date": "2030-01-02"}),
+            (2, {"course_id": 999999, "session_name": "Dropped", "start_date": "2030-01-01", "end_date": "2030-01-02"}),
+        ]
+        created, errors = import_batch(db_session, IMPORT_TARGETS["sessions"], rows)
+
+        assert created == 1
+        assert errors == [RowError(2, "course_id", "Course 999999 not found")]
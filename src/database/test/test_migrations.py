@@ -0,0 +1,154 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect
+from src.database.connection import Base
+
+ALEMBIC_INI = os.path.join(os.path.dirname(__file__), '../../../alembic.ini')
+
+@pytest.fixture
+def empty_db_engine(postgresql):
+    """Engine for a database with no tables, unlike db_engine which runs create_all."""
+    engine = create_engine(
+        f"postgresql+psycopg://{postgresql.info.user}:@{postgresql.info.host}:{postgresql.info.port}/{postgresql.info.dbname}",
+        echo=False
+    )
+    yield engine
+    engine.dispose()
+
+def run_alembic(engine, action, revision):
+    # A config without a file name leaves the test run's logging configuration alone
+    config = Config()
+    config.set_main_option("script_location", Config(ALEMBIC_INI).get_main_option("script_location"))
+    # Alembic runs its own transaction, so that revisions with autocommit blocks can commit it
+    with engine.connect() as connection:
+        config.attributes["connection"] = connection
+        getattr(command, action)(config, revision)
+        connection.commit()
+
+class TestMigrations:
+    def test_upgrade_matches_models(self, empty_db_engine):
+        run_alembic(empty_db_engine, "upgrade", "head")
+
+        with empty_db_engine.connect() as connection:
+            context = MigrationContext.configure(connection)
+            assert compare_metadata(context, Base.metadata) == []
+
+    def test_downgrade_to_base(self, empty_db_engine):
+        run_alembic(empty_db_engine, "upgrade", "head")
+        run_alembic(empty_db_engine, "downgrade", "base")
+
+        assert inspect(empty_db_engine).get_table_names() == ["alembic_version"]
+
+    def test_calendar_days_backfilled(self, empty_db_engine):
+        from sqlalchemy import text
+        run_alembic(empty_db_engine, "upgrade", "0002")
+        with empty_db_engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO courses (id, course_name, course_code, duration_days, active_status, created_date) "
+                "VALUES (1, 'Course', 'C101', 1, true, now())"
+            ))
+            connection.execute(text(
+                "INSERT INTO locations (id, location_name, active_status) VALUES (1, 'Site', true)"
+            ))
+            connection.execute(text(
+                "INSERT INTO course_sessions (id, course_id, session_name, start_date, end_date, status) "
+                "VALUES (1, 1, 'Session', '2024-07-01', '2024-07-01', 'SCHEDULED')"
+            ))
+            connection.execute(text(
+                "INSERT INTO session_days (id, session_id, day_number, date, location_id, start_time, end_time, session_type) "
+                "VALUES (1, 1, 1, '2024-07-01', 1, '09:00', '17:00', 'FULL_DAY')"
+            ))
+        run_alembic(empty_db_engine, "upgrade", "head")
+
+        with empty_db_engine.connect() as connection:
+            rows = connection.execute(text(
+                "SELECT session_day_id, course_code, location_name, assignment_count FROM calendar_days"
+            )).all()
+        assert [tuple(row) for row in rows] == [(1, "C101", "Site", 0)]
+
+    def test_assignment_bookings_backfilled(self, empty_db_engine):
+        from sqlalchemy import text
+        from sqlalchemy.exc import IntegrityError
+        run_alembic(empty_db_engine, "upgrade", "0004")
+        with empty_db_engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO courses (id, course_name, course_code, duration_days, active_status, created_date) "
+                "VALUES (1, 'Course', 'C101', 1, true, now())"
+            ))
+            connection.execute(text(
+                "INSERT INTO locations (id, location_name, active_status) VALUES (1, 'Site', true), (2, 'Annex', true)"
+            ))
+            connection.execute(text(
+                "INSERT INTO course_sessions (id, course_id, session_name, start_date, end_date, status) "
+                "VALUES (1, 1, 'Session', '2024-07-01', '2024-07-01', 'SCHEDULED')"
+            ))
+            connection.execute(text(
+                "INSERT INTO session_days (id, session_id, day_number, date, location_id, start_time, end_time, session_type) "
+                "VALUES (1, 1, 1, '2024-07-01', 1, '09:00', '17:00', 'FULL_DAY'), "
+                "(2, 1, 2, '2024-07-01', 2, '13:00', '15:00', 'HALF_DAY')"
+            ))
+            connection.execute(text(
+                "INSERT INTO instructors (id, first_name, last_name, email, active_status, created_date) "
+                "VALUES (1, 'Ann', 'Lee', 'ann@test.com', true, now())"
+            ))
+            connection.execute(text(
+                "INSERT INTO instructor_assignments (session_day_id, instructor_id, assignment_type, "
+                "assignment_status, created_date) VALUES (1, 1, 'FULL_DAY', 'ASSIGNED', now())"
+            ))
+        run_alembic(empty_db_engine, "upgrade", "head")
+
+        with empty_db_engine.connect() as connection:
+            booking = connection.execute(text("SELECT booking::text FROM instructor_assignments")).scalar_one()
+        assert booking == '["2024-07-01 09:00:00","2024-07-01 17:00:00")'
+        with pytest.raises(IntegrityError, match="ex_instructor_assignments_instructor_booking"):
+            with empty_db_engine.begin() as connection:
+                connection.execute(text(
+                    "INSERT INTO instructor_assignments (session_day_id, instructor_id, assignment_type, "
+                    "assignment_status, created_date) VALUES (2, 1, 'HALF_DAY', 'ASSIGNED', now())"
+                ))
+
+    def test_cancelled_bookings_released(self, empty_db_engine):
+        from sqlalchemy import text
+        run_alembic(empty_db_engine, "upgrade", "0005")
+        with empty_db_engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO courses (id, course_name, course_code, duration_days, active_status, created_date) "
+                "VALUES (1, 'Course', 'C101', 1, true, now())"
+            ))
+            connection.execute(text(
+                "INSERT INTO locations (id, location_name, active_status) VALUES (1, 'Site', true)"
+            ))
+            connection.execute(text(
+                "INSERT INTO course_sessions (id, course_id, session_name, start_date, end_date, status) "
+                "VALUES (1, 1, 'Cancelled', '2024-07-01', '2024-07-01', 'CANCELLED'), "
+                "(2, 1, 'Scheduled', '2024-07-01', '2024-07-01', 'SCHEDULED')"
+            ))
+            connection.execute(text(
+                "INSERT INTO session_days (id, session_id, day_number, date, location_id, start_time, end_time, session_type) "
+                "VALUES (1, 1, 1, '2024-07-01', 1, '09:00', '17:00', 'FULL_DAY')"
+            ))
+            connection.execute(text(
+                "INSERT INTO instructors (id, first_name, last_name, email, active_status, created_date) "
+                "VALUES (1, 'Ann', 'Lee', 'ann@test.com', true, now())"
+            ))
+            connection.execute(text(
+                "INSERT INTO instructor_assignments (session_day_id, instructor_id, assignment_type, "
+                "assignment_status, created_date) VALUES (1, 1, 'FULL_DAY', 'ASSIGNED', now())"
+            ))
+        run_alembic(empty_db_engine, "upgrade", "head")
+
+        with empty_db_engine.begin() as connection:
+            assert connection.execute(text("SELECT booking FROM instructor_assignments")).scalar_one() is None
+            connection.execute(text(
+                "INSERT INTO session_days (id, session_id, day_number, date, location_id, start_time, end_time, session_type) "
+                "VALUES (2, 2, 1, '2024-07-01', 1, '09:00', '17:00', 'FULL_DAY')"
+            ))
+            bookings = connection.execute(text("SELECT id, booking::text FROM session_days ORDER BY id")).all()
+        assert [tuple(row) for row in bookings] == [(1, None), (2, '["2024-07-01 09:00:00","2024-07-01 17:00:00")')]
@@ -244,4 +244,42 @@ class TestInstructorAssignment:
         assert assignment.instructor == sample_instructor
         assert assignment.session_day == session_day
         assert assignment in sample_instructor.assignments
-        assert assignment in session_day.instructor_assignments
\ No newline at end of file
+        assert assignment in session_day.instructor_assignments
+
+class TestQueryIndexes:
+    @pytest.mark.parametrize("query, index_name", [
+        ("SELECT * FROM session_days WHERE date BETWEEN '2024-01-01' AND '2024-01-31'",
+         "ix_session_days_date_start_time_id"),
+        ("SELECT * FROM session_days WHERE location_id = 1 AND date = '2024-01-15'",
+         "ix_session_days_location_id_date"),
+        ("SELECT * FROM session_days WHERE session_id = 1 ORDER BY day_number",
+         "ix_session_days_session_id_day_number"),
+        ("SELECT * FROM instructor_assignments WHERE instructor_id = 1",
+         "ix_instructor_assignments_instructor_id"),
+        ("SELECT * FROM instructor_assignments WHERE session_day_id = 1",
+         "ix_instructor_assignments_session_day_id"),
+        ("SELECT * FROM instructor_course_ratings WHERE instructor_id = 1 AND course_id = 1",
+         "uq_instructor_course_ratings_instructor_course"),
+        ("SELECT * FROM instructor_course_ratings WHERE course_id = 1 AND rating = 'CLEARED'",
+         "ix_instructor_course_ratings_course_id_rating"),
+        ("SELECT * FROM instructors WHERE search_vector @@ to_tsquery('simple', 'jo:*')",
+         "ix_instructors_search_vector"),
+        ("SELECT * FROM courses WHERE search_vector @@ to_tsquery('simple', 'fire:*')",
+         "ix_courses_search_vector"),
+        ("SELECT * FROM locations WHERE search_vector @@ to_tsquery('simple', 'aus:*')",
+         "ix_locations_search_vector"),
+        ("SELECT * FROM calendar_days WHERE date BETWEEN '2024-07-01' AND '2024-07-31' ORDER BY date, start_time",
+         "ix_calendar_days_date_start_time"),
+        ("SELECT * FROM calendar_days WHERE location_id = 1",
+         "ix_calendar_days_location_id_date"),
+    ])
+    def test_hot_queries_use_index(self, db_session, query, index_name):
+        from sqlalchemy import text
+        # Tiny test tables are cheapest to scan sequentially; rule that out so the
+        # plan shows whether a usable index exists at all
+        db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(row[0] for row in db_session.execute(text(f"EXPLAIN {query}")))
+        db_session.rollback()
+        
+        assert "Seq Scan" not in plan
+        assert index_name in plan
@@ -0,0 +1,78 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from datetime import date, time
+from sqlalchemy import event
+from src.database.reports import get_pay_eligibility_report
+from src.database.repository import (
+    InstructorRepository, CourseRepository, RatingRepository, SessionRepository, AssignmentRepository
+)
+from src.database.models import CourseSessionDay, RatingType, SessionType, SessionStatus, AssignmentStatus
+
+def add_day(db_session, session_id, location_id, day, start, end):
+    session_day = CourseSessionDay(
+        session_id=session_id, day_number=day.day, date=day, location_id=location_id,
+        start_time=start, end_time=end, session_type=SessionType.FULL_DAY
+    )
+    db_session.add(session_day)
+    db_session.commit()
+    return session_day
+
+class TestPayEligibilityReport:
+    def test_aggregates_per_instructor(self, db_session, sample_location):
+        instructor_repo = InstructorRepository(db_session)
+        course_repo = CourseRepository(db_session)
+        rating_repo = RatingRepository(db_session)
+        session_repo = SessionRepository(db_session)
+        assignment_repo = AssignmentRepository(db_session)
+
+        ann = instructor_repo.create("Ann", "Able", "ann@test.com")
+        bob = instructor_repo.create("Bob", "Baker", "bob@test.com")
+        first = course_repo.create("First Course", "FC101")
+        second = course_repo.create("Second Course", "SC101")
+        rating_repo.create_or_update_rating(ann.id, first.id, RatingType.CLEARED)
+        rating_repo.create_or_update_rating(bob.id, first.id, RatingType.CLEARED)
+        rating_repo.create_or_update_rating(ann.id, second.id, RatingType.CO_TEACH)
+
+        first_session = session_repo.create_session(first.id, "First", date(2024, 7, 1), date(2024, 7, 2))
+        second_session = session_repo.create_session(second.id, "Second", date(2024, 7, 3), date(2024, 7, 3))
+        cancelled = session_repo.create_session(first.id, "Cancelled", date(2024, 7, 4), date(2024, 7, 4))
+        session_repo.update_status(cancelled.id, SessionStatus.CANCELLED)
+
+        full = add_day(db_session, first_session.id, sample_location.id, date(2024, 7, 1), time(9, 0), time(17, 0))
+        half = add_day(db_session, first_session.id, sample_location.id, date(2024, 7, 2), time(8, 30), time(12, 45))
+        observed = add_day(db_session, second_session.id, sample_location.id, date(2024, 7, 3), time(9, 0), time(17, 0))
+        dropped = add_day(db_session, cancelled.id, sample_location.id, date(2024, 7, 4), time(9, 0), time(17, 0))
+        outside = add_day(db_session, first_session.id, sample_location.id, date(2024, 8, 1), time(9, 0), time(17, 0))
+
+        assignment_repo.create_assignment(full.id, ann.id, SessionType.FULL_DAY)
+        assignment_repo.create_assignment(half.id, ann.id, SessionType.HALF_DAY)
+        assignment_repo.create_assignment(observed.id, ann.id, SessionType.FULL_DAY)
+        assignment_repo.create_assignment(dropped.id, ann.id, SessionType.FULL_DAY)
+        assignment_repo.create_assignment(outside.id, ann.id, SessionType.FULL_DAY)
+        withdrawn = assignment_repo.create_assignment(half.id, bob.id, SessionType.HALF_DAY)
+        assignment_repo.update_status(withdrawn.id, AssignmentStatus.CANCELLED)
+        assignment_repo.create_assignment(full.id, bob.id, SessionType.FULL_DAY)
+
+        rows = get_pay_eligibility_report(db_session, date(2024, 7, 1), date(2024, 7, 31))
+
+        assert [row._asdict() for row in rows] == [
+            {"instructor_id": ann.id, "first_name": "Ann", "last_name": "Able", "email": "ann@test.com",
+             "assignments": 3, "eligible_assignments": 2, "eligible_hours": 12.25},
+            {"instructor_id": bob.id, "first_name": "Bob", "last_name": "Baker", "email": "bob@test.com",
+             "assignments": 1, "eligible_assignments": 1, "eligible_hours": 8.0},
+        ]
+
+    def test_runs_one_query(self, db_session, db_engine):
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            rows = get_pay_eligibility_report(db_session, date(2024, 7, 1), date(2024, 7, 31))
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+
+        assert rows == []
+        assert len(statements) == 1
@@ -3,7 +3,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
 
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta
 from src.database.repository import (
     InstructorRepository, CourseRepository, LocationRepository,
     RatingRepository, SessionRepository, AssignmentRepository, CourseSessionDayRepository
@@ -97,6 +97,82 @@ class TestInstructorRepository:
         # Search partial match
         results = repo.search_by_name("Jo")
         assert len(results) >= 2
+    
+    def test_search_by_name_ranked(self, db_session):
+        repo = InstructorRepository(db_session)
+        smith = repo.create("John", "Smith", "john.smith@test.com")
+        johnson = repo.create("Jane", "Johnson", "jane.johnson@test.com")
+        viper = repo.create("Sam", "Lee", "sam.lee@test.com")
+        viper.call_sign = "Viper"
+        repo.update(viper)
+        
+        # Every word must match the start of a name word
+        assert [i.id for i in repo.search_by_name("jo sm")] == [smith.id]
+        # A word matching both names ranks above one matching once
+        johnson.first_name = "John"
+        repo.update(johnson)
+        assert [i.id for i in repo.search_by_name("john")][0] == johnson.id
+        assert [i.id for i in repo.search_by_name("vip")] == [viper.id]
+        assert repo.search_by_name("ohn") == []
+        assert repo.search_by_name("%!") == []
+
+    def test_get_existing_ids(self, db_session, sample_instructor):
+        repo = InstructorRepository(db_session)
+        
+        assert repo.get_existing_ids([sample_instructor.id, 99999]) == {sample_instructor.id}
+        assert repo.get_existing_ids([]) == set()
+
+    def test_get_page(self, db_session):
+        repo = InstructorRepository(db_session)
+        created = [repo.create(f"Page{i}", "User", f"page{i}@test.com") for i in range(5)]
+        
+        page = repo.get_page(offset=1, limit=2, with_total=True)
+        assert [i.id for i in page.items] == [created[1].id, created[2].id]
+        assert page.total == 5
+        
+        # Total is only counted on request
+        page = repo.get_page(offset=4, limit=2)
+        assert [i.id for i in page.items] == [created[4].id]
+        assert page.total is None
+
+    def test_get_page_with_name(self, db_session):
+        repo = InstructorRepository(db_session)
+        repo.create("John", "Smith", "john.smith@test.com")
+        repo.create("Bob", "Jones", "bob.jones@test.com")
+        
+        page = repo.get_page(name="smith", with_total=True)
+        assert page.total == 1
+        assert page.items[0].last_name == "Smith"
+        # Matching uses the search vector, so LIKE wildcards match nothing
+        assert repo.get_page(name="%", with_total=True).total == 0
+        assert [i.first_name for i in repo.get_page(name="bo").items] == ["Bob"]
+    
+    def test_search_by_course_rating(self, db_session, instructor_with_rating):
+        cleared, course, _ = instructor_with_rating
+        repo = InstructorRepository(db_session)
+        observer = repo.create("Olive", "Observer", "olive@test.com")
+        RatingRepository(db_session).create_or_update_rating(observer.id, course.id, RatingType.OBSERVE)
+        repo.create("Una", "Rated", "una@test.com")
+        
+        assert [i.id for i in repo.search(course_id=course.id).items] == [cleared.id, observer.id]
+        page = repo.search(course_id=course.id, rating=RatingType.CLEARED, with_total=True)
+        assert page.total == 1
+        assert [i.id for i in page.items] == [cleared.id]
+        assert [i.id for i in repo.search(rating=RatingType.OBSERVE, name="oli").items] == [observer.id]
+        assert repo.search(course_id=course.id, name="una").items == []
+    
+    def test_get_with_details(self, db_session, instructor_with_rating):
+        instructor, _, rating = instructor_with_rating
+        instructor_id, rating_id = instructor.id, rating.id
+        db_session.expunge_all()
+        repo = InstructorRepository(db_session)
+        
+        instructor = repo.get_with_details(instructor_id)
+        # Both relationships are populated by the query itself
+        assert 'course_ratings' in instructor.__dict__
+        assert 'assignments' in instructor.__dict__
+        assert [r.id for r in instructor.course_ratings] == [rating_id]
+        assert instructor.assignments == []
 
 class TestCourseRepository:
     def test_create_course(self, db_session):
@@ -193,6 +269,26 @@ class TestCourseRepository:
         
         assert updated_course.duration_days == 0.5
         assert updated_course.id == sample_course.id
+    
+    def test_search_text(self, db_session):
+        repo = CourseRepository(db_session)
+        firearms = repo.create("Basic Firearms Safety", "BFS101")
+        tactics = repo.create("Tactics", "TAC201")
+        
+        assert [c.id for c in repo.search_text("fire saf")] == [firearms.id]
+        assert [c.id for c in repo.search_text("tac2")] == [tactics.id]
+        assert repo.search_text("nothing") == []
+    
+    def test_search(self, db_session):
+        repo = CourseRepository(db_session)
+        safety = repo.create("Firearms Safety", "FS_101")
+        repo.create("Advanced Safety", "FSX101")
+        repo.create("Tactics", "TAC201")
+        
+        assert [c.id for c in repo.search(name="SAFETY", code="fs_").items] == [safety.id]
+        page = repo.search(name="safety", limit=1, with_total=True)
+        assert page.total == 2
+        assert len(page.items) == 1
 
 class TestLocationRepository:
     def test_create_location(self, db_session):
@@ -308,6 +404,16 @@ class TestLocationRepository:
         repo = LocationRepository(db_session)
         result = repo.set_active_status(99999, False)
         assert result is None
+    
+    def test_search(self, db_session):
+        repo = LocationRepository(db_session)
+        north = repo.create("North Range", city="Austin")
+        repo.create("South Range", city="Dallas")
+        inactive = repo.create("East Range", city="Austin")
+        repo.set_active_status(inactive.id, False)
+        
+        assert [l.id for l in repo.search(name="range", city="aus").items] == [north.id]
+        assert len(repo.search(city="austin", active_only=False).items) == 2
 
 class TestRatingRepository:
     def test_create_rating(self, db_session, sample_instructor, sample_course):
@@ -377,6 +483,42 @@ class TestRatingRepository:
         assert instructor1.id in cleared_instructors
         assert instructor2.id not in cleared_instructors
 
+    def test_bulk_upsert_ratings(self, db_session, db_engine, instructor_with_rating):
+        from sqlalchemy import event
+        instructor, course, rating = instructor_with_rating
+        new_instructor = InstructorRepository(db_session).create("New", "Instructor", "new@test.com")
+        
+        repo = RatingRepository(db_session)
+        instructor_ids, course_id, rating_id = [instructor.id, new_instructor.id, instructor.id], course.id, rating.id
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            ratings = repo.bulk_upsert_ratings(instructor_ids, course_id, RatingType.CO_TEACH, notes="Cohort")
+            loaded = [(r.id, r.rating, r.notes) for r in ratings]
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+        
+        # One upsert and one reload, even though commit expires the rows
+        assert len(statements) == 2
+        assert [r.instructor_id for r in ratings] == [instructor.id, new_instructor.id]
+        # The existing rating is updated in place
+        assert loaded[0][0] == rating_id
+        assert all(r == RatingType.CO_TEACH and notes == "Cohort" for _, r, notes in loaded)
+        assert len(repo.get_course_ratings(course.id)) == 2
+
+    def test_duplicate_rating_rejected(self, db_session, instructor_with_rating):
+        from sqlalchemy.exc import IntegrityError
+        from src.database.models import InstructorCourseRating
+        instructor, course, rating = instructor_with_rating
+        
+        db_session.add(InstructorCourseRating(
+            instructor_id=instructor.id, course_id=course.id, rating=RatingType.OBSERVE
+        ))
+        with pytest.raises(IntegrityError):
+            db_session.commit()
+        db_session.rollback()
+
 class TestSessionRepository:
     def test_create_session(self, db_session, sample_course):
         repo = SessionRepository(db_session)
@@ -426,6 +568,22 @@ class TestSessionRepository:
         
         updated = repo.update_status(session.id, SessionStatus.IN_PROGRESS)
         assert updated.status == SessionStatus.IN_PROGRESS
+    
+    def test_search(self, db_session, sample_course, sample_location):
+        repo = SessionRepository(db_session)
+        march = repo.create_session(sample_course.id, "March", date(2024, 3, 1), date(2024, 3, 2))
+        april = repo.create_session(sample_course.id, "April", date(2024, 4, 1), date(2024, 4, 2))
+        CourseSessionDayRepository(db_session).create(
+            april.id, 1, date(2024, 4, 1), sample_location.id,
+            time(9, 0), time(17, 0), SessionType.FULL_DAY
+        )
+        
+        by_dates = repo.search(course_id=sample_course.id, start_date_from=date(2024, 3, 15))
+        assert [s.id for s in by_dates.items] == [april.id]
+        by_location = repo.search(location_id=sample_location.id)
+        assert [s.id for s in by_location.items] == [april.id]
+        assert repo.search(status=SessionStatus.COMPLETED).items == []
+        assert march.id in [s.id for s in repo.search().items]
 
 class TestAssignmentRepository:
     def test_create_assignment(self, db_session, sample_course, sample_location, sample_instructor):
@@ -543,17 +701,105 @@ class TestAssignmentRepository:
         db_session.commit()
         
         repo = AssignmentRepository(db_session)
+        other = InstructorRepository(db_session).create("Other", "Instructor", "other@test.com")
+        RatingRepository(db_session).create_or_update_rating(sample_instructor.id, sample_course.id, RatingType.CLEARED)
+        RatingRepository(db_session).create_or_update_rating(other.id, sample_course.id, RatingType.CO_TEACH)
         
-        # Create assignments (pay eligibility now determined by instructor clearance)
+        # Pay eligibility is determined by the instructor being cleared for the course
         assignment1 = repo.create_assignment(session_day.id, sample_instructor.id, SessionType.FULL_DAY)
-        assignment2 = repo.create_assignment(session_day.id, sample_instructor.id, SessionType.HALF_DAY)
-        
-        # Get all assignments (method now returns all, not just pay eligible)
-        all_assignments = repo.get_pay_eligible_assignments()
-        assignment_ids = [a.id for a in all_assignments]
+        assignment2 = repo.create_assignment(session_day.id, other.id, SessionType.FULL_DAY)
         
+        assignment_ids = [a.id for a in repo.get_pay_eligible_assignments()]
         assert assignment1.id in assignment_ids
-        assert assignment2.id in assignment_ids
+        assert assignment2.id not in assignment_ids
+        
+        assert repo.get_pay_eligible_assignments(date_from=date(2024, 7, 2)) == []
+        assert [a.id for a in repo.get_pay_eligible_assignments(date(2024, 7, 1), date(2024, 7, 1))] == [assignment1.id]
+
+    def test_create_assignments_bulk(self, db_session, db_engine, sample_course, sample_location, sample_instructor):
+        from sqlalchemy import event
+        session_repo = SessionRepository(db_session)
+        session = session_repo.create_session(
+            sample_course.id, "Bulk Session", date(2024, 7, 1), date(2024, 7, 3)
+        )
+        day_repo = CourseSessionDayRepository(db_session)
+        days = [
+            day_repo.create(
+                session.id, i + 1, date(2024, 7, 1 + i), sample_location.id,
+                time(9, 0), time(17, 0), SessionType.FULL_DAY
+            )
+            for i in range(3)
+        ]
+        
+        repo = AssignmentRepository(db_session)
+        rows = [
+            {"session_day_id": day.id, "instructor_id": sample_instructor.id,
+             "assignment_type": SessionType.FULL_DAY, "notes": "Bulk"}
+            for day in days
+        ]
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            created = repo.create_assignments_bulk(rows)
+            loaded = [(a.session_day_id, a.assignment_status, a.created_date) for a in created]
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+        
+        # One INSERT and one reload, however many rows, even though commit expires them
+        assert len(statements) == 2
+        assert [session_day_id for session_day_id, _, _ in loaded] == [row["session_day_id"] for row in rows]
+        assert all(a.id is not None for a in created)
+        assert all(status == AssignmentStatus.ASSIGNED for _, status, _ in loaded)
+        assert all(created_date is not None for _, _, created_date in loaded)
+
+    def test_create_assignments_bulk_is_atomic(self, db_session, sample_course, sample_location, sample_instructor):
+        session_repo = SessionRepository(db_session)
+        session = session_repo.create_session(
+            sample_course.id, "Bulk Session", date(2024, 7, 1), date(2024, 7, 1)
+        )
+        day = CourseSessionDayRepository(db_session).create(
+            session.id, 1, date(2024, 7, 1), sample_location.id,
+            time(9, 0), time(17, 0), SessionType.FULL_DAY
+        )
+        
+        repo = AssignmentRepository(db_session)
+        with pytest.raises(Exception):
+            repo.create_assignments_bulk([
+                {"session_day_id": day.id, "instructor_id": sample_instructor.id,
+                 "assignment_type": SessionType.FULL_DAY},
+                # Unknown session day violates the foreign key
+                {"session_day_id": 99999, "instructor_id": sample_instructor.id,
+                 "assignment_type": SessionType.FULL_DAY}
+            ])
+        
+        assert repo.get_instructor_assignments(sample_instructor.id) == []
+
+    def test_get_page_after(self, db_session, sample_course, sample_location, sample_instructor):
+        session_repo = SessionRepository(db_session)
+        session = session_repo.create_session(
+            sample_course.id, "Cursor Session", date(2024, 7, 1), date(2024, 7, 5)
+        )
+        day_repo = CourseSessionDayRepository(db_session)
+        repo = AssignmentRepository(db_session)
+        created = []
+        for i in range(5):
+            day = day_repo.create(
+                session.id, i + 1, date(2024, 7, 1 + i), sample_location.id,
+                time(9, 0), time(17, 0), SessionType.FULL_DAY
+            )
+            created.append(repo.create_assignment(day.id, sample_instructor.id, SessionType.FULL_DAY))
+        
+        seen = []
+        cursor = None
+        while True:
+            page = repo.get_page_after(cursor=cursor, limit=2, instructor_id=sample_instructor.id)
+            seen.extend(a.id for a in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        
+        assert seen == [a.id for a in created]
 
 class TestCourseSessionDayRepository:
     def test_create_session_day(self, db_session, sample_course, sample_location):
@@ -760,6 +1006,40 @@ class TestCourseSessionDayRepository:
         assert updated.session_type == SessionType.HALF_DAY
         assert updated.id == session_day.id
 
+    def test_create_many(self, db_session, db_engine, sample_course, sample_location):
+        """Test creating a run of session days in one INSERT."""
+        from sqlalchemy import event
+        from src.database.conflicts import LocationConflictError
+        session = SessionRepository(db_session).create_session(
+            sample_course.id, "Weekly Session", date(2024, 9, 2), date(2024, 12, 31)
+        )
+        repo = CourseSessionDayRepository(db_session)
+        repo.create(session.id, 1, date(2024, 9, 2), sample_location.id,
+                    time(9, 0), time(12, 0), SessionType.HALF_DAY)
+        dates = [date(2024, 9, 9) + timedelta(weeks=i) for i in range(10)]
+        
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            first_day_number = repo.next_day_number(session.id)
+            days = repo.create_many(session.id, dates, sample_location.id, time(9, 0), time(12, 0),
+                                    SessionType.HALF_DAY, first_day_number=first_day_number)
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+        
+        assert [d.day_number for d in days] == list(range(2, 12))
+        assert [d.date for d in days] == dates
+        assert all(d.location_id == sample_location.id and d.start_time == time(9, 0) for d in days)
+        assert len([s for s in statements if s.startswith("INSERT")]) == 1
+        
+        # A clash with any existing day writes none of them
+        with pytest.raises(LocationConflictError) as exc_info:
+            repo.create_many(session.id, [date(2024, 12, 2), dates[3], dates[7]], sample_location.id,
+                             time(11, 0), time(13, 0), SessionType.HALF_DAY, first_day_number=12)
+        assert [d.id for d in exc_info.value.clashes] == [days[3].id, days[7].id]
+        assert repo.next_day_number(session.id) == 12
+
     def test_delete_session_day(self, db_session, sample_course, sample_location):
         """Test deleting a session day."""
         session_repo = SessionRepository(db_session)
@@ -826,4 +1106,70 @@ class TestCourseSessionDayRepository:
         # For same date, should be ordered by start_time
         same_date_days = [day for day in our_days if day.date == date(2024, 12, 10)]
         if len(same_date_days) > 1:
-            assert same_date_days[0].start_time <= same_date_days[1].start_time
\ No newline at end of file
+            assert same_date_days[0].start_time <= same_date_days[1].start_time
+
+    def test_get_page_filters(self, db_session, sample_course, sample_location):
+        """Test paginating session days with date range and location filters in SQL."""
+        session_repo = SessionRepository(db_session)
+        session = session_repo.create_session(
+            sample_course.id, "Page Test", date(2024, 12, 10), date(2024, 12, 14)
+        )
+        other_location = LocationRepository(db_session).create("Annex")
+        
+        repo = CourseSessionDayRepository(db_session)
+        for i in range(5):
+            repo.create(
+                session.id, i + 1, date(2024, 12, 10 + i), sample_location.id,
+                time(9, 0), time(17, 0), SessionType.FULL_DAY
+            )
+        repo.create(
+            session.id, 6, date(2024, 12, 11), other_location.id,
+            time(9, 0), time(13, 0), SessionType.HALF_DAY
+        )
+        
+        page = repo.get_page(
+            offset=1, limit=2, start_date=date(2024, 12, 11), end_date=date(2024, 12, 14),
+            location_id=sample_location.id, with_total=True
+        )
+        assert page.total == 4
+        assert [d.date for d in page.items] == [date(2024, 12, 12), date(2024, 12, 13)]
+        
+        # A start date with a location selects that single day
+        page = repo.get_page(start_date=date(2024, 12, 11), location_id=other_location.id)
+        assert len(page.items) == 1
+        assert page.items[0].location_id == other_location.id
+
+    def test_get_page_after(self, db_session, sample_course, sample_location):
+        """Test keyset pagination walks every day once in (date, start_time, id) order."""
+        session_repo = SessionRepository(db_session)
+        session = session_repo.create_session(
+            sample_course.id, "Cursor Test", date(2024, 12, 10), date(2024, 12, 12)
+        )
+        
+        repo = CourseSessionDayRepository(db_session)
+        # Several days share a date and start time so the id breaks the tie; they are
+        # held in different rooms, since one location cannot be double-booked
+        for i in range(7):
+            room = LocationRepository(db_session).create(f"Room {i}")
+            repo.create(
+                session.id, i + 1, date(2024, 12, 10 + i % 3), room.id,
+                time(9 + i % 2, 0), time(17, 0), SessionType.FULL_DAY
+            )
+        
+        expected = repo.get_page(limit=None).items
+        seen = []
+        cursor = None
+        while True:
+            page = repo.get_page_after(cursor=cursor, limit=3)
+            assert len(page.items) <= 3
+            seen.extend(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        
+        assert [d.id for d in seen] == [d.id for d in expected]
+
+    def test_get_page_after_invalid_cursor(self, db_session):
+        repo = CourseSessionDayRepository(db_session)
+        with pytest.raises(ValueError):
+            repo.get_page_after(cursor="not-a-cursor")
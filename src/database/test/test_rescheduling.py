@@ -0,0 +1,151 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from datetime import date, time
+from src.database.rescheduling import RescheduleConflictError, clone_session, reschedule_session
+from src.database.repository import (
+    SessionRepository, CourseSessionDayRepository, AssignmentRepository, LocationRepository
+)
+from src.database.models import AssignmentStatus, CalendarDay, SessionStatus, SessionType
+
+@pytest.fixture
+def staffed_session(db_session, sample_course, sample_location, sample_instructor):
+    """A three day session from Monday 2024-09-02 with the sample instructor on every day."""
+    session = SessionRepository(db_session).create_session(
+        sample_course.id, "Autumn Term", date(2024, 9, 2), date(2024, 9, 4)
+    )
+    days = CourseSessionDayRepository(db_session).create_many(
+        session.id, [date(2024, 9, 2), date(2024, 9, 3), date(2024, 9, 4)], sample_location.id,
+        time(9, 0), time(17, 0), SessionType.FULL_DAY
+    )
+    assignments = AssignmentRepository(db_session).create_assignments_bulk([
+        {"session_day_id": day.id, "instructor_id": sample_instructor.id, "assignment_type": SessionType.FULL_DAY}
+        for day in days
+    ])
+    return session, days, assignments
+
+def book_elsewhere(db_session, sample_course, location, day, instructor=None):
+    """Book a full day at a location in another session, optionally staffed."""
+    session = SessionRepository(db_session).create_session(sample_course.id, "Other", day, day)
+    other_day = CourseSessionDayRepository(db_session).create(
+        session.id, 1, day, location.id, time(9, 0), time(17, 0), SessionType.FULL_DAY
+    )
+    if instructor:
+        AssignmentRepository(db_session).create_assignment(other_day.id, instructor.id, SessionType.FULL_DAY)
+    return other_day
+
+class TestRescheduleSession:
+    def test_moves_days_and_assignments(self, db_session, staffed_session, sample_instructor):
+        session, days, assignments = staffed_session
+
+        # Each day moves onto the next one's date, with the same instructor on both
+        moved = reschedule_session(db_session, session.id, 1)
+
+        assert (moved.start_date, moved.end_date) == (date(2024, 9, 3), date(2024, 9, 5))
+        day_repo = CourseSessionDayRepository(db_session)
+        assert [d.date for d in day_repo.get_by_session_id(session.id)] == [
+            date(2024, 9, 3), date(2024, 9, 4), date(2024, 9, 5)
+        ]
+        assert [a.session_day_id for a in AssignmentRepository(db_session).get_instructor_assignments(
+            sample_instructor.id
+        )] == [d.id for d in days]
+        assert db_session.query(CalendarDay.date).filter(CalendarDay.session_id == session.id).order_by(
+            CalendarDay.date
+        ).all() == [(date(2024, 9, 3),), (date(2024, 9, 4),), (date(2024, 9, 5),)]
+
+    def test_reports_every_clash_and_changes_nothing(self, db_session, sample_course, sample_location,
+                                                     staffed_session, sample_instructor):
+        session, days, _ = staffed_session
+        in_room = book_elsewhere(db_session, sample_course, sample_location, date(2024, 9, 9))
+        annex = LocationRepository(db_session).create("Annex")
+        teaching = book_elsewhere(db_session, sample_course, annex, date(2024, 9, 11), sample_instructor)
+
+        with pytest.raises(RescheduleConflictError) as exc_info:
+            reschedule_session(db_session, session.id, 7)
+
+        assert exc_info.value.problems == [
+            f"Session day {days[0].id} would overlap session day {in_room.id} at location {sample_location.id}",
+            f"Instructor {sample_instructor.id} would be double-booked on session days {days[2].id} and {teaching.id}",
+        ]
+        assert SessionRepository(db_session).get_by_id(session.id).start_date == date(2024, 9, 2)
+        assert CourseSessionDayRepository(db_session).get_by_id(days[0].id).date == date(2024, 9, 2)
+
+    def test_missing_session(self, db_session):
+        assert reschedule_session(db_session, 99999, 7) is None
+
+class TestCloneSession:
+    def test_copies_days_and_assignments(self, db_session, staffed_session, sample_instructor):
+        session, days, assignments = staffed_session
+        AssignmentRepository(db_session).update_status(assignments[1].id, AssignmentStatus.CANCELLED)
+
+        clone = clone_session(db_session, session.id, 91, include_assignments=True, session_name="Winter Term")
+
+        assert clone.id != session.id
+        assert (clone.session_name, clone.start_date, clone.end_date) == (
+            "Winter Term", date(2024, 12, 2), date(2024, 12, 4)
+        )
+        copies = CourseSessionDayRepository(db_session).get_by_session_id(clone.id)
+        assert [(d.day_number, d.date, d.start_time) for d in copies] == [
+            (1, date(2024, 12, 2), time(9, 0)), (2, date(2024, 12, 3), time(9, 0)), (3, date(2024, 12, 4), time(9, 0))
+        ]
+        copied = [
+            a for a in AssignmentRepository(db_session).get_instructor_assignments(sample_instructor.id)
+            if a.session_day_id in {d.id for d in copies}
+        ]
+        # The cancelled assignment is left behind
+        assert sorted(a.session_day_id for a in copied) == [copies[0].id, copies[2].id]
+        assert all(a.assignment_status == AssignmentStatus.ASSIGNED for a in copied)
+        # The source session is untouched
+        assert [d.date for d in CourseSessionDayRepository(db_session).get_by_session_id(session.id)] == [
+            date(2024, 9, 2), date(2024, 9, 3), date(2024, 9, 4)
+        ]
+
+    def test_assignments_are_optional(self, db_session, staffed_session, sample_instructor):
+        session, _, _ = staffed_session
+        clone = clone_session(db_session, session.id, 7)
+
+        assert clone.session_name == session.session_name
+        assert len(CourseSessionDayRepository(db_session).get_by_session_id(clone.id)) == 3
+        assert len(AssignmentRepository(db_session).get_instructor_assignments(sample_instructor.id)) == 3
+
+    def test_clash_with_source_session(self, db_session, staffed_session, sample_location):
+        session, days, _ = staffed_session
+
+        with pytest.raises(RescheduleConflictError) as exc_info:
+            clone_session(db_session, session.id, 1, include_assignments=True)
+
+        assert len(exc_info.value.problems) == 4
+        assert exc_info.value.problems[0] == (
+            f"Session day {days[0].id} would overlap session day {days[1].id} at location {sample_location.id}"
+        )
+        assert len(SessionRepository(db_session).get_all()) == 1
+
+class TestCancelledSession:
+    def test_moves_over_booked_days(self, db_session, sample_course, sample_location,
+                                    staffed_session, sample_instructor):
+        session, days, _ = staffed_session
+        SessionRepository(db_session).update_status(session.id, SessionStatus.CANCELLED)
+        book_elsewhere(db_session, sample_course, sample_location, date(2024, 9, 9), sample_instructor)
+
+        moved = reschedule_session(db_session, session.id, 7)
+
+        assert (moved.start_date, moved.end_date) == (date(2024, 9, 9), date(2024, 9, 11))
+        assert CourseSessionDayRepository(db_session).get_by_id(days[0].id).date == date(2024, 9, 9)
+
+    def test_copies_onto_free_days_only(self, db_session, sample_course, sample_location,
+                                        staffed_session, sample_instructor):
+        session, days, _ = staffed_session
+        SessionRepository(db_session).update_status(session.id, SessionStatus.CANCELLED)
+
+        # Its own days are free, so the scheduled copy may take them
+        clone = clone_session(db_session, session.id, 0, include_assignments=True)
+        assert clone.status == SessionStatus.SCHEDULED
+
+        in_room = book_elsewhere(db_session, sample_course, sample_location, date(2024, 9, 9))
+        with pytest.raises(RescheduleConflictError) as exc_info:
+            clone_session(db_session, session.id, 7)
+        assert exc_info.value.problems == [
+            f"Session day {days[0].id} would overlap session day {in_room.id} at location {sample_location.id}"
+        ]
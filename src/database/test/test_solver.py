@@ -0,0 +1,186 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from datetime import date, time
+from src.database.solver import (
+    ProposedAssignment, PlanConflictError, _Solver, propose_schedule, commit_plan
+)
+from src.database.repository import (
+    InstructorRepository, RatingRepository, SessionRepository,
+    CourseSessionDayRepository, AssignmentRepository, LocationRepository
+)
+from src.database.models import AssignmentStatus, RatingType, SessionStatus, SessionType
+
+@pytest.fixture
+def cleared_instructors(db_session, sample_course):
+    """Three instructors cleared for the sample course."""
+    instructor_repo = InstructorRepository(db_session)
+    rating_repo = RatingRepository(db_session)
+    instructors = [
+        instructor_repo.create(name, "Instructor", f"{name.lower()}@test.com")
+        for name in ("Ann", "Ben", "Cal")
+    ]
+    for instructor in instructors:
+        rating_repo.create_or_update_rating(instructor.id, sample_course.id, RatingType.CLEARED)
+    return instructors
+
+def create_days(db_session, course, slots):
+    """Create one session with a day per (date, start, end) slot, each in its own room."""
+    session = SessionRepository(db_session).create_session(
+        course.id, "Term", slots[0][0], slots[-1][0]
+    )
+    day_repo = CourseSessionDayRepository(db_session)
+    return [
+        day_repo.create(
+            session.id, n, day, LocationRepository(db_session).create(f"Room {n}").id,
+            start, end, SessionType.HALF_DAY
+        )
+        for n, (day, start, end) in enumerate(slots, start=1)
+    ]
+
+class TestSolver:
+    def test_moves_capacity_along_augmenting_path(self):
+        # Only instructor 0 may take slot 0; either may take slot 1
+        solver = _Solver(eligible=[0b01, 0b11], overlaps=[[], []], load=[0, 0], max_load=1)
+        solver._place(1)
+        assert solver.assignment == [None, 0]
+        # Instructor 0 is at the limit, so slot 1 has to move to instructor 1
+        assert solver._augment(0)
+        assert solver.assignment == [0, 1]
+
+    def test_moves_overlapping_slot(self):
+        solver = _Solver(eligible=[0b11, 0b01], overlaps=[[1], [0]], load=[0, 0], max_load=10)
+        solver._place(0)
+        assert solver.assignment == [0, None]
+
+        assert solver._augment(1)
+        assert solver.assignment == [1, 0]
+
+    def test_solve_large_schedule(self):
+        # A quarter of 40 parallel slots a day, each with a few cleared instructors
+        slots, instructors = 90 * 40, 300
+        eligible = [sum(1 << ((k * 7 + j * 31) % instructors) for j in range(4)) for k in range(slots)]
+        overlaps = [[o for o in range(k - k % 40, k - k % 40 + 40) if o != k] for k in range(slots)]
+        assignment = _Solver(eligible, overlaps, [0] * instructors, max_load=20).solve()
+
+        assert None not in assignment
+        assert max(assignment.count(i) for i in range(instructors)) <= 20
+        for k, i in enumerate(assignment):
+            assert eligible[k] >> i & 1
+            assert all(assignment[o] != i for o in overlaps[k])
+
+class TestProposeSchedule:
+    def test_respects_overlaps_bookings_and_clearance(self, db_session, sample_course, cleared_instructors):
+        ann, ben, cal = cleared_instructors
+        morning, overlapping, next_day = create_days(db_session, sample_course, [
+            (date(2024, 9, 2), time(9, 0), time(12, 0)),
+            (date(2024, 9, 2), time(11, 0), time(15, 0)),
+            (date(2024, 9, 3), time(9, 0), time(12, 0)),
+        ])
+        # Ben is already booked at the same time elsewhere
+        booked_day, = create_days(db_session, sample_course, [
+            (date(2024, 9, 3), time(10, 0), time(11, 0))
+        ])
+        AssignmentRepository(db_session).create_assignment(booked_day.id, ben.id, SessionType.HALF_DAY)
+        RatingRepository(db_session).create_or_update_rating(cal.id, sample_course.id, RatingType.CO_TEACH)
+
+        plan = propose_schedule(db_session, date(2024, 9, 1), date(2024, 9, 30))
+
+        proposed = dict(plan.assignments)
+        assert set(proposed) == {morning.id, overlapping.id, next_day.id}
+        assert plan.unfilled == []
+        assert proposed[morning.id] != proposed[overlapping.id]
+        assert proposed[next_day.id] == ann.id
+        assert cal.id not in proposed.values()
+
+    def test_load_limit_leaves_days_unfilled(self, db_session, sample_course, sample_instructor):
+        RatingRepository(db_session).create_or_update_rating(
+            sample_instructor.id, sample_course.id, RatingType.CLEARED
+        )
+        days = create_days(db_session, sample_course, [
+            (date(2024, 9, d), time(9, 0), time(12, 0)) for d in (2, 3, 4)
+        ])
+
+        plan = propose_schedule(db_session, date(2024, 9, 1), date(2024, 9, 30), max_load=2)
+
+        assert [a.session_day_id for a in plan.assignments] == [days[0].id, days[1].id]
+        assert plan.unfilled == [days[2].id]
+
+    def test_skips_cancelled_sessions(self, db_session, sample_course, cleared_instructors):
+        day, = create_days(db_session, sample_course, [
+            (date(2024, 9, 2), time(9, 0), time(12, 0))
+        ])
+        SessionRepository(db_session).update_status(day.session_id, SessionStatus.CANCELLED)
+
+        assert propose_schedule(db_session, date(2024, 9, 1), date(2024, 9, 30)) == ([], [])
+
+    def test_cancelled_assignments_hold_nothing(self, db_session, sample_course, sample_instructor):
+        RatingRepository(db_session).create_or_update_rating(
+            sample_instructor.id, sample_course.id, RatingType.CLEARED
+        )
+        withdrawn, open_day = create_days(db_session, sample_course, [
+            (date(2024, 9, 2), time(9, 0), time(12, 0)),
+            (date(2024, 9, 3), time(9, 0), time(12, 0)),
+        ])
+        assignment_repo = AssignmentRepository(db_session)
+        cancelled = assignment_repo.create_assignment(withdrawn.id, sample_instructor.id, SessionType.HALF_DAY)
+        assignment_repo.update_status(cancelled.id, AssignmentStatus.CANCELLED)
+        # Also staffed at the same time as the open day, but in a cancelled session
+        called_off, = create_days(db_session, sample_course, [
+            (date(2024, 9, 3), time(10, 0), time(11, 0))
+        ])
+        assignment_repo.create_assignment(called_off.id, sample_instructor.id, SessionType.HALF_DAY)
+        SessionRepository(db_session).update_status(called_off.session_id, SessionStatus.CANCELLED)
+
+        plan = propose_schedule(db_session, date(2024, 9, 1), date(2024, 9, 30), max_load=2)
+
+        assert plan == ([
+            ProposedAssignment(withdrawn.id, sample_instructor.id),
+            ProposedAssignment(open_day.id, sample_instructor.id),
+        ], [])
+        assert len(commit_plan(db_session, plan.assignments)) == 2
+
+class TestCommitPlan:
+    def test_commit_creates_assignments(self, db_session, sample_course, cleared_instructors):
+        create_days(db_session, sample_course, [
+            (date(2024, 9, d), time(9, 0), time(12, 0)) for d in (2, 3)
+        ])
+        plan = propose_schedule(db_session, date(2024, 9, 1), date(2024, 9, 30))
+
+        created = commit_plan(db_session, plan.assignments)
+
+        assert [(a.session_day_id, a.instructor_id) for a in created] == plan.assignments
+        assert all(a.assignment_type == SessionType.HALF_DAY for a in created)
+        assert propose_schedule(db_session, date(2024, 9, 1), date(2024, 9, 30)) == ([], [])
+
+    def test_commit_rejects_stale_plan(self, db_session, sample_course, cleared_instructors):
+        ann, ben, _ = cleared_instructors
+        first, overlapping = create_days(db_session, sample_course, [
+            (date(2024, 9, 2), time(9, 0), time(12, 0)),
+            (date(2024, 9, 2), time(11, 0), time(15, 0)),
+        ])
+        uncleared = InstructorRepository(db_session).create("Una", "Cleared", "una@test.com")
+        other, = create_days(db_session, sample_course, [
+            (date(2024, 9, 3), time(9, 0), time(12, 0))
+        ])
+        AssignmentRepository(db_session).create_assignment(other.id, ben.id, SessionType.HALF_DAY)
+
+        with pytest.raises(PlanConflictError) as exc_info:
+            commit_plan(db_session, [
+                ProposedAssignment(first.id, ann.id),
+                ProposedAssignment(overlapping.id, ann.id),
+                ProposedAssignment(other.id, ann.id),
+                ProposedAssignment(99999, ann.id),
+            ])
+        assert exc_info.value.problems == [
+            f"Session day {other.id} is already staffed",
+            "Session day 99999 not found",
+            f"Instructor {ann.id} would be double-booked on session days {first.id} and {overlapping.id}",
+        ]
+
+        with pytest.raises(PlanConflictError, match="not cleared"):
+            commit_plan(db_session, [ProposedAssignment(first.id, uncleared.id)])
+        # Nothing was written
+        assert AssignmentRepository(db_session).get_instructor_assignments(ann.id) == []
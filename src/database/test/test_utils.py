@@ -9,7 +9,7 @@ from src.database.utils import (
     get_instructor_conflicts, calculate_pay_eligibility,
     get_instructor_full_name, get_session_duration_hours,
     format_session_time_range, validate_session_dates,
-    validate_session_times, get_upcoming_assignments,
+    validate_session_times, recurring_dates, get_upcoming_assignments,
     get_instructor_stats
 )
 from src.database.models import (
@@ -219,6 +219,17 @@ class TestValidationUtils:
         # Invalid - same time
         assert validate_session_times(time(12, 0), time(12, 0)) == False
 
+    def test_recurring_dates(self):
+        # 2024-09-02 is a Monday
+        weekdays = recurring_dates(date(2024, 9, 2), date(2024, 9, 15), [0, 1, 2, 3, 4])
+        assert len(weekdays) == 10
+        assert all(d.weekday() < 5 for d in weekdays)
+        
+        assert recurring_dates(date(2024, 9, 2), date(2024, 9, 30), [1, 3], limit=3) == [
+            date(2024, 9, 3), date(2024, 9, 5), date(2024, 9, 10)
+        ]
+        assert recurring_dates(date(2024, 9, 7), date(2024, 9, 8), [0]) == []
+
 class TestReportingUtils:
     def test_get_upcoming_assignments(self, db_session, sample_instructor, sample_course, sample_location):
         # Create future assignment with a date relative to today
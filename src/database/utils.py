@@ -1,52 +1,28 @@
-from typing import Optional
-from datetime import date, datetime, time
+from typing import Iterable, Optional
+from datetime import date, datetime, time, timedelta
 from sqlalchemy.orm import Session
 from .models import (
     Instructor, Course, InstructorCourseRating, CourseSessionDay, 
     InstructorAssignment, RatingType
 )
-from .repository import RatingRepository
+from .conflicts import find_instructor_conflicts
+from .clearance import get_clearance_matrix
 
 def is_instructor_cleared_for_course(db: Session, instructor_id: int, course_id: int) -> bool:
-    """Check if an instructor is cleared for a specific course."""
-    rating_repo = RatingRepository(db)
-    rating = rating_repo.get_rating(instructor_id, course_id)
-    return rating is not None and rating.rating == RatingType.CLEARED
+    """Check if an instructor is cleared for a specific course, using the clearance matrix."""
+    return get_clearance_matrix(db).is_cleared(instructor_id, course_id)
 
 def check_instructor_availability(db: Session, instructor_id: int, 
                                 check_date: date, start_time: time, 
                                 end_time: time) -> bool:
     """Check if an instructor is available on a specific date and time."""
-    existing_assignments = db.query(InstructorAssignment).join(CourseSessionDay).filter(
-        InstructorAssignment.instructor_id == instructor_id,
-        CourseSessionDay.date == check_date
-    ).all()
-    
-    for assignment in existing_assignments:
-        session_day = assignment.session_day
-        # Check for time overlap
-        if (start_time < session_day.end_time and end_time > session_day.start_time):
-            return False
-    
-    return True
+    return find_instructor_conflicts(db, instructor_id, check_date, start_time, end_time).available
 
 def get_instructor_conflicts(db: Session, instructor_id: int, 
                            check_date: date, start_time: time, 
                            end_time: time) -> list[InstructorAssignment]:
     """Get all conflicting assignments for an instructor on a specific date and time."""
-    existing_assignments = db.query(InstructorAssignment).join(CourseSessionDay).filter(
-        InstructorAssignment.instructor_id == instructor_id,
-        CourseSessionDay.date == check_date
-    ).all()
-    
-    conflicts = []
-    for assignment in existing_assignments:
-        session_day = assignment.session_day
-        # Check for time overlap
-        if (start_time < session_day.end_time and end_time > session_day.start_time):
-            conflicts.append(assignment)
-    
-    return conflicts
+    return find_instructor_conflicts(db, instructor_id, check_date, start_time, end_time).conflicts
 
 def calculate_pay_eligibility(db: Session, instructor_id: int, course_id: int) -> bool:
     """Calculate if an instructor assignment should be pay eligible."""
@@ -79,6 +55,21 @@ def validate_session_times(start_time: time, end_time: time) -> bool:
     """Validate that session times are logical."""
     return start_time < end_time
 
+def recurring_dates(start_date: date, end_date: date, weekdays: Iterable[int],
+                    limit: Optional[int] = None) -> list[date]:
+    """Dates from start_date to end_date inclusive falling on the given weekdays (Monday is 0).
+
+    Stops after limit dates when one is given.
+    """
+    weekdays = set(weekdays)
+    dates = []
+    day = start_date
+    while day <= end_date and (limit is None or len(dates) < limit):
+        if day.weekday() in weekdays:
+            dates.append(day)
+        day += timedelta(days=1)
+    return dates
+
 def soft_delete_instructor(db: Session, instructor_id: int) -> Optional[Instructor]:
     """Soft delete an instructor by setting active_status to False."""
     instructor = db.query(Instructor).filter(Instructor.id == instructor_id).first()